@@ -0,0 +1,7 @@
+"""
+Bundle size tier package for Panacea Locust Load Testing
+"""
+
+from .bundle_tier_tracker import BundleTierTracker, bundle_tier_tracker, setup_bundle_tier_event_handlers
+
+__all__ = ["BundleTierTracker", "bundle_tier_tracker", "setup_bundle_tier_event_handlers"]
@@ -0,0 +1,114 @@
+"""
+Bundle Tier Tracker for Panacea Locust Load Testing
+
+This module keeps per-endpoint latency histograms for every bundle size tier
+(small / medium / huge bundles by row count), so the way each log viewer
+endpoint scales with bundle size shows up in the test summary and huge-bundle
+tail latency does not hide behind small bundles.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from locust import events
+
+from config import config
+from event_handlers import test_metrics
+from metrics import HTTP_METHODS, LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class BundleTierTracker:
+    """
+    Collects per-tier latency histograms of requests sent with a `bundle_tier` context.
+    """
+
+    def __init__(self, tiers: Dict[str, int]):
+        """
+        Args:
+            tiers: Ordered mapping of tier name to its lower bound (rows)
+        """
+        self.tiers = dict(tiers)
+        # tier -> request name -> histogram
+        self.results: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    def record(self, tier: str, name: str, response_time: float, failed: bool):
+        histograms = self.results.setdefault(tier, {})
+        histograms.setdefault(name, LatencyHistogram()).record(response_time, failed)
+
+    def reset(self):
+        self.results = {}
+
+    def export_results(self) -> Dict[str, Any]:
+        """Serialize and reset the collected results (for worker -> master reports)."""
+        exported = {
+            tier: {name: histogram.to_dict() for name, histogram in histograms.items()}
+            for tier, histograms in self.results.items()
+        }
+        self.reset()
+        return exported
+
+    def import_results(self, data: Dict[str, Any]):
+        """Merge results exported by a worker."""
+        for tier, histograms in data.items():
+            merged = self.results.setdefault(tier, {})
+            for name, histogram in histograms.items():
+                merged.setdefault(name, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+
+    def _get_tier_order(self, tier: str) -> int:
+        tiers: List[str] = list(self.tiers)
+        return tiers.index(tier) if tier in tiers else len(tiers)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the latency of every request name per bundle size tier, smallest tier first."""
+        by_endpoint = {}
+        for tier in sorted(self.results, key=self._get_tier_order):
+            for name, histogram in self.results[tier].items():
+                by_endpoint.setdefault(name, []).append(
+                    {"tier": tier, "min_rows": self.tiers.get(tier), **histogram.get_summary()}
+                )
+        return {
+            "tiers": self.tiers,
+            "tier_weights": config.BUNDLE_TIER_WEIGHTS,
+            "by_endpoint": by_endpoint,
+        }
+
+
+# Global bundle tier tracker instance
+bundle_tier_tracker = BundleTierTracker(config.BUNDLE_SIZE_TIERS)
+
+
+def on_test_start(environment, **kwargs):
+    bundle_tier_tracker.reset()
+
+
+def on_request(request_type, name, response_time, response_length, context=None, exception=None, **kwargs):
+    if context and "bundle_tier" in context:
+        # custom metrics (e.g. direct ClickHouse queries) get their own rows next to the endpoint's
+        key = name if request_type in HTTP_METHODS else f"{request_type} {name}"
+        bundle_tier_tracker.record(context["bundle_tier"], key, response_time, exception is not None)
+
+
+def on_report_to_master(client_id, data, **kwargs):
+    data["bundle_tier_results"] = bundle_tier_tracker.export_results()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    if "bundle_tier_results" in data:
+        bundle_tier_tracker.import_results(data["bundle_tier_results"])
+
+
+def setup_bundle_tier_event_handlers():
+    """
+    Register the bundle tier event handlers with Locust and add the
+    per-tier latency to the test summary.
+    """
+    events.test_start.add_listener(on_test_start)
+    events.request.add_listener(on_request)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("bundle_tiers", bundle_tier_tracker.get_summary)
+
+    logger.info("🔧 Bundle tier event handlers registered successfully")
@@ -0,0 +1,151 @@
+"""
+Direct ClickHouse User for Panacea Locust Load Testing
+
+This module contains a user that runs the log viewer query shapes (filtered
+scans, severity counts, histogram buckets) straight against ClickHouse with
+the same bundles, time windows and filters the API users send. Its requests
+are reported as request type CLICKHOUSE under the API endpoint's name, so the
+API overhead per endpoint shows up next to the database time.
+"""
+
+import logging
+import time
+from typing import Any, Dict
+
+from locust import User, between, constant_throughput, task
+from locust.runners import WorkerRunner
+
+from config import config
+from database.clickhouse_dao import ClickHouseDAO
+from database.log_queries import LogQueryBuilder
+from event_handlers import test_metrics
+from metrics import HTTP_METHODS, LatencyHistogram, normalize_request_name
+from payloads.api_payloads.log_viewer.histogram import LogsHistogramAPI
+from payloads.api_payloads.log_viewer.search import LogsSearchAPI
+from payloads.api_payloads.log_viewer.severity_count import LogsSeverityCountAPI
+from payloads.rng_streams import RngStreams
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CLICKHOUSE_REQUEST_TYPE = "CLICKHOUSE"
+
+# One pool for all direct users of a worker; no retries, failures are measured
+clickhouse_load_dao = ClickHouseDAO(pool_size=config.CLICKHOUSE_LOAD_POOL_SIZE, max_retries=0)
+
+
+class ClickHouseDirectUser(User):
+    """
+    Virtual user sending the log viewer queries directly to ClickHouse.
+
+    Task weights follow the matching API tasks in `Config.TASK_WEIGHTS`.
+    """
+
+    if config.USER_TARGET_RPS > 0:
+        wait_time = constant_throughput(config.USER_TARGET_RPS)
+    else:
+        wait_time = between(config.STANDARD_USER_WAIT_MIN, config.STANDARD_USER_WAIT_MAX)
+    weight = config.CLICKHOUSE_USER_WEIGHT
+
+    query_builder = LogQueryBuilder()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rng_streams = RngStreams.for_user(self)
+
+    def run_query(self, api, query: str, params: Dict[str, Any]):
+        """
+        Run a query and report it as a CLICKHOUSE request named after the API endpoint.
+
+        Args:
+            api: Log viewer API the query mirrors
+            query: SQL query
+            params: Query parameters
+        """
+        name = api.get_api_endpoint()
+        start_time = time.perf_counter()
+        exception = None
+        rows = 0
+        try:
+            result = clickhouse_load_dao.execute(
+                query,
+                params,
+                use_cache=False,
+                # lets query_log entries be tied back to the endpoint
+                settings={"log_comment": f"locust:{normalize_request_name(name)}"},
+            )
+            rows = len(result)
+        except Exception as e:
+            exception = e
+        self.environment.events.request.fire(
+            request_type=CLICKHOUSE_REQUEST_TYPE,
+            name=name,
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=rows,
+            exception=exception,
+            context=api.get_request_context(),
+        )
+
+    @task(config.TASK_WEIGHTS["logs-search"])
+    def test_logs_search_query(self):
+        api = LogsSearchAPI(rng=self.rng_streams.get("logs-search"))
+        query, params = self.query_builder.build_search(api.generate_payload())
+        self.run_query(api, query, params)
+
+    @task(config.TASK_WEIGHTS["logs-histogram"])
+    def test_logs_histogram_query(self):
+        api = LogsHistogramAPI(rng=self.rng_streams.get("logs-histogram"))
+        query, params = self.query_builder.build_histogram(api.generate_payload())
+        self.run_query(api, query, params)
+
+    @task(config.TASK_WEIGHTS["logs-severity-count"])
+    def test_logs_severity_count_query(self):
+        api = LogsSeverityCountAPI(rng=self.rng_streams.get("logs-severity-count"))
+        query, params = self.query_builder.build_severity_count(api.generate_payload())
+        self.run_query(api, query, params)
+
+
+def get_api_overhead_summary() -> Dict[str, Any]:
+    """
+    Compare API and direct ClickHouse latency per endpoint.
+
+    Returns:
+        Dictionary mapping endpoint path to API / ClickHouse latency summaries
+        and the API overhead (API minus ClickHouse) per statistic
+    """
+    environment = test_metrics.environment
+    if environment is None or isinstance(environment.runner, WorkerRunner):
+        return {}
+
+    api_histograms = {}
+    clickhouse_histograms = {}
+    for (name, method), entry in environment.stats.entries.items():
+        if method in HTTP_METHODS:
+            histograms = api_histograms
+        elif method == CLICKHOUSE_REQUEST_TYPE:
+            histograms = clickhouse_histograms
+        else:
+            continue
+        histogram = histograms.setdefault(normalize_request_name(name), LatencyHistogram())
+        histogram.merge(LatencyHistogram.from_stats_entry(entry))
+
+    summary = {}
+    for path, clickhouse_histogram in clickhouse_histograms.items():
+        clickhouse = clickhouse_histogram.get_summary()
+        endpoint_summary = {"clickhouse": clickhouse}
+        if path in api_histograms:
+            api = api_histograms[path].get_summary()
+            endpoint_summary["api"] = api
+            endpoint_summary["api_overhead_ms"] = {
+                statistic: round(api[statistic] - clickhouse[statistic], 2)
+                for statistic in ("avg_ms", "p50_ms", "p95_ms", "p99_ms")
+            }
+        summary[path] = endpoint_summary
+    return summary
+
+
+def setup_clickhouse_user_event_handlers():
+    """Add the API overhead comparison to the test summary."""
+    test_metrics.register_summary_section("api_overhead", get_api_overhead_summary)
+
+    logger.info("🔧 ClickHouse user event handlers registered successfully")
@@ -5,6 +5,7 @@ This module contains all configuration settings for the load testing framework.
 Settings can be overridden via environment variables.
 """
 
+import json
 import os
 
 # Try to load .env file if available
@@ -17,6 +18,33 @@ except ImportError:
     pass
 
 
+def _get_list_env(name: str, default: str, cast=str) -> list:
+    """Read a comma separated environment variable into a list of `cast` values."""
+    return [cast(item.strip()) for item in os.getenv(name, default).split(",") if item.strip()]
+
+
+def _get_mapping_env(name: str, default: str, cast=str) -> dict:
+    """Read a comma separated `key:value` environment variable into an ordered dict of `cast` values."""
+    mapping = {}
+    for item in _get_list_env(name, default):
+        key, _, value = item.partition(":")
+        mapping[key.strip()] = cast(value.strip())
+    return mapping
+
+
+def _to_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _load_json_file_env(name: str, default):
+    """Load a JSON file named by an environment variable, or return `default` when unset."""
+    path = os.getenv(name)
+    if not path:
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+
 class Config:
     """Configuration class for Panacea Locust load testing."""
 
@@ -34,12 +62,77 @@ class Config:
     SESSION_ID_LENGTH = int(os.getenv("SESSION_ID_LENGTH", "32"))
     SESSION_HEADER_NAME = "X-Session-Id"
 
+    # Session Churn Configuration
+    # "sticky" keeps one session per user for its whole life. "per_request",
+    # "per_n_requests" (every SESSION_CHURN_REQUESTS requests) and "per_journey"
+    # rotate the X-Session-Id through a pool of SESSION_POOL_SIZE dataset
+    # sessions (0 = all). Requests are reported as cold / warm session by
+    # modelling the API's session cache as an LRU of SESSION_CACHE_SIZE
+    # sessions (0 = unlimited) with a SESSION_WARM_TTL_SECONDS TTL.
+    SESSION_CHURN_POLICY = os.getenv("SESSION_CHURN_POLICY", "sticky").lower()
+    SESSION_CHURN_REQUESTS = int(os.getenv("SESSION_CHURN_REQUESTS", "10"))
+    SESSION_POOL_SIZE = int(os.getenv("SESSION_POOL_SIZE", "0"))
+    SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "0"))
+    SESSION_WARM_TTL_SECONDS = float(os.getenv("SESSION_WARM_TTL_SECONDS", "300"))
+
     # ClickHouse Configuration
     CLICKHOUSE_HOST = os.getenv("CLICKHOUSE_HOST", "localhost")
     CLICKHOUSE_PORT = int(os.getenv("CLICKHOUSE_PORT", "9000"))
     CLICKHOUSE_DATABASE = os.getenv("CLICKHOUSE_DATABASE", "panacea")
     CLICKHOUSE_USER = os.getenv("CLICKHOUSE_USER", "panacea")
     CLICKHOUSE_PASSWORD = os.getenv("CLICKHOUSE_PASSWORD", "panacea")
+    CLICKHOUSE_POOL_SIZE = int(os.getenv("CLICKHOUSE_POOL_SIZE", "4"))
+    CLICKHOUSE_MAX_RETRIES = int(os.getenv("CLICKHOUSE_MAX_RETRIES", "3"))
+    # base delay of the exponential (full jitter) retry backoff
+    CLICKHOUSE_RETRY_BACKOFF_SECONDS = float(os.getenv("CLICKHOUSE_RETRY_BACKOFF_SECONDS", "0.5"))
+
+    # Direct ClickHouse Load User (runs the log viewer queries next to the API users)
+    CLICKHOUSE_LOAD_USER = _to_bool(os.getenv("CLICKHOUSE_LOAD_USER", "false"))
+    CLICKHOUSE_USER_WEIGHT = int(os.getenv("CLICKHOUSE_USER_WEIGHT", "1"))
+    CLICKHOUSE_LOAD_POOL_SIZE = int(os.getenv("CLICKHOUSE_LOAD_POOL_SIZE", "50"))
+
+    # Ingestion User Configuration (write path, runs next to the read users)
+    # INGESTION_USERS users (0 = none) submit the log bundles found in
+    # INGESTION_FIXTURE_DIR to the analyze endpoint and poll logs info until
+    # the bundle is queryable. Bundles are classed by file size (last class
+    # whose lower bound in bytes they reach) and sampled by INGESTION_SIZE_WEIGHTS.
+    # INGESTION_REMOTE_PATH_PREFIX is where the server reads the fixture
+    # directory from (default: the local absolute paths).
+    INGESTION_USERS = int(os.getenv("INGESTION_USERS", "0"))
+    INGESTION_WAIT_MIN = float(os.getenv("INGESTION_WAIT_MIN", "5.0"))
+    INGESTION_WAIT_MAX = float(os.getenv("INGESTION_WAIT_MAX", "15.0"))
+    INGESTION_FIXTURE_DIR = os.getenv("INGESTION_FIXTURE_DIR", "")
+    INGESTION_FIXTURE_PATTERNS = _get_list_env("INGESTION_FIXTURE_PATTERNS", "*.zip,*.tar.gz,*.tgz")
+    INGESTION_REMOTE_PATH_PREFIX = os.getenv("INGESTION_REMOTE_PATH_PREFIX", "")
+    INGESTION_BUNDLE_SIZE_CLASSES = _get_mapping_env(
+        "INGESTION_BUNDLE_SIZE_CLASSES", "small:0,medium:104857600,large:1073741824", int
+    )
+    INGESTION_SIZE_WEIGHTS = _get_mapping_env("INGESTION_SIZE_WEIGHTS", "small:1,medium:1,large:1", float)
+    INGESTION_POLL_INTERVAL_SECONDS = float(os.getenv("INGESTION_POLL_INTERVAL_SECONDS", "2.0"))
+    INGESTION_QUERYABLE_TIMEOUT_SECONDS = float(os.getenv("INGESTION_QUERYABLE_TIMEOUT_SECONDS", "900"))
+    # analyze response field holding the new bundle id (top level or under "data")
+    INGESTION_BUNDLE_ID_FIELD = os.getenv("INGESTION_BUNDLE_ID_FIELD", "bundle_id")
+    # logs info status field; a bundle without one is queryable once logs info succeeds
+    INGESTION_STATUS_FIELD = os.getenv("INGESTION_STATUS_FIELD", "status")
+    INGESTION_READY_STATUSES = _get_list_env("INGESTION_READY_STATUSES", "completed,success,ready", str.lower)
+    INGESTION_FAILED_STATUSES = _get_list_env("INGESTION_FAILED_STATUSES", "failed,error", str.lower)
+
+    # ClickHouse Query Result Cache (on disk, shared by runs using the same directory)
+    CLICKHOUSE_QUERY_CACHE = _to_bool(os.getenv("CLICKHOUSE_QUERY_CACHE", "true"))
+    CLICKHOUSE_QUERY_CACHE_DIR = os.getenv("CLICKHOUSE_QUERY_CACHE_DIR", ".cache/clickhouse")
+    CLICKHOUSE_QUERY_CACHE_TTL_SECONDS = float(os.getenv("CLICKHOUSE_QUERY_CACHE_TTL_SECONDS", "86400"))
+    CLICKHOUSE_QUERY_CACHE_MAX_BYTES = int(os.getenv("CLICKHOUSE_QUERY_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+    # Synthetic Seed Data Configuration (python -m database.seed_data)
+    SEED_LOG_ROWS = int(os.getenv("SEED_LOG_ROWS", "10000000"))
+    SEED_BUNDLES = int(os.getenv("SEED_BUNDLES", "1000"))
+    SEED_USERS = int(os.getenv("SEED_USERS", "200"))
+    SEED_COMBOS = int(os.getenv("SEED_COMBOS", "200"))
+    SEED_DAYS = int(os.getenv("SEED_DAYS", "90"))
+    SEED_BATCH_ROWS = int(os.getenv("SEED_BATCH_ROWS", "1000000"))
+    # Pareto shape of the bundle row counts (smaller = a few much larger bundles)
+    SEED_BUNDLE_SIZE_ALPHA = float(os.getenv("SEED_BUNDLE_SIZE_ALPHA", "1.1"))
+    SEED_RANDOM_SEED = int(os.getenv("SEED_RANDOM_SEED", "42"))
 
     # Database Integration Settings
     USE_DATABASE_DATA = os.getenv("USE_DATABASE_DATA", "false").lower() == "true"
@@ -50,12 +143,126 @@ class Config:
 
     # Request Configuration
     REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "30.0"))
+    CONNECT_TIMEOUT = float(os.getenv("CONNECT_TIMEOUT", "5.0"))
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 
+    # Connection Policy Configuration ("per_user", "shared" or "new_per_request")
+    # per_user: each user keeps its own pool of up to USER_POOL_MAXSIZE connections per host
+    # shared: all users of a worker share one pool of up to SHARED_POOL_MAXSIZE connections per host
+    # new_per_request: keep-alive disabled, every request opens a new connection
+    # With CONNECTION_POOL_BLOCK requests wait for a free connection instead of
+    # opening connections beyond the cap. Connection establishment time is
+    # reported as request type CONNECT.
+    CONNECTION_POLICY = os.getenv("CONNECTION_POLICY", "per_user")
+    USER_POOL_MAXSIZE = int(os.getenv("USER_POOL_MAXSIZE", "1"))
+    SHARED_POOL_MAXSIZE = int(os.getenv("SHARED_POOL_MAXSIZE", "100"))
+    CONNECTION_POOL_BLOCK = _to_bool(os.getenv("CONNECTION_POOL_BLOCK", "true"))
+
+    # Response Validation Configuration
+    # Fraction of responses per endpoint checked for api_status != "success" and
+    # empty bodies; per request path overrides go in RESPONSE_VALIDATION_SAMPLE_RATES.
+    RESPONSE_VALIDATION_SAMPLE_RATE = float(os.getenv("RESPONSE_VALIDATION_SAMPLE_RATE", "0.05"))
+    RESPONSE_VALIDATION_SAMPLE_RATES = _load_json_file_env("RESPONSE_VALIDATION_SAMPLE_RATES_FILE", {})
+    # api_status is looked for in this many leading bytes before scanning the whole body
+    RESPONSE_VALIDATION_PREFIX_BYTES = int(os.getenv("RESPONSE_VALIDATION_PREFIX_BYTES", "512"))
+
+    # Response Streaming Configuration
+    # In stream mode response bodies are read in chunks and discarded instead of
+    # being buffered; time-to-first-byte (request type TTFB) and body transfer
+    # time (request type TRANSFER) are reported as separate metrics per endpoint.
+    # RESPONSE_STREAM_ENDPOINTS limits streaming to these request paths (empty = all).
+    RESPONSE_STREAM_MODE = _to_bool(os.getenv("RESPONSE_STREAM_MODE", "false"))
+    RESPONSE_STREAM_CHUNK_BYTES = int(os.getenv("RESPONSE_STREAM_CHUNK_BYTES", "65536"))
+    RESPONSE_STREAM_ENDPOINTS = _get_list_env("RESPONSE_STREAM_ENDPOINTS", "")
+
+    # LLM Token Streaming Configuration (opt-in)
+    # Requests to these endpoints ask for SSE / NDJSON streams; time-to-first-token
+    # (request type TTFT), the mean inter-chunk gap per response (ITL) and output
+    # chunks (OUTPUT) are reported per endpoint. Non-streamed responses keep
+    # whole-response timing.
+    LLM_STREAMING = _to_bool(os.getenv("LLM_STREAMING", "false"))
+    LLM_STREAMING_ENDPOINTS = _get_list_env(
+        "LLM_STREAMING_ENDPOINTS", "/api/v1/insights/ai/ask-ai,/api/v1/insights/ai/report_summary"
+    )
+
+    # Ask-AI Conversation Configuration
+    # In conversation mode each user keeps a growing Ask-AI message history and
+    # latency is reported by turn number and by prompt size (characters).
+    ASK_AI_CONVERSATION_MODE = _to_bool(os.getenv("ASK_AI_CONVERSATION_MODE", "false"))
+    ASK_AI_MAX_TURNS = int(os.getenv("ASK_AI_MAX_TURNS", "10"))
+    ASK_AI_MAX_PROMPT_CHARS = int(os.getenv("ASK_AI_MAX_PROMPT_CHARS", "32000"))
+    # append the AI's replies to the history (false = append sampled messages instead)
+    ASK_AI_CONVERSATION_REPLAY_REPLIES = _to_bool(os.getenv("ASK_AI_CONVERSATION_REPLAY_REPLIES", "true"))
+    ASK_AI_REPLY_MAX_CHARS = int(os.getenv("ASK_AI_REPLY_MAX_CHARS", "4000"))
+    ASK_AI_PROMPT_SIZE_BUCKETS = _get_list_env(
+        "ASK_AI_PROMPT_SIZE_BUCKETS", "500,1000,2000,4000,8000,16000,32000", cast=int
+    )
+
+    # Memory Profiling Configuration (opt-in, adds tracemalloc overhead)
+    # Every worker snapshots its traced memory at test start, spawning complete,
+    # every MEMORY_PROFILE_SITES_INTERVAL_SECONDS and at test stop, reports bytes
+    # per user and the top allocation sites, and samples its RSS (psutil) every
+    # MEMORY_PROFILE_RSS_INTERVAL_SECONDS.
+    MEMORY_PROFILE = _to_bool(os.getenv("MEMORY_PROFILE", "false"))
+    MEMORY_PROFILE_TOP_SITES = int(os.getenv("MEMORY_PROFILE_TOP_SITES", "20"))
+    # frames kept per allocation traceback (sites are reported by their innermost frame)
+    MEMORY_PROFILE_FRAMES = int(os.getenv("MEMORY_PROFILE_FRAMES", "1"))
+    MEMORY_PROFILE_RSS_INTERVAL_SECONDS = float(os.getenv("MEMORY_PROFILE_RSS_INTERVAL_SECONDS", "5.0"))
+    MEMORY_PROFILE_SITES_INTERVAL_SECONDS = float(os.getenv("MEMORY_PROFILE_SITES_INTERVAL_SECONDS", "30.0"))
+
+    # Sampling Profiler Configuration
+    # With SAMPLING_PROFILE every worker samples its Python stacks (SIGPROF,
+    # every SAMPLING_PROFILE_INTERVAL_MS of CPU time) for SAMPLING_PROFILE_SECONDS,
+    # starting SAMPLING_PROFILE_DELAY_SECONDS after test start. Windows can also
+    # be started from the web UI (/profiler/start?seconds=30) without restarting.
+    SAMPLING_PROFILE = _to_bool(os.getenv("SAMPLING_PROFILE", "false"))
+    SAMPLING_PROFILE_DELAY_SECONDS = float(os.getenv("SAMPLING_PROFILE_DELAY_SECONDS", "0"))
+    SAMPLING_PROFILE_SECONDS = float(os.getenv("SAMPLING_PROFILE_SECONDS", "30"))
+    SAMPLING_PROFILE_INTERVAL_MS = float(os.getenv("SAMPLING_PROFILE_INTERVAL_MS", "5"))
+    SAMPLING_PROFILE_DIR = os.getenv("SAMPLING_PROFILE_DIR", "results")
+
     # Payload Configuration
     MAX_BUNDLE_IDS_PER_REQUEST = int(os.getenv("MAX_BUNDLE_IDS_PER_REQUEST", "5"))
     MAX_LOG_MESSAGES_PER_REQUEST = int(os.getenv("MAX_LOG_MESSAGES_PER_REQUEST", "10"))
 
+    # Run Seed Configuration
+    # With RUN_SEED set, every user draws its payloads from independent random
+    # streams (one per endpoint) derived from the seed, its worker index and its
+    # spawn order, so runs with the same worker and user counts send the same
+    # payloads per user and endpoint. Unset = different payloads every run.
+    RUN_SEED = int(os.getenv("RUN_SEED")) if os.getenv("RUN_SEED") else None
+
+    # Payload Corpus Configuration (compile with python -m payloads.payload_corpus)
+    # With PAYLOAD_CORPUS_FILE set, users replay the precompiled corpus instead
+    # of generating payloads. Workers split every task's records by worker
+    # index, so set PAYLOAD_CORPUS_WORKERS to the number of workers.
+    PAYLOAD_CORPUS_FILE = os.getenv("PAYLOAD_CORPUS_FILE", "")
+    PAYLOAD_CORPUS_WORKERS = int(os.getenv("PAYLOAD_CORPUS_WORKERS", "1"))
+    PAYLOAD_CORPUS_SIZE = int(os.getenv("PAYLOAD_CORPUS_SIZE", "1000000"))
+    PAYLOAD_CORPUS_SEED = int(os.getenv("PAYLOAD_CORPUS_SEED", "42"))
+    PAYLOAD_CORPUS_BATCH_SIZE = int(os.getenv("PAYLOAD_CORPUS_BATCH_SIZE", "10000"))
+
+    # Key Popularity Configuration ("uniform", "zipf" or "hot_set")
+    BUNDLE_ID_DISTRIBUTION = os.getenv("BUNDLE_ID_DISTRIBUTION", "uniform").lower()
+    COMBO_ID_DISTRIBUTION = os.getenv("COMBO_ID_DISTRIBUTION", "uniform").lower()
+    SESSION_ID_DISTRIBUTION = os.getenv("SESSION_ID_DISTRIBUTION", "uniform").lower()
+    ZIPF_EXPONENT = float(os.getenv("ZIPF_EXPONENT", "1.0"))
+    HOT_SET_FRACTION = float(os.getenv("HOT_SET_FRACTION", "0.2"))
+    HOT_SET_TRAFFIC_SHARE = float(os.getenv("HOT_SET_TRAFFIC_SHARE", "0.8"))
+
+    # Bundle Size Tier Configuration
+    # Log viewer bundles are tiered by their row count in nu_logs_local: a
+    # bundle belongs to the last tier whose lower bound (rows) it reaches.
+    # Log viewer requests pick a tier by BUNDLE_TIER_WEIGHTS, then a bundle of
+    # that tier (following BUNDLE_ID_DISTRIBUTION); latency is reported per
+    # tier and endpoint. The payload generator samples DB_BUNDLES_PER_TIER
+    # bundles per tier.
+    BUNDLE_SIZE_TIERS = _get_mapping_env("BUNDLE_SIZE_TIERS", "small:10,medium:100000,huge:10000000", int)
+    BUNDLE_TIER_WEIGHTS = _get_mapping_env("BUNDLE_TIER_WEIGHTS", "small:1,medium:1,huge:1", float)
+    DB_BUNDLES_PER_TIER = int(os.getenv("DB_BUNDLES_PER_TIER", "10"))
+    # tier of bundles without a row count (payload files generated before tiering)
+    UNKNOWN_BUNDLE_TIER = "unknown"
+
     # Time Range Configuration (in hours)
     DEFAULT_TIME_RANGE_HOURS = int(os.getenv("DEFAULT_TIME_RANGE_HOURS", "24"))
     MAX_TIME_RANGE_HOURS = int(os.getenv("MAX_TIME_RANGE_HOURS", "168"))  # 1 week
@@ -65,10 +272,67 @@ class Config:
     MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "100"))
     MAX_PAGE_NUMBER = int(os.getenv("MAX_PAGE_NUMBER", "10"))
 
+    # Reports Listing Payloads (tasks "reports" and "list-combos")
+    # Only page_size / page_no are confirmed by the reports request the payload
+    # generator sends. The filter / sort field names and the list-combos path
+    # below are unconfirmed guesses, so the payload types using them have no
+    # weight by default (and list-combos has no task weight). Set them to match
+    # the API schema before weighting case_owner_filter, sfdc_case_filter,
+    # sorted or combined payloads.
+    REPORTS_PAYLOAD_TYPE_WEIGHTS = _get_mapping_env("REPORTS_PAYLOAD_TYPE_WEIGHTS", "default:4,deep_page:2", float)
+    LIST_COMBOS_PAYLOAD_TYPE_WEIGHTS = _get_mapping_env("LIST_COMBOS_PAYLOAD_TYPE_WEIGHTS", "default:4,deep_page:2", float)
+    LIST_COMBOS_ENDPOINT = os.getenv("LIST_COMBOS_ENDPOINT", "api/v1/insights/reports/list-combos")
+    REPORTS_FILTERS_FIELD = os.getenv("REPORTS_FILTERS_FIELD", "filters")
+    REPORTS_CASE_OWNER_FILTER_FIELD = os.getenv("REPORTS_CASE_OWNER_FILTER_FIELD", "case_owner_email")
+    REPORTS_SFDC_CASE_FILTER_FIELD = os.getenv("REPORTS_SFDC_CASE_FILTER_FIELD", "sfdc_case_no")
+    REPORTS_SORT_BY_FIELD = os.getenv("REPORTS_SORT_BY_FIELD", "sort_by")
+    REPORTS_SORT_ORDER_FIELD = os.getenv("REPORTS_SORT_ORDER_FIELD", "sort_order")
+    REPORTS_SORT_VALUES = _get_list_env("REPORTS_SORT_VALUES", "created_at,updated_at,sfdc_case_no,case_owner_email")
+    LIST_COMBOS_SORT_VALUES = _get_list_env("LIST_COMBOS_SORT_VALUES", "created_at,multi_bundle_id")
+
+    # Load Shape Configuration ("" = plain user count from the CLI/web UI, "sweep", "step")
+    LOAD_SHAPE = os.getenv("LOAD_SHAPE", "").lower()
+
+    # Parametric Sweep Configuration (used when LOAD_SHAPE=sweep)
+    # SWEEP_MODE "axis" varies one dimension at a time around the baseline point,
+    # "grid" runs the full cartesian product of all dimension values. The default
+    # values end at the request limits above (MAX_TIME_RANGE_HOURS,
+    # MAX_BUNDLE_IDS_PER_REQUEST, MAX_PAGE_SIZE); raise those to sweep past them.
+    SWEEP_MODE = os.getenv("SWEEP_MODE", "axis").lower()
+    SWEEP_STEP_SECONDS = int(os.getenv("SWEEP_STEP_SECONDS", "60"))
+    SWEEP_USERS = int(os.getenv("SWEEP_USERS", "10"))
+    SWEEP_SPAWN_RATE = float(os.getenv("SWEEP_SPAWN_RATE", "10"))
+    SWEEP_TIME_SPAN_HOURS = _get_list_env("SWEEP_TIME_SPAN_HOURS", f"1,6,24,{MAX_TIME_RANGE_HOURS}", int)
+    SWEEP_BUNDLE_COUNTS = _get_list_env("SWEEP_BUNDLE_COUNTS", f"1,2,{MAX_BUNDLE_IDS_PER_REQUEST}", int)
+    SWEEP_PAGE_SIZES = _get_list_env("SWEEP_PAGE_SIZES", f"{DEFAULT_PAGE_SIZE},{MAX_PAGE_SIZE}", int)
+    SWEEP_COMPONENT_COUNTS = _get_list_env("SWEEP_COMPONENT_COUNTS", "0,1,3", int)
+    SWEEP_SEARCH = _get_list_env("SWEEP_SEARCH", "false,true", _to_bool)
+
+    # Step Load Configuration (used when LOAD_SHAPE=step)
+    # Users are added in steps until a per-endpoint SLO is breached; the last
+    # good step is reported as the capacity of the Panacea API.
+    STEP_LOAD_START_USERS = int(os.getenv("STEP_LOAD_START_USERS", "10"))
+    STEP_LOAD_USERS_INCREMENT = int(os.getenv("STEP_LOAD_USERS_INCREMENT", "10"))
+    STEP_LOAD_MAX_USERS = int(os.getenv("STEP_LOAD_MAX_USERS", "500"))
+    STEP_LOAD_STEP_SECONDS = int(os.getenv("STEP_LOAD_STEP_SECONDS", "60"))
+    STEP_LOAD_WARMUP_SECONDS = int(os.getenv("STEP_LOAD_WARMUP_SECONDS", "10"))
+    STEP_LOAD_SPAWN_RATE = float(os.getenv("STEP_LOAD_SPAWN_RATE", "10"))
+    STEP_LOAD_SLO_P95_MS = float(os.getenv("STEP_LOAD_SLO_P95_MS", "2000"))
+    STEP_LOAD_SLO_P99_MS = float(os.getenv("STEP_LOAD_SLO_P99_MS", "5000"))
+    STEP_LOAD_SLO_MAX_ERROR_RATE = float(os.getenv("STEP_LOAD_SLO_MAX_ERROR_RATE", "0.01"))
+    # endpoints with fewer requests in a step window are not evaluated
+    STEP_LOAD_MIN_REQUESTS = int(os.getenv("STEP_LOAD_MIN_REQUESTS", "20"))
+
+    # Per-user pacing in task runs per second (0 = use wait time between
+    # STANDARD_WAIT_MIN and STANDARD_WAIT_MAX). With pacing, a user step is
+    # also a fixed arrival-rate step of users * USER_TARGET_RPS.
+    USER_TARGET_RPS = float(os.getenv("USER_TARGET_RPS", "0"))
+
     # Task Weight Configuration
     TASK_WEIGHTS = {
-        "reports": 0,
-        "list-combos": 1,
+        "reports": 1,
+        # endpoint path unconfirmed, see LIST_COMBOS_ENDPOINT
+        "list-combos": 0,
         "events": 1,
         "ask-ai": 1,
         "report-summary": 1,
@@ -80,11 +344,118 @@ class Config:
         "logs-severity-count": 1,
     }
 
+    # Behavior Model Configuration (build with python -m database.behavior_model)
+    # The model learns think times, gaps between journeys, task transitions and
+    # journey ends from a request log table with one row per API request
+    # (session, time and endpoint columns). Gaps above
+    # BEHAVIOR_MODEL_MAX_GAP_SECONDS end a journey. With BEHAVIOR_MODEL on,
+    # PanaceaAPIUser samples its wait times and next task from the model stored
+    # in the dataset (tasks with a positive weight only).
+    BEHAVIOR_MODEL = _to_bool(os.getenv("BEHAVIOR_MODEL", "false"))
+    BEHAVIOR_MODEL_SOURCE_TABLE = os.getenv("BEHAVIOR_MODEL_SOURCE_TABLE", "panacea.nu_api_request_logs")
+    BEHAVIOR_MODEL_SESSION_COLUMN = os.getenv("BEHAVIOR_MODEL_SESSION_COLUMN", "session_id")
+    BEHAVIOR_MODEL_TIME_COLUMN = os.getenv("BEHAVIOR_MODEL_TIME_COLUMN", "request_time")
+    BEHAVIOR_MODEL_ENDPOINT_COLUMN = os.getenv("BEHAVIOR_MODEL_ENDPOINT_COLUMN", "endpoint")
+    BEHAVIOR_MODEL_DAYS = int(os.getenv("BEHAVIOR_MODEL_DAYS", "7"))
+    BEHAVIOR_MODEL_MAX_GAP_SECONDS = float(os.getenv("BEHAVIOR_MODEL_MAX_GAP_SECONDS", "1800"))
+
+    # API Stickiness Configuration
+    # A user reuses its API object of a task (same bundle / combo / session
+    # ids, newly drawn filters) for this many requests before creating a new
+    # one; per task overrides as "logs-search:10,logs-histogram:5".
+    API_STICKINESS = int(os.getenv("API_STICKINESS", "1"))
+    API_STICKINESS_OVERRIDES = _get_mapping_env("API_STICKINESS_OVERRIDES", "", int)
+
+    # Payload Replay Configuration
+    # Probability (0-1) that a request re-sends an exact payload from the
+    # user's LRU of its PAYLOAD_REPLAY_LRU_SIZE most recent payloads of the
+    # task (per task overrides as "logs-search:0.5,events:0.9"), so API
+    # response caches get hit at a controlled rate. 0 = always fresh payloads.
+    PAYLOAD_REPEAT_RATIO = float(os.getenv("PAYLOAD_REPEAT_RATIO", "0"))
+    PAYLOAD_REPEAT_RATIO_OVERRIDES = _get_mapping_env("PAYLOAD_REPEAT_RATIO_OVERRIDES", "", float)
+    PAYLOAD_REPLAY_LRU_SIZE = int(os.getenv("PAYLOAD_REPLAY_LRU_SIZE", "16"))
+    PAYLOAD_REPLAY = PAYLOAD_REPEAT_RATIO > 0 or any(PAYLOAD_REPEAT_RATIO_OVERRIDES.values())
+
+    # SLO Configuration
+    # Per request name (URL path, host and trailing '/' are ignored) latency
+    # percentile thresholds in ms, max error rate (0-1) and min RPS. Evaluated
+    # at test stop; with SLO_ENFORCE a failed verdict sets the process exit code.
+    # Set SLO_SPEC_FILE to a JSON file with the same structure to override.
+    SLO_ENFORCE = _to_bool(os.getenv("SLO_ENFORCE", "true"))
+    SLO_FAIL_EXIT_CODE = int(os.getenv("SLO_FAIL_EXIT_CODE", "3"))
+    SLO_SPEC = _load_json_file_env(
+        "SLO_SPEC_FILE",
+        {
+            "/api/v1/insights/events": {"p50_ms": 500, "p95_ms": 2000, "p99_ms": 5000, "max_error_rate": 0.01, "min_rps": 0},
+            "/api/v1/insights/ai/ask-ai": {"p50_ms": 10000, "p95_ms": 30000, "p99_ms": 60000, "max_error_rate": 0.05, "min_rps": 0},
+            "/api/v1/insights/ai/report_summary": {"p50_ms": 2000, "p95_ms": 10000, "p99_ms": 20000, "max_error_rate": 0.05, "min_rps": 0},
+            "/api/v1/insights/logs/info": {"p50_ms": 300, "p95_ms": 1000, "p99_ms": 3000, "max_error_rate": 0.01, "min_rps": 0},
+            "/api/v1/insights/logs/filter-options": {"p50_ms": 500, "p95_ms": 2000, "p99_ms": 5000, "max_error_rate": 0.01, "min_rps": 0},
+            "/api/v1/insights/logs/search": {"p50_ms": 1000, "p95_ms": 3000, "p99_ms": 8000, "max_error_rate": 0.01, "min_rps": 0},
+            "/api/v1/insights/logs/histogram": {"p50_ms": 1000, "p95_ms": 3000, "p99_ms": 8000, "max_error_rate": 0.01, "min_rps": 0},
+            "/api/v1/insights/logs/heatmap": {"p50_ms": 1000, "p95_ms": 3000, "p99_ms": 8000, "max_error_rate": 0.01, "min_rps": 0},
+            "/api/v1/insights/logs/severity-count": {"p50_ms": 1000, "p95_ms": 3000, "p99_ms": 8000, "max_error_rate": 0.01, "min_rps": 0},
+        },
+    )
+
+    # ClickHouse Query Log Report (written to results/ by the master at test stop)
+    # Queries are tied to the endpoint path found in their log_comment.
+    QUERY_LOG_REPORT = _to_bool(os.getenv("QUERY_LOG_REPORT", "false"))
+    QUERY_LOG_ENDPOINTS = _get_list_env("QUERY_LOG_ENDPOINTS", ",".join(SLO_SPEC))
+    # only queries of this ClickHouse user (e.g. the API's), empty = all users
+    QUERY_LOG_USER = os.getenv("QUERY_LOG_USER", "")
+    # only queries whose log_comment contains one of the dataset's session ids
+    QUERY_LOG_MATCH_SESSIONS = _to_bool(os.getenv("QUERY_LOG_MATCH_SESSIONS", "false"))
+    QUERY_LOG_TOP_QUERIES = int(os.getenv("QUERY_LOG_TOP_QUERIES", "10"))
+
+    # Run Comparison Configuration (python -m metrics.compare_runs)
+    # A metric regresses when the bootstrap confidence interval of its relative
+    # delta excludes zero and reaches past REGRESSION_TOLERANCE (with
+    # REGRESSION_STRICT, when the whole interval is beyond the tolerance).
+    REGRESSION_TOLERANCE = float(os.getenv("REGRESSION_TOLERANCE", "0.10"))
+    REGRESSION_CONFIDENCE = float(os.getenv("REGRESSION_CONFIDENCE", "0.95"))
+    REGRESSION_BOOTSTRAP_ITERATIONS = int(os.getenv("REGRESSION_BOOTSTRAP_ITERATIONS", "1000"))
+    REGRESSION_STRICT = _to_bool(os.getenv("REGRESSION_STRICT", "false"))
+
     @classmethod
     def validate_config(cls) -> bool:
         """Validate configuration values."""
         try:
             assert cls.SESSION_ID_LENGTH > 0
+            assert cls.SESSION_CHURN_POLICY in ("sticky", "per_request", "per_n_requests", "per_journey")
+            assert cls.SESSION_CHURN_REQUESTS > 0 and cls.SESSION_POOL_SIZE >= 0 and cls.SESSION_CACHE_SIZE >= 0
+            assert cls.SESSION_WARM_TTL_SECONDS > 0
+            assert cls.LOAD_SHAPE in ("", "sweep", "step")
+            assert cls.SWEEP_MODE in ("axis", "grid")
+            assert cls.SWEEP_STEP_SECONDS > 0
+            assert all(0 < hours <= cls.MAX_TIME_RANGE_HOURS for hours in cls.SWEEP_TIME_SPAN_HOURS)
+            assert all(0 < count <= cls.MAX_BUNDLE_IDS_PER_REQUEST for count in cls.SWEEP_BUNDLE_COUNTS)
+            assert all(0 < page_size <= cls.MAX_PAGE_SIZE for page_size in cls.SWEEP_PAGE_SIZES)
+            assert cls.STEP_LOAD_STEP_SECONDS > cls.STEP_LOAD_WARMUP_SECONDS >= 0
+            assert cls.STEP_LOAD_USERS_INCREMENT > 0
+            assert cls.USER_TARGET_RPS >= 0
+            assert 0 <= cls.RESPONSE_VALIDATION_SAMPLE_RATE <= 1
+            assert 0 < cls.HOT_SET_FRACTION <= 1
+            assert 0 < cls.HOT_SET_TRAFFIC_SHARE <= 1
+            assert cls.ASK_AI_MAX_TURNS > 0
+            assert cls.PAYLOAD_CORPUS_WORKERS > 0
+            assert cls.API_STICKINESS > 0 and all(n > 0 for n in cls.API_STICKINESS_OVERRIDES.values())
+            assert all(0 <= ratio <= 1 for ratio in (cls.PAYLOAD_REPEAT_RATIO, *cls.PAYLOAD_REPEAT_RATIO_OVERRIDES.values()))
+            assert cls.PAYLOAD_REPLAY_LRU_SIZE > 0
+            assert cls.BEHAVIOR_MODEL_DAYS > 0 and cls.BEHAVIOR_MODEL_MAX_GAP_SECONDS > 0
+            assert list(cls.BUNDLE_SIZE_TIERS.values()) == sorted(cls.BUNDLE_SIZE_TIERS.values())
+            assert all(weight >= 0 for weight in cls.BUNDLE_TIER_WEIGHTS.values())
+            assert cls.INGESTION_USERS >= 0 and cls.INGESTION_POLL_INTERVAL_SECONDS > 0
+            assert list(cls.INGESTION_BUNDLE_SIZE_CLASSES.values()) == sorted(cls.INGESTION_BUNDLE_SIZE_CLASSES.values())
+            assert all(weight >= 0 for weight in cls.INGESTION_SIZE_WEIGHTS.values())
+            for weights in (cls.REPORTS_PAYLOAD_TYPE_WEIGHTS, cls.LIST_COMBOS_PAYLOAD_TYPE_WEIGHTS):
+                assert all(weight >= 0 for weight in weights.values()) and sum(weights.values()) > 0
+            assert cls.MEMORY_PROFILE_FRAMES > 0 and cls.MEMORY_PROFILE_RSS_INTERVAL_SECONDS > 0
+            assert cls.MEMORY_PROFILE_SITES_INTERVAL_SECONDS > 0
+            assert cls.SAMPLING_PROFILE_SECONDS > 0 and cls.SAMPLING_PROFILE_INTERVAL_MS > 0
+            assert cls.CLICKHOUSE_POOL_SIZE > 0 and cls.CLICKHOUSE_MAX_RETRIES >= 0
+            assert cls.CONNECTION_POLICY in ("per_user", "shared", "new_per_request")
+            assert cls.USER_POOL_MAXSIZE > 0 and cls.SHARED_POOL_MAXSIZE > 0
             return True
         except AssertionError:
             return False
@@ -0,0 +1,21 @@
+"""
+Connection policy package for Panacea Locust Load Testing
+"""
+
+from .connection_policy import (
+    CONNECT_REQUEST_TYPE,
+    ConnectionPolicies,
+    build_pool_manager,
+    get_pool_manager,
+    get_request_timeout,
+    get_session_headers,
+)
+
+__all__ = [
+    "CONNECT_REQUEST_TYPE",
+    "ConnectionPolicies",
+    "build_pool_manager",
+    "get_pool_manager",
+    "get_request_timeout",
+    "get_session_headers",
+]
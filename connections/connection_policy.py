@@ -0,0 +1,118 @@
+"""
+Connection Policy for Panacea Locust Load Testing
+
+This module builds the urllib3 pool managers behind the users' HTTP sessions
+for the configured connection policy (per-user pools, one shared worker-wide
+pool, or a new connection per request) and reports connection establishment
+time (TCP connect plus TLS handshake) as a separate metric.
+"""
+
+import logging
+import time
+from typing import Dict, Optional
+
+from locust import events
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from config import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+CONNECT_REQUEST_TYPE = "CONNECT"
+
+
+class ConnectionPolicies:
+    """Connection policy constants (Config.CONNECTION_POLICY)"""
+    PER_USER = "per_user"
+    SHARED = "shared"
+    NEW_PER_REQUEST = "new_per_request"
+
+
+def _report_connect(connection, start_time: float, exception: Optional[Exception]):
+    events.request.fire(
+        request_type=CONNECT_REQUEST_TYPE,
+        name=f"{connection.scheme}://{connection.host}:{connection.port}",
+        response_time=(time.perf_counter() - start_time) * 1000,
+        response_length=0,
+        exception=exception,
+        context={},
+    )
+
+
+class TimedHTTPConnection(HTTPConnection):
+    scheme = "http"
+
+    def connect(self):
+        start_time = time.perf_counter()
+        try:
+            super().connect()
+        except Exception as e:
+            _report_connect(self, start_time, e)
+            raise
+        _report_connect(self, start_time, None)
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    scheme = "https"
+
+    def connect(self):
+        start_time = time.perf_counter()
+        try:
+            super().connect()
+        except Exception as e:
+            _report_connect(self, start_time, e)
+            raise
+        _report_connect(self, start_time, None)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def build_pool_manager(maxsize: int, block: bool) -> PoolManager:
+    """
+    Build a pool manager whose connections report their establishment time.
+
+    Args:
+        maxsize: Connections kept per host
+        block: Wait for a free connection instead of opening more than `maxsize`
+    """
+    pool_manager = PoolManager(maxsize=maxsize, block=block)
+    pool_manager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+    return pool_manager
+
+
+_shared_pool_manager: Optional[PoolManager] = None
+
+
+def get_pool_manager(policy: str = config.CONNECTION_POLICY) -> PoolManager:
+    """
+    Get the pool manager for a new user: the worker-wide one for the shared
+    policy, a new capped one otherwise.
+    """
+    global _shared_pool_manager
+    if policy == ConnectionPolicies.SHARED:
+        if _shared_pool_manager is None:
+            _shared_pool_manager = build_pool_manager(config.SHARED_POOL_MAXSIZE, config.CONNECTION_POOL_BLOCK)
+            logger.info(f"🔌 Shared connection pool created (max {config.SHARED_POOL_MAXSIZE} connections per host)")
+        return _shared_pool_manager
+    return build_pool_manager(config.USER_POOL_MAXSIZE, config.CONNECTION_POOL_BLOCK)
+
+
+def get_session_headers(policy: str = config.CONNECTION_POLICY) -> Dict[str, str]:
+    """Extra session headers of the policy (no keep-alive for new-connection-per-request)."""
+    if policy == ConnectionPolicies.NEW_PER_REQUEST:
+        return {"Connection": "close"}
+    return {}
+
+
+def get_request_timeout():
+    """(connect, read) timeout applied to every request."""
+    return config.CONNECT_TIMEOUT, config.REQUEST_TIMEOUT
@@ -0,0 +1,7 @@
+"""
+Multi-turn Ask-AI conversation package for Panacea Locust Load Testing
+"""
+
+from .conversation_tracker import ConversationTracker, conversation_tracker, setup_conversation_event_handlers
+
+__all__ = ["ConversationTracker", "conversation_tracker", "setup_conversation_event_handlers"]
@@ -0,0 +1,134 @@
+"""
+Conversation Tracker for Panacea Locust Load Testing
+
+This module buckets the latency of multi-turn Ask-AI requests by turn number
+and by total prompt size, so the context-length latency curve of the AI
+backend shows up in the test summary.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from locust import events
+
+from config import config
+from event_handlers import test_metrics
+from metrics import HTTP_METHODS, LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ConversationTracker:
+    """
+    Collects per-turn and per-prompt-size latency histograms of conversation
+    requests (requests sent with a `conversation_turn` context).
+    """
+
+    DIMENSIONS = ("turn", "prompt_size")
+
+    def __init__(self, prompt_size_buckets: List[int]):
+        """
+        Args:
+            prompt_size_buckets: Ascending upper bounds (in characters) of the
+                prompt size buckets; larger prompts go to an overflow bucket
+        """
+        self.prompt_size_buckets = sorted(prompt_size_buckets)
+        # dimension -> bucket -> request name -> histogram
+        self.results: Dict[str, Dict[str, Dict[str, LatencyHistogram]]] = {
+            dimension: {} for dimension in self.DIMENSIONS
+        }
+
+    def get_prompt_size_bucket(self, prompt_chars: int) -> str:
+        for upper_bound in self.prompt_size_buckets:
+            if prompt_chars <= upper_bound:
+                return f"<={upper_bound}"
+        return f">{self.prompt_size_buckets[-1]}" if self.prompt_size_buckets else "all"
+
+    def record(self, turn: int, prompt_chars: int, name: str, response_time: float, failed: bool):
+        for dimension, bucket in (
+            ("turn", str(turn)),
+            ("prompt_size", self.get_prompt_size_bucket(prompt_chars)),
+        ):
+            histograms = self.results[dimension].setdefault(bucket, {})
+            histograms.setdefault(name, LatencyHistogram()).record(response_time, failed)
+
+    def reset(self):
+        self.results = {dimension: {} for dimension in self.DIMENSIONS}
+
+    def export_results(self) -> Dict[str, Any]:
+        """Serialize and reset the collected results (for worker -> master reports)."""
+        exported = {
+            dimension: {
+                bucket: {name: histogram.to_dict() for name, histogram in histograms.items()}
+                for bucket, histograms in buckets.items()
+            }
+            for dimension, buckets in self.results.items()
+        }
+        self.reset()
+        return exported
+
+    def import_results(self, data: Dict[str, Any]):
+        """Merge results exported by a worker."""
+        for dimension, buckets in data.items():
+            for bucket, histograms in buckets.items():
+                merged = self.results[dimension].setdefault(bucket, {})
+                for name, histogram in histograms.items():
+                    merged.setdefault(name, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+
+    def _get_bucket_order(self, dimension: str, bucket: str):
+        if dimension == "turn":
+            return int(bucket)
+        labels = [f"<={upper_bound}" for upper_bound in self.prompt_size_buckets]
+        return labels.index(bucket) if bucket in labels else len(labels)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the latency curves per request name by turn number and by prompt size."""
+        summary = {"prompt_size_buckets": self.prompt_size_buckets}
+        for dimension, buckets in self.results.items():
+            curve = {}
+            for bucket in sorted(buckets, key=lambda b: self._get_bucket_order(dimension, b)):
+                for name, histogram in buckets[bucket].items():
+                    curve.setdefault(name, []).append({dimension: bucket, **histogram.get_summary()})
+            summary[f"by_{dimension}"] = curve
+        return summary
+
+
+# Global conversation tracker instance
+conversation_tracker = ConversationTracker(config.ASK_AI_PROMPT_SIZE_BUCKETS)
+
+
+def on_test_start(environment, **kwargs):
+    conversation_tracker.reset()
+
+
+def on_request(request_type, name, response_time, response_length, context=None, exception=None, **kwargs):
+    if context and "conversation_turn" in context:
+        # custom metrics (e.g. TTFT) get their own curve next to the endpoint's
+        key = name if request_type in HTTP_METHODS else f"{request_type} {name}"
+        conversation_tracker.record(
+            context["conversation_turn"], context["prompt_chars"], key, response_time, exception is not None
+        )
+
+
+def on_report_to_master(client_id, data, **kwargs):
+    data["conversation_results"] = conversation_tracker.export_results()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    if "conversation_results" in data:
+        conversation_tracker.import_results(data["conversation_results"])
+
+
+def setup_conversation_event_handlers():
+    """
+    Register the conversation event handlers with Locust and add the
+    per-turn / per-prompt-size curves to the test summary.
+    """
+    events.test_start.add_listener(on_test_start)
+    events.request.add_listener(on_request)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("conversation", conversation_tracker.get_summary)
+
+    logger.info("🔧 Conversation event handlers registered successfully")
@@ -0,0 +1,72 @@
+"""
+Corpus Replay User for Panacea Locust Load Testing
+
+This module contains a user that replays a precompiled payload corpus
+(payloads.payload_corpus) instead of generating payloads, so repeated runs
+send the same requests and payload generation adds no client-side cost.
+"""
+
+import logging
+
+from locust import events
+
+from config import config
+from panacea_user import PanaceaBaseUser
+from payloads.payload_corpus import PayloadCorpus
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Global payload corpus instance
+payload_corpus = PayloadCorpus(config.PAYLOAD_CORPUS_FILE)
+
+
+def _build_replay_task(task_name: str):
+    def replay(user):
+        user.replay_corpus_request(task_name)
+
+    replay.__name__ = f"replay_{task_name.replace('-', '_')}"
+    return replay
+
+
+class PanaceaCorpusUser(PanaceaBaseUser):
+    """
+    Virtual user replaying the corpus records of every task in
+    `Config.TASK_WEIGHTS`, with the configured task weights.
+    """
+
+    tasks = {
+        _build_replay_task(task_name): weight
+        for task_name, weight in config.TASK_WEIGHTS.items()
+        if weight > 0 and task_name in payload_corpus.tasks
+    }
+
+    def replay_corpus_request(self, task_name: str):
+        record = payload_corpus.next_record(task_name)
+        method = record["method"]
+        url = f"{config.DEFAULT_HOST}/{record['endpoint']}"
+        self.make_request(
+            method,
+            url,
+            json_data=record["payload"] if method == "POST" else None,
+            params=record["payload"] if method == "GET" else None,
+            name=url,
+            context=record["context"],
+        )
+
+
+def on_test_start(environment, **kwargs):
+    # every run replays from the start of this worker's share
+    payload_corpus.set_partition(
+        getattr(environment.runner, "worker_index", 0), config.PAYLOAD_CORPUS_WORKERS
+    )
+
+
+def setup_corpus_event_handlers():
+    """Register the corpus replay event handlers with Locust."""
+    events.test_start.add_listener(on_test_start)
+
+    logger.info(
+        f"🔧 Payload corpus {config.PAYLOAD_CORPUS_FILE} loaded "
+        f"({payload_corpus.metadata['size']:,} records, seed {payload_corpus.metadata['seed']})"
+    )
@@ -0,0 +1,262 @@
+"""
+Behavior Model Builder for Panacea Locust Load Testing
+
+This module learns how real users pace and sequence their requests from a
+ClickHouse request log: the empirical distribution of the gaps between
+consecutive requests of a session (think time), the gaps between journeys,
+and the endpoint transition counts (a first-order Markov chain over tasks,
+with a start distribution and a journey end state).
+The model is stored in the dataset file (`behavior_model` key of
+PAYLOAD_JSON_FILE_PATH), where `PanaceaAPIUser` picks it up with
+`BEHAVIOR_MODEL=true`.
+
+Usage:
+    python -m database.behavior_model --days 7
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from config import config, payload_config
+from database.clickhouse_dao import ClickHouseDAO
+from metrics import normalize_request_name
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# transition source of the first request of a journey
+JOURNEY_START = ""
+
+
+class BehaviorModelBuilder:
+    """
+    Builds the think-time distribution and task transition matrix from a request log table.
+
+    Requests are ordered per session; a gap longer than `max_gap_seconds`
+    ends the journey, so the next request counts as a journey start and its
+    gap is a journey gap, not a think time. The last request of a journey
+    (before such a gap or the end of the session) counts as a transition to
+    the journey end. All aggregations run inside ClickHouse.
+    """
+
+    def __init__(
+        self,
+        dao: ClickHouseDAO,
+        table: str,
+        session_column: str,
+        time_column: str,
+        endpoint_column: str,
+        max_gap_seconds: float,
+        quantile_steps: int = 100,
+    ):
+        """
+        Args:
+            dao: DAO used to query the request log
+            table: Request log table (database.table)
+            session_column: Session id column
+            time_column: Request time column (DateTime / DateTime64)
+            endpoint_column: Endpoint (URL or path) column
+            max_gap_seconds: Longest gap still counted as think time within a journey
+            quantile_steps: Think-time quantiles stored (steps + 1 points from p0 to p100)
+        """
+        self.dao = dao
+        self.table = table
+        self.session_column = session_column
+        self.time_column = time_column
+        self.endpoint_column = endpoint_column
+        self.max_gap_ms = int(max_gap_seconds * 1000)
+        self.quantile_steps = quantile_steps
+
+    def _build_requests_query(self) -> str:
+        return f"""
+            SELECT
+                {self.endpoint_column} AS endpoint,
+                lagInFrame({self.endpoint_column}) OVER w AS previous_endpoint,
+                dateDiff('millisecond', lagInFrame({self.time_column}) OVER w, {self.time_column}) AS gap_ms,
+                dateDiff('millisecond', {self.time_column}, leadInFrame({self.time_column}) OVER w) AS next_gap_ms,
+                row_number() OVER w AS request_no,
+                count() OVER w AS session_requests
+            FROM {self.table}
+            WHERE {self.time_column} >= now() - INTERVAL %(days)s DAY
+            WINDOW w AS (
+                PARTITION BY {self.session_column} ORDER BY {self.time_column}
+                ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+            )
+        """
+
+    def _get_gap_quantiles(self, condition: str, days: int) -> Dict[str, Any]:
+        levels = ", ".join(str(step / self.quantile_steps) for step in range(self.quantile_steps + 1))
+        result = self.dao.execute(
+            f"SELECT quantiles({levels})(gap_ms), count() FROM ({self._build_requests_query()}) "
+            f"WHERE request_no > 1 AND {condition}",
+            {"days": days, "max_gap_ms": self.max_gap_ms},
+            use_cache=False,
+        )
+        quantiles, gaps = result[0]
+        return {"quantiles_ms": [round(float(value), 1) for value in quantiles] if gaps else [], "gaps": gaps}
+
+    def get_think_time_quantiles(self, days: int) -> Dict[str, Any]:
+        """Get the think-time quantiles (ms) and the number of gaps they are based on."""
+        return self._get_gap_quantiles("gap_ms <= %(max_gap_ms)s", days)
+
+    def get_journey_gap_quantiles(self, days: int) -> Dict[str, Any]:
+        """Get the quantiles (ms) of the gaps between journeys of a session and the number of gaps."""
+        return self._get_gap_quantiles("gap_ms > %(max_gap_ms)s", days)
+
+    def get_transition_counts(self, days: int) -> List[Any]:
+        """Get (previous endpoint or journey start, endpoint, count) rows."""
+        return self.dao.execute(
+            f"SELECT if(request_no = 1 OR gap_ms > %(max_gap_ms)s, %(journey_start)s, previous_endpoint) AS source, "
+            f"endpoint, count() FROM ({self._build_requests_query()}) GROUP BY source, endpoint",
+            {"days": days, "max_gap_ms": self.max_gap_ms, "journey_start": JOURNEY_START},
+            use_cache=False,
+        )
+
+    def get_journey_end_counts(self, days: int) -> List[Any]:
+        """Get (endpoint, count) rows of the last requests of journeys."""
+        return self.dao.execute(
+            f"SELECT endpoint, count() FROM ({self._build_requests_query()}) "
+            f"WHERE request_no = session_requests OR next_gap_ms > %(max_gap_ms)s GROUP BY endpoint",
+            {"days": days, "max_gap_ms": self.max_gap_ms},
+            use_cache=False,
+        )
+
+    @staticmethod
+    def _normalize_rows(counts: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, float]]:
+        probabilities = {}
+        for source, targets in counts.items():
+            total = sum(targets.values())
+            if total:
+                probabilities[source] = {target: round(count / total, 6) for target, count in targets.items()}
+        return probabilities
+
+    def build(self, task_endpoints: Dict[str, str], days: int) -> Dict[str, Any]:
+        """
+        Build the behavior model.
+
+        Args:
+            task_endpoints: Endpoint path -> task name; requests to other endpoints are left out
+            days: Days of request log to learn from
+
+        Returns:
+            Model with the think-time and journey gap quantiles, the journey
+            start probabilities, the task transition probabilities and the
+            journey end probability of every task (transition and end
+            probabilities of a task sum to 1)
+        """
+        think_time = self.get_think_time_quantiles(days)
+        journey_gap = self.get_journey_gap_quantiles(days)
+
+        start_counts: Dict[str, int] = {}
+        transition_counts: Dict[str, Dict[str, int]] = {}
+        unmapped: Dict[str, int] = {}
+        for source, endpoint, count in self.get_transition_counts(days):
+            path = normalize_request_name(endpoint)
+            task_name = task_endpoints.get(path)
+            if task_name is None:
+                unmapped[path] = unmapped.get(path, 0) + count
+                continue
+            if source == JOURNEY_START:
+                start_counts[task_name] = start_counts.get(task_name, 0) + count
+                continue
+            source_task = task_endpoints.get(normalize_request_name(source))
+            if source_task is not None:
+                targets = transition_counts.setdefault(source_task, {})
+                targets[task_name] = targets.get(task_name, 0) + count
+
+        end_counts: Dict[str, int] = {}
+        for endpoint, count in self.get_journey_end_counts(days):
+            task_name = task_endpoints.get(normalize_request_name(endpoint))
+            if task_name is not None:
+                end_counts[task_name] = end_counts.get(task_name, 0) + count
+
+        # the journey end is one more target of every task's row
+        row_totals = {
+            task_name: sum(transition_counts.get(task_name, {}).values()) + end_counts.get(task_name, 0)
+            for task_name in set(transition_counts) | set(end_counts)
+        }
+        return {
+            "source_table": self.table,
+            "days": days,
+            "built_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "max_gap_seconds": self.max_gap_ms / 1000,
+            "think_time": think_time,
+            "journey_gap": journey_gap,
+            "journeys": sum(start_counts.values()),
+            "start_probabilities": self._normalize_rows({JOURNEY_START: start_counts}).get(JOURNEY_START, {}),
+            "transition_probabilities": {
+                source: {target: round(count / row_totals[source], 6) for target, count in targets.items()}
+                for source, targets in transition_counts.items()
+            },
+            "end_probabilities": {
+                task_name: round(end_counts.get(task_name, 0) / total, 6)
+                for task_name, total in row_totals.items()
+                if total
+            },
+            "unmapped_endpoint_requests": unmapped,
+        }
+
+
+def get_task_endpoints() -> Dict[str, str]:
+    """Get the endpoint path of every registered API task."""
+    from payloads.api_registry import api_registry
+
+    return {
+        normalize_request_name(api_registry.create(task_name).endpoint): task_name
+        for task_name in api_registry.api_classes
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Learn think times and the task mix from the request log")
+    parser.add_argument("--days", type=int, default=config.BEHAVIOR_MODEL_DAYS)
+    parser.add_argument("--table", default=config.BEHAVIOR_MODEL_SOURCE_TABLE)
+    parser.add_argument(
+        "--dataset", default=payload_config.PAYLOAD_JSON_FILE_PATH, help="Dataset file the model is stored in"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    builder = BehaviorModelBuilder(
+        ClickHouseDAO(),
+        args.table,
+        config.BEHAVIOR_MODEL_SESSION_COLUMN,
+        config.BEHAVIOR_MODEL_TIME_COLUMN,
+        config.BEHAVIOR_MODEL_ENDPOINT_COLUMN,
+        config.BEHAVIOR_MODEL_MAX_GAP_SECONDS,
+    )
+    model = builder.build(get_task_endpoints(), args.days)
+
+    with open(args.dataset) as f:
+        dataset = json.load(f)
+    dataset["behavior_model"] = model
+    # write next to the dataset and swap it in, so a failed dump never truncates it
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(args.dataset)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(dataset, f, indent=2)
+        shutil.copymode(args.dataset, tmp_path)
+        os.replace(tmp_path, args.dataset)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    logger.info(
+        f"Behavior model of {model['journeys']:,} journeys and {model['think_time']['gaps']:,} think times "
+        f"saved to {args.dataset}"
+    )
+    if model["unmapped_endpoint_requests"]:
+        logger.warning(f"Requests to endpoints without a task: {model['unmapped_endpoint_requests']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
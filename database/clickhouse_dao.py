@@ -7,13 +7,24 @@ from ClickHouse to make load testing more realistic.
 
 import logging
 import os
-from typing import Dict, List, Optional, Tuple
+import queue
+import random
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
 
 from clickhouse_driver import Client
+from clickhouse_driver.errors import NetworkError, SocketTimeoutError, UnexpectedPacketFromServerError
+
+from config import config
+from database.query_cache import QueryResultCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Errors after which a query is retried on a fresh connection
+RETRYABLE_ERRORS = (NetworkError, SocketTimeoutError, UnexpectedPacketFromServerError, EOFError, OSError)
+
 
 class ClickHouseDAO:
     """
@@ -21,10 +32,20 @@ class ClickHouseDAO:
 
     This class provides methods to fetch real user IDs and session IDs
     from the ClickHouse database to make load testing more realistic.
+
+    Connections come from a pool of up to `CLICKHOUSE_POOL_SIZE` clients,
+    queries are retried with exponential backoff on network errors, and
+    dataset queries are served from an on-disk result cache when enabled.
     """
 
-    def __init__(self):
-        """Initialize ClickHouse connection."""
+    def __init__(self, pool_size: Optional[int] = None, max_retries: Optional[int] = None):
+        """
+        Initialize ClickHouse connection.
+
+        Args:
+            pool_size: Max pooled connections (defaults to CLICKHOUSE_POOL_SIZE)
+            max_retries: Retries on network errors (defaults to CLICKHOUSE_MAX_RETRIES)
+        """
         self.host = os.getenv("CLICKHOUSE_HOST", "localhost")
         self.port = int(os.getenv("CLICKHOUSE_PORT", "9000"))
         self.database = os.getenv("CLICKHOUSE_DATABASE", "panacea_system")
@@ -38,39 +59,125 @@ class ClickHouseDAO:
             "send_receive_timeout": 30,
         }
 
-        self._client = None
+        self.pool_size = pool_size if pool_size is not None else config.CLICKHOUSE_POOL_SIZE
+        self.max_retries = max_retries if max_retries is not None else config.CLICKHOUSE_MAX_RETRIES
+        self.retry_backoff_seconds = config.CLICKHOUSE_RETRY_BACKOFF_SECONDS
+        # idle clients; clients are created lazily up to pool_size
+        self._pool: "queue.LifoQueue[Client]" = queue.LifoQueue(maxsize=self.pool_size)
+        self._clients_created = 0
+
+        self.query_cache = (
+            QueryResultCache(
+                config.CLICKHOUSE_QUERY_CACHE_DIR,
+                config.CLICKHOUSE_QUERY_CACHE_TTL_SECONDS,
+                config.CLICKHOUSE_QUERY_CACHE_MAX_BYTES,
+            )
+            if config.CLICKHOUSE_QUERY_CACHE
+            else None
+        )
 
         logger.info(
             f"ClickHouse DAO initialized for {self.host}:{self.port}/{self.database}"
         )
 
-    def _get_client(self) -> Client:
+    def _create_client(self) -> Client:
         """
-        Get or create ClickHouse client connection.
+        Create a ClickHouse client connection.
 
         Returns:
             ClickHouse client instance
         """
-        if self._client is None:
-            try:
-                self._client = Client(
-                    host=self.host,
-                    port=self.port,
-                    database=self.database,
-                    user=self.user,
-                    password=self.password,
-                    settings=self.settings,
-                )
-
-                # Test connection
-                self._client.execute("SELECT 1")
-                logger.info("ClickHouse connection established successfully")
+        try:
+            client = Client(
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.user,
+                password=self.password,
+                settings=self.settings,
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to connect to ClickHouse: {str(e)}")
-                raise
+            # Test connection
+            client.execute("SELECT 1")
+            logger.info("ClickHouse connection established successfully")
+            return client
+
+        except Exception as e:
+            logger.error(f"Failed to connect to ClickHouse: {str(e)}")
+            raise
 
-        return self._client
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a client from the pool, creating one while the pool is below
+        its size and waiting for a free one otherwise. Clients hitting a
+        network error are disconnected and replaced on a later borrow.
+        """
+        try:
+            client = self._pool.get_nowait()
+        except queue.Empty:
+            if self._clients_created < self.pool_size:
+                self._clients_created += 1
+                try:
+                    client = self._create_client()
+                except Exception:
+                    self._clients_created -= 1
+                    raise
+            else:
+                client = self._pool.get()
+
+        try:
+            yield client
+        except RETRYABLE_ERRORS:
+            client.disconnect()
+            self._clients_created -= 1
+            raise
+        except Exception:
+            self._pool.put(client)
+            raise
+        self._pool.put(client)
+
+    def execute(self, query: str, params: Optional[Dict[str, Any]] = None, use_cache: bool = True, **kwargs) -> Any:
+        """
+        Execute a query with retries, serving it from the result cache when possible.
+
+        Args:
+            query: SQL query
+            params: Query parameters
+            use_cache: Read and write the on-disk result cache (if enabled)
+            **kwargs: Passed on to `Client.execute` (e.g. settings, with_column_types)
+
+        Returns:
+            The query result
+        """
+        cache_key = None
+        if use_cache and self.query_cache is not None:
+            cache_key = self.query_cache.get_key(query, {"params": params, **kwargs})
+            cached = self.query_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"ClickHouse query served from cache: {cache_key}")
+                return cached
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self.connection() as client:
+                    result = client.execute(query, params, **kwargs)
+                break
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    logger.error(f"ClickHouse query failed after {attempt + 1} attempts: {e}")
+                    raise
+                # exponential backoff with full jitter
+                delay = random.uniform(0, self.retry_backoff_seconds * 2**attempt)
+                logger.warning(f"ClickHouse query failed ({e}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+
+        if cache_key is not None:
+            try:
+                self.query_cache.put(cache_key, result)
+            except Exception as e:
+                logger.warning(f"Failed to cache ClickHouse query result: {e}")
+        return result
 
     def get_users_and_sessions(self, limit: int = 1000) -> Dict[str, str]:
         """
@@ -89,8 +196,6 @@ class ClickHouseDAO:
             Exception: If database query fails
         """
 
-        client = self._get_client()
-
         # Query to get active users and their sessions
         # This is a sample query - adjust based on your actual schema
         query = """
@@ -107,51 +212,45 @@ class ClickHouseDAO:
         logger.info(f"Fetching users and sessions with limit: {limit}")
 
         # Execute query
-        result = client.execute(query, {"limit": limit})
+        result = self.execute(query, {"limit": limit})
 
         user_id_to_session_id = {result[0]: result[1] for result in result}
 
         return user_id_to_session_id
 
     def get_valid_log_bundle_ids(self, limit: int = 20) -> List[int]:
-        client = self._get_client()
         query = f"select id from panacea.nu_metadata where is_deleted=0 order by rand() limit {limit}"
-        result = client.execute(query, {"limit": limit})
+        result = self.execute(query, {"limit": limit})
         return [result[0] for result in result]
 
     def get_valid_combo_ids(self, limit: int = 20) -> List[int]:
-        client = self._get_client()
         query = f"select multi_bundle_id from panacea.nu_multi_bundle order by rand() limit {limit}"
-        result = client.execute(query, {"limit": limit})
+        result = self.execute(query, {"limit": limit})
         return [result[0] for result in result]
 
     def get_messages_from_db(self, limit: int = 20) -> List[str]:
-        client = self._get_client()
         query = f"""
                     SELECT DISTINCT message
                     FROM nu_logs_local
                     WHERE length(message) < 100
                     LIMIT {limit};
                 """
-        result = client.execute(query, {"limit": limit})
+        result = self.execute(query, {"limit": limit})
         return [result[0] for result in result]
 
     def get_components_by_bundle_id(self, bundle_id: int) -> List[str]:
-        client = self._get_client()
         query = f"select distinct filename_without_ext from nu_logs_local where log_bundle_id = {bundle_id} order by rand() limit 10"
-        result = client.execute(query)
+        result = self.execute(query)
         return [result[0] for result in result]
 
     def get_source_log_filenames_by_bundle_id(self, bundle_id: int) -> List[str]:
-        client = self._get_client()
         query = f"select distinct source_log_filename from nu_logs_local where log_bundle_id = {bundle_id} order by rand() limit 10"
-        result = client.execute(query)
+        result = self.execute(query)
         return [result[0] for result in result]
 
     def get_start_and_end_time_by_bundle_id(self, bundle_id: int) -> Tuple[int, int]:
-        client = self._get_client()
         query = f"select min(event_time) as start_time, max(event_time) as end_time from nu_logs_local where log_bundle_id = {bundle_id}"
-        result = client.execute(query)
+        result = self.execute(query)
         return result[0][0], result[0][1]
 
     def get_log_bundle_ids_having_log_count_greater_than(
@@ -164,14 +263,57 @@ class ClickHouseDAO:
                     FROM panacea.nu_logs_local
                     GROUP BY log_bundle_id
                     HAVING cnt >{count} limit {limit};"""
-        client = self._get_client()
-        result = client.execute(query)
+        result = self.execute(query)
         return [result[0] for result in result]
 
+    def get_log_bundle_row_counts(
+        self, min_count: int, max_count: Optional[int] = None, limit: int = 10
+    ) -> Dict[int, int]:
+        """
+        Get random log bundles with a row count in [min_count, max_count).
+
+        Returns:
+            Dictionary mapping log bundle id to its row count in nu_logs_local
+        """
+        having = f"cnt >= {min_count}"
+        if max_count is not None:
+            having += f" AND cnt < {max_count}"
+        query = f"""
+                    SELECT
+                    log_bundle_id,
+                    count(*) AS cnt
+                    FROM panacea.nu_logs_local
+                    GROUP BY log_bundle_id
+                    HAVING {having} ORDER BY rand() LIMIT {limit};"""
+        result = self.execute(query)
+        return {row[0]: row[1] for row in result}
+
+    def get_tiered_log_bundle_row_counts(self, tiers: Dict[str, int], limit_per_tier: int) -> Dict[int, int]:
+        """
+        Get up to `limit_per_tier` log bundles for every bundle size tier.
+
+        Args:
+            tiers: Ordered mapping of tier name to its lower bound (rows)
+            limit_per_tier: Bundles sampled per tier
+
+        Returns:
+            Dictionary mapping log bundle id to its row count
+        """
+        lower_bounds = list(tiers.values())
+        row_counts = {}
+        for i, min_count in enumerate(lower_bounds):
+            max_count = lower_bounds[i + 1] if i + 1 < len(lower_bounds) else None
+            row_counts.update(self.get_log_bundle_row_counts(min_count, max_count, limit_per_tier))
+        return row_counts
+
     def get_bundle_data(self, bundle_id: int) -> Dict[str, any]:
-        bundle_ids = self.get_log_bundle_ids_having_log_count_greater_than(10, 10)
-        bundle_id_to_data = {bundle_id: {} for bundle_id in bundle_ids}
-        for bundle_id in bundle_ids:
+        bundle_row_counts = self.get_tiered_log_bundle_row_counts(
+            config.BUNDLE_SIZE_TIERS, config.DB_BUNDLES_PER_TIER
+        )
+        bundle_id_to_data = {bundle_id: {} for bundle_id in bundle_row_counts}
+        for bundle_id, row_count in bundle_row_counts.items():
+            # kept so log viewer requests can be tiered by bundle size
+            bundle_id_to_data[bundle_id]["row_count"] = row_count
             bundle_id_to_data[bundle_id]["components"] = (
                 self.get_components_by_bundle_id(bundle_id)
             )
@@ -0,0 +1,113 @@
+"""
+Log Queries for Panacea Locust Load Testing
+
+This module translates log viewer API payloads (bundle ids, time window and
+filters) into the equivalent ClickHouse queries over `nu_logs_local`, so the
+database can be loaded directly with the same query shapes the API runs.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+
+class LogQueryBuilder:
+    """
+    Builds parameterized `nu_logs_local` queries from log viewer payloads.
+
+    Every builder returns a (query, params) pair for `ClickHouseDAO.execute`.
+    """
+
+    TABLE = "nu_logs_local"
+    # payload filter -> nu_logs_local column
+    FILTER_COLUMNS = {
+        "components": "filename_without_ext",
+        "source_log_filenames": "source_log_filename",
+        "log_levels": "log_level",
+        "cvm_ips": "cvm_ip",
+    }
+    LOG_LEVEL_COLUMN = "log_level"
+    PAYLOAD_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+    HISTOGRAM_BUCKETS = 100
+
+    @staticmethod
+    def _to_bundle_id(bundle_id):
+        return int(bundle_id) if str(bundle_id).isdigit() else bundle_id
+
+    def _get_time_window(self, filters: Dict[str, Any]) -> Tuple[datetime, datetime]:
+        return (
+            datetime.strptime(filters["start_time"], self.PAYLOAD_TIME_FORMAT),
+            datetime.strptime(filters["end_time"], self.PAYLOAD_TIME_FORMAT),
+        )
+
+    def build_where(self, payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the WHERE clause shared by all log viewer query shapes.
+
+        Args:
+            payload: Log viewer API payload
+
+        Returns:
+            Tuple of (where clause, query params)
+        """
+        filters = payload.get("filters", {})
+        start_time, end_time = self._get_time_window(filters)
+        conditions: List[str] = [
+            "log_bundle_id IN %(bundle_ids)s",
+            "event_time BETWEEN %(start_time)s AND %(end_time)s",
+        ]
+        params: Dict[str, Any] = {
+            # tuples are rendered as (a, b) for IN
+            "bundle_ids": tuple(self._to_bundle_id(bundle_id) for bundle_id in payload["bundle_ids"]),
+            "start_time": start_time,
+            "end_time": end_time,
+        }
+
+        for payload_filter, column in self.FILTER_COLUMNS.items():
+            values = filters.get(payload_filter)
+            if values:
+                conditions.append(f"{column} IN %({payload_filter})s")
+                params[payload_filter] = tuple(values)
+
+        if filters.get("search_log_string"):
+            conditions.append("positionCaseInsensitive(message, %(search_log_string)s) > 0")
+            params["search_log_string"] = filters["search_log_string"]
+
+        if filters.get("is_curated") is not None:
+            conditions.append("is_curated = %(is_curated)s")
+            params["is_curated"] = int(filters["is_curated"])
+
+        return " AND ".join(conditions), params
+
+    def build_search(self, payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Filtered scan returning one page of log lines (logs/search)."""
+        where, params = self.build_where(payload)
+        page_size = payload.get("page_size", 20)
+        params["limit"] = page_size
+        params["offset"] = (payload.get("page_no", 1) - 1) * page_size
+        query = (
+            f"SELECT event_time, {self.LOG_LEVEL_COLUMN}, filename_without_ext, source_log_filename, message "
+            f"FROM {self.TABLE} WHERE {where} "
+            "ORDER BY event_time DESC LIMIT %(limit)s OFFSET %(offset)s"
+        )
+        return query, params
+
+    def build_severity_count(self, payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Log line count per log level (logs/severity-count)."""
+        where, params = self.build_where(payload)
+        query = (
+            f"SELECT {self.LOG_LEVEL_COLUMN}, count() FROM {self.TABLE} WHERE {where} "
+            f"GROUP BY {self.LOG_LEVEL_COLUMN}"
+        )
+        return query, params
+
+    def build_histogram(self, payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Log line count per time bucket and log level (logs/histogram)."""
+        where, params = self.build_where(payload)
+        span_seconds = (params["end_time"] - params["start_time"]).total_seconds()
+        params["bucket_seconds"] = max(int(span_seconds // self.HISTOGRAM_BUCKETS), 1)
+        query = (
+            "SELECT toStartOfInterval(event_time, toIntervalSecond(%(bucket_seconds)s)) AS bucket, "
+            f"{self.LOG_LEVEL_COLUMN}, count() FROM {self.TABLE} WHERE {where} "
+            f"GROUP BY bucket, {self.LOG_LEVEL_COLUMN} ORDER BY bucket"
+        )
+        return query, params
@@ -0,0 +1,130 @@
+"""
+Query Result Cache for Panacea Locust Load Testing
+
+This module caches ClickHouse query results on disk, keyed by the normalized
+query text and parameters, so repeated dataset builds and parallel CI jobs
+reuse results instead of re-running the same queries on the cluster.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class QueryResultCache:
+    """
+    On-disk query result cache with a TTL and size-bounded LRU eviction.
+
+    Each result is a pickle file named after the cache key, holding the result
+    and its creation time (for the TTL). Hits refresh the file's mtime, and
+    eviction removes the least recently used files once the cache directory
+    grows beyond `max_bytes`. Files are written to a temporary name and
+    renamed, so concurrent processes sharing the directory never read partial
+    results.
+    """
+
+    FILE_SUFFIX = ".pkl"
+
+    def __init__(self, directory: str, ttl_seconds: float, max_bytes: int):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Collapse whitespace and drop the trailing semicolon of a query."""
+        return re.sub(r"\s+", " ", query).strip().rstrip(";").strip()
+
+    def get_key(self, query: str, params: Optional[Dict[str, Any]] = None) -> str:
+        key_source = json.dumps(
+            {"query": self.normalize_query(query), "params": params or {}}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(key_source.encode()).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.FILE_SUFFIX)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached result.
+
+        Returns:
+            The cached result, or None when missing or older than the TTL
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                created_at, result = pickle.load(f)
+            if time.time() - created_at > self.ttl_seconds:
+                os.remove(path)
+                return None
+            # refresh the LRU position
+            os.utime(path)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable query cache entry {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def put(self, key: str, result: Any):
+        """Store a result and evict least recently used entries beyond `max_bytes`."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((time.time(), result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._get_path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """Remove expired entries, then least recently used ones until the cache fits `max_bytes`."""
+        entries = []
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.FILE_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+                # not used for a whole TTL, so created before it as well
+                if now - stat.st_mtime > self.ttl_seconds:
+                    os.remove(entry.path)
+                    continue
+            except FileNotFoundError:
+                # removed by a concurrent process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+    def clear(self):
+        if not os.path.isdir(self.directory):
+            return
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.FILE_SUFFIX):
+                os.remove(entry.path)
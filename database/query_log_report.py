@@ -0,0 +1,193 @@
+"""
+Query Log Report for Panacea Locust Load Testing
+
+This module pulls the queries ClickHouse ran during a test window from
+`system.query_log`, ties them to API endpoints through `log_comment` and
+reports per-endpoint and per-normalized-query duration, read rows, read
+bytes and memory usage percentiles.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from database.clickhouse_dao import ClickHouseDAO
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+UNATTRIBUTED_ENDPOINT = "unattributed"
+
+
+class QueryLogReporter:
+    """
+    Builds the post-run `system.query_log` correlation report.
+
+    A query is attributed to the first endpoint path contained in its
+    `log_comment` (the direct ClickHouse user tags its queries with
+    `locust:<endpoint>`; the API can do the same). Aggregation runs inside
+    ClickHouse, so the report stays small however many queries ran.
+    """
+
+    METRICS = ("query_duration_ms", "read_rows", "read_bytes", "memory_usage")
+    QUANTILES = (0.5, 0.95, 0.99)
+    # queries finishing right after the test stops still belong to it
+    WINDOW_PADDING_SECONDS = 5
+    TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+    def __init__(self, dao: ClickHouseDAO, endpoints: List[str], top_queries: int = 10):
+        """
+        Args:
+            dao: DAO used to query system.query_log
+            endpoints: Endpoint paths looked for in log_comment
+            top_queries: Normalized queries listed per endpoint (by total duration)
+        """
+        self.dao = dao
+        self.endpoints = list(endpoints)
+        self.top_queries = top_queries
+
+    def _build_filters(
+        self, start_time: datetime, end_time: datetime, user: str, session_ids: Optional[List[str]]
+    ) -> Tuple[str, Dict[str, Any]]:
+        conditions = [
+            "type = 'QueryFinish'",
+            "is_initial_query",
+            "event_time BETWEEN toDateTime(%(start_time)s, 'UTC') AND toDateTime(%(end_time)s, 'UTC')",
+            "query NOT ILIKE '%%system.query_log%%'",
+        ]
+        padding = timedelta(seconds=self.WINDOW_PADDING_SECONDS)
+        # passed as strings, so the driver does not shift them to the server timezone
+        params: Dict[str, Any] = {
+            "start_time": (start_time - padding).strftime(self.TIME_FORMAT),
+            "end_time": (end_time + padding).strftime(self.TIME_FORMAT),
+        }
+        if user:
+            conditions.append("user = %(user)s")
+            params["user"] = user
+        if session_ids:
+            conditions.append("arrayExists(s -> position(log_comment, s) > 0, %(session_ids)s)")
+            params["session_ids"] = list(session_ids)
+        return " AND ".join(conditions), params
+
+    def _build_endpoint_expression(self, params: Dict[str, Any]) -> str:
+        branches = []
+        for i, endpoint in enumerate(self.endpoints):
+            params[f"endpoint_{i}"] = endpoint
+            branches.append(f"position(log_comment, %(endpoint_{i})s) > 0, %(endpoint_{i})s")
+        if not branches:
+            return f"'{UNATTRIBUTED_ENDPOINT}'"
+        return f"multiIf({', '.join(branches)}, '{UNATTRIBUTED_ENDPOINT}')"
+
+    def _build_metric_columns(self) -> str:
+        quantiles = ", ".join(str(q) for q in self.QUANTILES)
+        return ", ".join(
+            f"quantiles({quantiles})({metric}) AS {metric}_quantiles, sum({metric}) AS {metric}_total"
+            for metric in self.METRICS
+        )
+
+    def _to_metric_summary(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        summary = {}
+        for metric in self.METRICS:
+            quantiles = row[f"{metric}_quantiles"]
+            summary[metric] = {
+                **{f"p{int(q * 100)}": value for q, value in zip(self.QUANTILES, quantiles)},
+                "total": row[f"{metric}_total"],
+            }
+        return summary
+
+    def _execute(self, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        rows, columns = self.dao.execute(query, params, use_cache=False, with_column_types=True)
+        names = [name for name, _ in columns]
+        return [dict(zip(names, row)) for row in rows]
+
+    def build_report(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        user: str = "",
+        session_ids: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the report for a test window.
+
+        Args:
+            start_time: Test start (UTC)
+            end_time: Test end (UTC)
+            user: Only include queries of this ClickHouse user (empty = all users)
+            session_ids: Only include queries whose log_comment contains one of these session ids
+
+        Returns:
+            Dictionary with the window and per-endpoint metric percentiles and top queries
+        """
+        try:
+            # make sure the queries of the last seconds are in query_log
+            self.dao.execute("SYSTEM FLUSH LOGS", use_cache=False)
+        except Exception as e:
+            logger.warning(f"SYSTEM FLUSH LOGS failed, the report may miss the last queries: {e}")
+
+        where, params = self._build_filters(start_time, end_time, user, session_ids)
+        endpoint_expression = self._build_endpoint_expression(params)
+        metric_columns = self._build_metric_columns()
+
+        endpoint_rows = self._execute(
+            f"SELECT {endpoint_expression} AS endpoint, count() AS queries, {metric_columns} "
+            f"FROM system.query_log WHERE {where} GROUP BY endpoint",
+            params,
+        )
+        params["top_queries"] = self.top_queries
+        query_rows = self._execute(
+            f"SELECT {endpoint_expression} AS endpoint, normalizedQueryHash(query) AS query_hash, "
+            f"any(normalizeQuery(query)) AS normalized_query, count() AS queries, {metric_columns} "
+            f"FROM system.query_log WHERE {where} GROUP BY endpoint, query_hash "
+            "ORDER BY query_duration_ms_total DESC LIMIT %(top_queries)s BY endpoint",
+            params,
+        )
+
+        endpoints = {
+            row["endpoint"]: {"queries": row["queries"], **self._to_metric_summary(row), "top_queries": []}
+            for row in endpoint_rows
+        }
+        for row in query_rows:
+            endpoints[row["endpoint"]]["top_queries"].append(
+                {
+                    "normalized_query": row["normalized_query"],
+                    "queries": row["queries"],
+                    **self._to_metric_summary(row),
+                }
+            )
+
+        return {
+            "window": {"start_time": params["start_time"], "end_time": params["end_time"], "timezone": "UTC"},
+            "user": user or None,
+            "session_filtered": bool(session_ids),
+            "endpoints": endpoints,
+        }
+
+    @staticmethod
+    def format_table(report: Dict[str, Any]) -> str:
+        """Format per-endpoint query duration / read percentiles as a text table."""
+        lines = [f"{'Endpoint':<45} {'queries':>8} {'p95 ms':>9} {'p99 ms':>9} {'p95 rows':>12} {'p95 mem':>12}"]
+        for endpoint, summary in sorted(report["endpoints"].items()):
+            lines.append(
+                f"{endpoint:<45} {summary['queries']:>8} "
+                f"{summary['query_duration_ms']['p95']:>9.0f} {summary['query_duration_ms']['p99']:>9.0f} "
+                f"{summary['read_rows']['p95']:>12.0f} {summary['memory_usage']['p95']:>12.0f}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def save_report(report: Dict[str, Any], results_dir: str = "results") -> str:
+        """
+        Save the report as JSON in the results directory.
+
+        Returns:
+            Path of the written file
+        """
+        os.makedirs(results_dir, exist_ok=True)
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        filepath = os.path.join(results_dir, f"query_log_report_{timestamp}.json")
+        with open(filepath, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+        return filepath
@@ -0,0 +1,393 @@
+"""
+Synthetic Seed Data for Panacea Locust Load Testing
+
+This module creates the `nu_logs_local`, `nu_metadata`, `nu_multi_bundle`,
+`nu_users` and `nu_sessions` tables in a (local) ClickHouse and fills them
+with synthetic data generated in NumPy batches and written with native
+columnar inserts, so the load tests and `PayloadGenerator` can run without
+the production database.
+
+Bundle sizes follow a Pareto distribution (a few huge bundles, many small
+ones), components a Zipf distribution, log levels a fixed mix dominated by
+info / debug, and log lines cluster early in each bundle's time window.
+
+Usage:
+    python -m database.seed_data --log-rows 100000000 --bundles 5000 --drop
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+from clickhouse_driver import Client
+
+from config import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Columns not listed here are left to the table defaults
+TABLE_SCHEMAS = {
+    "nu_logs_local": """
+        log_bundle_id UInt64,
+        event_time DateTime,
+        log_level LowCardinality(String),
+        filename_without_ext LowCardinality(String),
+        source_log_filename LowCardinality(String),
+        cvm_ip LowCardinality(String),
+        message String,
+        is_curated UInt8
+    """,
+    "nu_metadata": """
+        id UInt64,
+        is_deleted UInt8,
+        created_at DateTime
+    """,
+    "nu_multi_bundle": """
+        multi_bundle_id UInt64,
+        log_bundle_ids Array(UInt64),
+        created_at DateTime
+    """,
+    "nu_users": """
+        id String,
+        email String,
+        created_at DateTime
+    """,
+    "nu_sessions": """
+        session_id String,
+        user_id String,
+        expires_at DateTime
+    """,
+}
+
+TABLE_ORDER_BY = {
+    "nu_logs_local": "(log_bundle_id, filename_without_ext, event_time)",
+    "nu_metadata": "id",
+    "nu_multi_bundle": "multi_bundle_id",
+    "nu_users": "id",
+    "nu_sessions": "(user_id, session_id)",
+}
+
+
+class SyntheticDataSeeder:
+    """
+    Generates and bulk-inserts the synthetic Panacea dataset.
+
+    All random draws come from one seeded NumPy generator, so the same
+    settings always produce the same dataset. Log rows are generated and
+    inserted `batch_rows` at a time; memory use does not grow with the total
+    row count.
+    """
+
+    COMPONENTS = [
+        "stargate", "cassandra", "curator", "cerebro", "acropolis", "genesis", "prism",
+        "zookeeper", "hera", "pithos", "arithmos", "insights_server", "ergon", "lazan",
+        "uhura", "chronos", "alert_manager", "dynamic_ring_changer", "hades", "mantle",
+    ]
+    # same level names as PayloadGenerator's log_level_types
+    LOG_LEVELS = ["debug", "info", "warn", "error", "fatal", "critical", "trace", "unknown"]
+    LOG_LEVEL_PROBABILITIES = [0.2, 0.6, 0.1, 0.06, 0.005, 0.005, 0.02, 0.01]
+    FILE_SUFFIXES = [".out", ".INFO", ".WARNING", ".ERROR", ".log"]
+    MESSAGE_TEMPLATES = [
+        "Operation {op} completed in {n} ms",
+        "Retrying RPC {op} after timeout ({n} attempts)",
+        "Disk {n} usage above threshold",
+        "Lost connection to peer {ip}, reconnecting",
+        "Starting {op} task {n}",
+        "Heartbeat from {ip} missed {n} times",
+        "Scan of {n} extents finished for {op}",
+        "Leader changed to {ip}",
+        "Checksum mismatch on egroup {n} during {op}",
+        "Garbage collection freed {n} MB",
+    ]
+    OPERATIONS = ["WriteOp", "ReadOp", "FixExtentGroups", "MigrateExtents", "Compaction", "Snapshot", "Replicate"]
+    NODES_PER_CLUSTER = 4
+    MESSAGE_POOL_SIZE = 5000
+    MIN_BUNDLE_WINDOW_HOURS = 1
+    MAX_BUNDLE_WINDOW_HOURS = 168
+    DELETED_BUNDLE_FRACTION = 0.05
+    EXPIRED_SESSION_FRACTION = 0.2
+
+    def __init__(
+        self,
+        client: Client,
+        database: str,
+        log_rows: int,
+        bundles: int,
+        users: int,
+        combos: int,
+        days: int,
+        batch_rows: int,
+        bundle_size_alpha: float,
+        seed: int,
+    ):
+        """
+        Args:
+            client: ClickHouse client connected to any database of the server
+            database: Database the tables are created in
+            log_rows: Total nu_logs_local rows
+            bundles: Number of log bundles
+            users: Number of users (each gets one or more sessions)
+            combos: Number of multi bundle combos
+            days: Bundles start within the last `days` days
+            batch_rows: Log rows generated and inserted per batch
+            bundle_size_alpha: Pareto shape of the bundle row counts (smaller = heavier tail)
+            seed: Random seed
+        """
+        self.client = client
+        self.database = database
+        self.log_rows = log_rows
+        self.bundles = bundles
+        self.users = users
+        self.combos = combos
+        self.days = days
+        self.batch_rows = batch_rows
+        self.bundle_size_alpha = bundle_size_alpha
+        self.rng = np.random.default_rng(seed)
+        self.now = int(time.time())
+
+        self.bundle_ids = self._build_bundle_ids()
+        self.bundle_row_counts = self._build_bundle_row_counts()
+        self.bundle_row_ends = np.cumsum(self.bundle_row_counts)
+        self.bundle_start_times, self.bundle_window_seconds = self._build_bundle_windows()
+
+        components = np.array(self.COMPONENTS, dtype=object)
+        ranks = np.arange(1, len(components) + 1)
+        self.components = components
+        self.component_probabilities = (1.0 / ranks) / (1.0 / ranks).sum()
+        # component x suffix -> source log file name
+        self.source_log_filenames = np.array(
+            [[f"{component}{suffix}" for suffix in self.FILE_SUFFIXES] for component in self.COMPONENTS],
+            dtype=object,
+        )
+        # bundle x node -> CVM ip, every bundle comes from its own cluster
+        self.cvm_ips = np.array(
+            [
+                [f"10.{(i >> 8) & 255}.{i & 255}.{10 + node}" for node in range(self.NODES_PER_CLUSTER)]
+                for i in range(self.bundles)
+            ],
+            dtype=object,
+        )
+        self.log_levels = np.array(self.LOG_LEVELS, dtype=object)
+        self.messages = self._build_message_pool()
+        message_ranks = np.arange(1, len(self.messages) + 1)
+        self.message_probabilities = (1.0 / message_ranks) / (1.0 / message_ranks).sum()
+
+    def _build_bundle_ids(self) -> np.ndarray:
+        return self.rng.permutation(np.arange(1_000_000, 1_000_000 + self.bundles, dtype=np.uint64))
+
+    def _build_bundle_row_counts(self) -> np.ndarray:
+        """Split the log rows over the bundles with Pareto distributed weights (at least one row each)."""
+        weights = self.rng.pareto(self.bundle_size_alpha, self.bundles) + 1.0
+        counts = self.rng.multinomial(max(self.log_rows - self.bundles, 0), weights / weights.sum())
+        return counts.astype(np.int64) + 1
+
+    def _build_bundle_windows(self):
+        start_times = self.now - self.rng.integers(0, self.days * 86400, self.bundles, dtype=np.int64)
+        window_hours = np.clip(
+            self.rng.lognormal(np.log(24), 1.0, self.bundles), self.MIN_BUNDLE_WINDOW_HOURS, self.MAX_BUNDLE_WINDOW_HOURS
+        )
+        window_seconds = (window_hours * 3600).astype(np.int64)
+        # bundles end before now
+        start_times = np.minimum(start_times, self.now - window_seconds)
+        return start_times, window_seconds
+
+    def _build_message_pool(self) -> np.ndarray:
+        templates = self.rng.integers(0, len(self.MESSAGE_TEMPLATES), self.MESSAGE_POOL_SIZE)
+        operations = self.rng.integers(0, len(self.OPERATIONS), self.MESSAGE_POOL_SIZE)
+        numbers = self.rng.integers(1, 100_000, self.MESSAGE_POOL_SIZE)
+        return np.array(
+            [
+                self.MESSAGE_TEMPLATES[t].format(op=self.OPERATIONS[o], n=n, ip=f"10.0.{n % 256}.{n % 7 + 10}")
+                for t, o, n in zip(templates, operations, numbers)
+            ],
+            dtype=object,
+        )
+
+    def create_tables(self, drop: bool = False):
+        """Create the database and tables (dropping existing tables first with `drop`)."""
+        self.client.execute(f"CREATE DATABASE IF NOT EXISTS {self.database}")
+        for table, schema in TABLE_SCHEMAS.items():
+            if drop:
+                self.client.execute(f"DROP TABLE IF EXISTS {self.database}.{table}")
+            self.client.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.database}.{table} ({schema}) "
+                f"ENGINE = MergeTree ORDER BY {TABLE_ORDER_BY[table]}"
+            )
+
+    def insert_columns(self, table: str, columns: Dict[str, Any]) -> int:
+        """
+        Insert columns with a native columnar insert.
+
+        Args:
+            table: Table name
+            columns: Column name -> NumPy array (or list) of values
+
+        Returns:
+            Number of inserted rows
+        """
+        names = list(columns)
+        # tolist() converts NumPy scalars to Python values in C
+        data = [
+            values.tolist() if isinstance(values, np.ndarray) else list(values)
+            for values in columns.values()
+        ]
+        return self.client.execute(
+            f"INSERT INTO {self.database}.{table} ({', '.join(names)}) VALUES",
+            data,
+            columnar=True,
+        )
+
+    def generate_log_batch(self, start_row: int, end_row: int) -> Dict[str, np.ndarray]:
+        """Generate the nu_logs_local columns of rows [start_row, end_row)."""
+        n_rows = end_row - start_row
+        rng = self.rng
+        bundle_indexes = np.searchsorted(self.bundle_row_ends, np.arange(start_row, end_row), side="right")
+
+        component_indexes = rng.choice(len(self.components), n_rows, p=self.component_probabilities)
+        # log lines cluster early in the bundle window (around the incident)
+        offsets = (rng.beta(2.0, 5.0, n_rows) * self.bundle_window_seconds[bundle_indexes]).astype(np.int64)
+        return {
+            "log_bundle_id": self.bundle_ids[bundle_indexes],
+            # raw unix timestamps skip the driver's datetime conversion
+            "event_time": self.bundle_start_times[bundle_indexes] + offsets,
+            "log_level": self.log_levels[rng.choice(len(self.log_levels), n_rows, p=self.LOG_LEVEL_PROBABILITIES)],
+            "filename_without_ext": self.components[component_indexes],
+            "source_log_filename": self.source_log_filenames[
+                component_indexes, rng.integers(0, len(self.FILE_SUFFIXES), n_rows)
+            ],
+            "cvm_ip": self.cvm_ips[bundle_indexes, rng.integers(0, self.NODES_PER_CLUSTER, n_rows)],
+            "message": self.messages[rng.choice(len(self.messages), n_rows, p=self.message_probabilities)],
+            "is_curated": (rng.random(n_rows) < 0.1).astype(np.uint8),
+        }
+
+    def iter_log_batches(self) -> Iterator[Dict[str, np.ndarray]]:
+        total_rows = int(self.bundle_row_ends[-1])
+        for start_row in range(0, total_rows, self.batch_rows):
+            yield self.generate_log_batch(start_row, min(start_row + self.batch_rows, total_rows))
+
+    def seed_logs(self):
+        total_rows = int(self.bundle_row_ends[-1])
+        inserted = 0
+        started_at = time.perf_counter()
+        for batch in self.iter_log_batches():
+            inserted += self.insert_columns("nu_logs_local", batch)
+            elapsed = time.perf_counter() - started_at
+            logger.info(f"nu_logs_local: {inserted:,}/{total_rows:,} rows ({inserted / elapsed:,.0f} rows/s)")
+
+    def seed_metadata(self):
+        self.insert_columns(
+            "nu_metadata",
+            {
+                "id": self.bundle_ids,
+                "is_deleted": (self.rng.random(self.bundles) < self.DELETED_BUNDLE_FRACTION).astype(np.uint8),
+                "created_at": self.bundle_start_times + self.bundle_window_seconds,
+            },
+        )
+
+    def seed_multi_bundles(self):
+        sizes = self.rng.integers(2, 6, self.combos)
+        self.insert_columns(
+            "nu_multi_bundle",
+            {
+                "multi_bundle_id": np.arange(1, self.combos + 1, dtype=np.uint64),
+                "log_bundle_ids": [
+                    self.rng.choice(self.bundle_ids, min(size, self.bundles), replace=False).tolist()
+                    for size in sizes
+                ],
+                "created_at": self.now - self.rng.integers(0, self.days * 86400, self.combos, dtype=np.int64),
+            },
+        )
+
+    def seed_users_and_sessions(self):
+        user_ids = np.array([self.rng.bytes(16).hex() for _ in range(self.users)], dtype=object)
+        self.insert_columns(
+            "nu_users",
+            {
+                "id": user_ids,
+                "email": [f"user{i}@example.com" for i in range(self.users)],
+                "created_at": self.now - self.rng.integers(0, self.days * 86400, self.users, dtype=np.int64),
+            },
+        )
+
+        # one live session per user (what PayloadGenerator needs), plus expired ones
+        n_expired = int(self.users * self.EXPIRED_SESSION_FRACTION)
+        session_user_ids = np.concatenate([user_ids, self.rng.choice(user_ids, n_expired)])
+        expires_at = np.concatenate(
+            [
+                self.now + self.rng.integers(15 * 86400, 60 * 86400, self.users, dtype=np.int64),
+                self.now - self.rng.integers(0, self.days * 86400, n_expired, dtype=np.int64),
+            ]
+        )
+        self.insert_columns(
+            "nu_sessions",
+            {
+                "session_id": [self.rng.bytes(16).hex() for _ in range(len(session_user_ids))],
+                "user_id": session_user_ids,
+                "expires_at": expires_at,
+            },
+        )
+
+    def get_bundle_size_summary(self) -> Dict[str, Any]:
+        """Number of bundles per size tier (`Config.BUNDLE_SIZE_TIERS`)."""
+        lower_bounds = list(config.BUNDLE_SIZE_TIERS.values())
+        tier_indexes = np.searchsorted(lower_bounds, self.bundle_row_counts, side="right") - 1
+        tiers: List[str] = list(config.BUNDLE_SIZE_TIERS)
+        summary = {tier: int((tier_indexes == i).sum()) for i, tier in enumerate(tiers)}
+        summary["below_smallest_tier"] = int((tier_indexes < 0).sum())
+        summary["largest_bundle_rows"] = int(self.bundle_row_counts.max())
+        return summary
+
+    def seed(self, drop: bool = False):
+        """Create the tables and insert the whole dataset."""
+        self.create_tables(drop)
+        logger.info(f"Seeding {self.database}: bundles per size tier {self.get_bundle_size_summary()}")
+        self.seed_metadata()
+        self.seed_multi_bundles()
+        self.seed_users_and_sessions()
+        self.seed_logs()
+        logger.info(f"✅ Seeded {self.database} with {int(self.bundle_row_ends[-1]):,} log rows")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Seed a ClickHouse server with synthetic Panacea data")
+    parser.add_argument("--database", default=config.CLICKHOUSE_DATABASE)
+    parser.add_argument("--log-rows", type=int, default=config.SEED_LOG_ROWS)
+    parser.add_argument("--bundles", type=int, default=config.SEED_BUNDLES)
+    parser.add_argument("--users", type=int, default=config.SEED_USERS)
+    parser.add_argument("--combos", type=int, default=config.SEED_COMBOS)
+    parser.add_argument("--days", type=int, default=config.SEED_DAYS)
+    parser.add_argument("--batch-rows", type=int, default=config.SEED_BATCH_ROWS)
+    parser.add_argument("--bundle-size-alpha", type=float, default=config.SEED_BUNDLE_SIZE_ALPHA)
+    parser.add_argument("--seed", type=int, default=config.SEED_RANDOM_SEED)
+    parser.add_argument("--drop", action="store_true", help="Drop and recreate the tables first")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    client = Client(
+        host=config.CLICKHOUSE_HOST,
+        port=config.CLICKHOUSE_PORT,
+        user=config.CLICKHOUSE_USER,
+        password=config.CLICKHOUSE_PASSWORD,
+    )
+    seeder = SyntheticDataSeeder(
+        client,
+        database=args.database,
+        log_rows=args.log_rows,
+        bundles=args.bundles,
+        users=args.users,
+        combos=args.combos,
+        days=args.days,
+        batch_rows=args.batch_rows,
+        bundle_size_alpha=args.bundle_size_alpha,
+        seed=args.seed,
+    )
+    seeder.seed(drop=args.drop)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
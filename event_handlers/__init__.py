@@ -2,6 +2,6 @@
 Event Handlers package for Panacea Locust Load Testing
 """
 
-from .event_handlers import setup_event_handlers
+from .event_handlers import setup_event_handlers, test_metrics
 
-__all__ = ["setup_event_handlers"]
+__all__ = ["setup_event_handlers", "test_metrics"]
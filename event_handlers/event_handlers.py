@@ -10,11 +10,13 @@ import logging
 import os
 import time
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 from locust import events
+from locust.runners import WorkerRunner
 
 from config import config
+from metrics import SLOEvaluator, group_stats_by_request_path
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -29,6 +31,21 @@ class TestMetrics:
         self.total_users_registered = 0
         self.user_stats = {}
         self.test_config = {}
+        self.slo_report = None
+        self.latency_histograms = {}
+        self.summary_sections = {}
+        self.environment = None
+
+    def register_summary_section(self, name: str, provider: Callable[[], Any]):
+        """
+        Register an extra section for the test summary.
+
+        Args:
+            name: Key of the section in the summary JSON
+            provider: Callable returning the (JSON serializable) section content,
+                evaluated when the summary is built at test stop
+        """
+        self.summary_sections[name] = provider
 
     def record_user_registration(self, user_id: str, user_stats: Dict[str, Any]):
         """Record user registration and stats."""
@@ -42,7 +59,7 @@ class TestMetrics:
         if self.start_time and self.end_time:
             duration = (self.end_time - self.start_time).total_seconds()
 
-        return {
+        summary = {
             "test_duration_seconds": duration,
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "end_time": self.end_time.isoformat() if self.end_time else None,
@@ -50,8 +67,19 @@ class TestMetrics:
             "config": self.test_config,
             "user_distribution": self._get_user_distribution_stats(),
             "bundle_id_coverage": self._get_bundle_id_coverage(),
+            "slo": self.slo_report,
+            # full per-endpoint response time distributions, used by metrics.compare_runs
+            "latency_histograms": self.latency_histograms,
         }
 
+        for name, provider in self.summary_sections.items():
+            try:
+                summary[name] = provider()
+            except Exception as e:
+                logger.error(f"Failed to build summary section '{name}': {e}")
+
+        return summary
+
     def _get_user_distribution_stats(self) -> Dict[str, Any]:
         """Get statistics about user distribution."""
         bundle_ranges = []
@@ -96,8 +124,18 @@ def on_test_start(environment, **kwargs):
     logger.info(
         f"Json Payload loaded into memory in {time.time() - start_time} seconds"
     )
+    # drop key draws and inter-chunk gaps of a previous run (web UI restarts)
+    json_payload.export_key_counts()
+    from streaming import token_stream_reader
+
+    token_stream_reader.reset()
+    # users of this run get the same random streams as in a fresh process
+    from payloads.rng_streams import reset_user_counter
+
+    reset_user_counter()
 
     test_metrics.start_time = datetime.utcnow()
+    test_metrics.environment = environment
 
     # Record test configuration
     test_metrics.test_config = {
@@ -130,6 +168,17 @@ def on_test_stop(environment, **kwargs):
     logger.info("=" * 60)
     logger.info(f"Total Users Registered: {test_metrics.total_users_registered}")
 
+    # Workers only hold their own share of the stats, the master records the
+    # latency distributions and evaluates the SLOs
+    if not isinstance(environment.runner, WorkerRunner):
+        test_metrics.latency_histograms = {
+            name: histogram.to_dict()
+            for name, histogram in group_stats_by_request_path(environment.stats).items()
+        }
+        _evaluate_slos(environment)
+        if config.QUERY_LOG_REPORT:
+            _write_query_log_report()
+
     # Get test summary
     summary = test_metrics.get_summary()
 
@@ -142,6 +191,58 @@ def on_test_stop(environment, **kwargs):
     logger.info("=" * 60)
 
 
+def _evaluate_slos(environment):
+    """
+    Evaluate the per-endpoint SLOs from config against the collected stats and
+    set the process exit code when they fail and SLO_ENFORCE is enabled.
+
+    Args:
+        environment: Locust environment object
+    """
+    try:
+        report = SLOEvaluator(config.SLO_SPEC).evaluate(environment.stats)
+    except Exception as e:
+        logger.error(f"Failed to evaluate SLOs: {e}")
+        return
+
+    test_metrics.slo_report = report
+    logger.info(f"SLO verdicts:\n{SLOEvaluator.format_table(report)}")
+
+    if report["passed"]:
+        logger.info("✅ All SLOs met")
+    else:
+        if report["failed_checks"]:
+            logger.error(f"❌ {report['failed_checks']} SLO check(s) failed")
+        else:
+            logger.error("❌ No SLO endpoint recorded traffic")
+        if config.SLO_ENFORCE:
+            environment.process_exit_code = config.SLO_FAIL_EXIT_CODE
+
+
+def _write_query_log_report():
+    """
+    Write the system.query_log correlation report of the test window to the
+    results directory. Failures are logged, they never fail the test.
+    """
+    try:
+        from database import clickhouse_dao
+        from database.query_log_report import QueryLogReporter
+        from payloads.json_payload import json_payload
+
+        reporter = QueryLogReporter(clickhouse_dao, config.QUERY_LOG_ENDPOINTS, config.QUERY_LOG_TOP_QUERIES)
+        report = reporter.build_report(
+            test_metrics.start_time,
+            test_metrics.end_time,
+            user=config.QUERY_LOG_USER,
+            session_ids=json_payload.get_session_ids() if config.QUERY_LOG_MATCH_SESSIONS else None,
+        )
+        logger.info(f"🗄️ ClickHouse queries during the test:\n{QueryLogReporter.format_table(report)}")
+        filepath = QueryLogReporter.save_report(report)
+        logger.info(f"🗄️ Query log report saved to: {filepath}")
+    except Exception as e:
+        logger.error(f"Failed to build the query log report: {e}")
+
+
 def on_spawning_complete(*args, **kwargs):
     """
     Called when all users have been spawned.
@@ -200,6 +301,56 @@ def on_request(
         )
 
 
+def on_report_to_master(client_id, data, **kwargs):
+    """
+    Attach worker-local metrics to the report sent to the master.
+
+    Args:
+        client_id: Worker client id
+        data: Report data dictionary to extend
+        **kwargs: Additional keyword arguments
+    """
+    from payloads.json_payload import json_payload
+    from streaming import token_stream_reader
+
+    data["key_counts"] = json_payload.export_key_counts()
+    data["inter_chunk_gaps"] = token_stream_reader.export_results()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    """
+    Merge worker-local metrics received by the master.
+
+    Args:
+        client_id: Worker client id
+        data: Report data dictionary
+        **kwargs: Additional keyword arguments
+    """
+    from payloads.json_payload import json_payload
+    from streaming import token_stream_reader
+
+    if "key_counts" in data:
+        json_payload.import_key_counts(data["key_counts"])
+    if "inter_chunk_gaps" in data:
+        token_stream_reader.import_results(data["inter_chunk_gaps"])
+
+
+def _get_key_frequency_histogram() -> Dict[str, Any]:
+    """Get the realized bundle/combo/session id frequencies for the summary."""
+    from payloads.json_payload import json_payload
+
+    return json_payload.get_key_frequency_histogram()
+
+
+def _get_llm_streaming_summary() -> Dict[str, Any]:
+    """Get TTFT / inter-chunk gap / output throughput per LLM endpoint for the summary."""
+    from streaming import token_stream_reader
+
+    if test_metrics.environment is None or isinstance(test_metrics.environment.runner, WorkerRunner):
+        return {}
+    return token_stream_reader.get_summary(test_metrics.environment.stats)
+
+
 def _save_test_summary(summary: Dict[str, Any]):
     """
     Save test summary to a JSON file.
@@ -236,5 +387,9 @@ def setup_event_handlers():
     events.test_stop.add_listener(on_test_stop)
     events.spawning_complete.add_listener(on_spawning_complete)
     events.request.add_listener(on_request)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("key_frequencies", _get_key_frequency_histogram)
+    test_metrics.register_summary_section("llm_streaming", _get_llm_streaming_summary)
 
     logger.info("🔧 Event handlers registered successfully")
@@ -0,0 +1,15 @@
+"""
+Log bundle ingestion package for Panacea Locust Load Testing
+"""
+
+from .bundle_fixtures import BundleFixture, BundleFixtureSet, bundle_fixture_set
+from .ingestion_tracker import IngestionTracker, ingestion_tracker, setup_ingestion_event_handlers
+
+__all__ = [
+    "BundleFixture",
+    "BundleFixtureSet",
+    "IngestionTracker",
+    "bundle_fixture_set",
+    "ingestion_tracker",
+    "setup_ingestion_event_handlers",
+]
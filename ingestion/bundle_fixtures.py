@@ -0,0 +1,111 @@
+"""
+Bundle Fixtures for Panacea Locust Load Testing
+
+This module loads the local log bundle fixture set the ingestion user submits
+for analysis, classifies the bundles by file size and samples them by size
+class weight.
+"""
+
+import logging
+import random
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import config
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class BundleFixture:
+    """A log bundle file of the fixture set."""
+
+    def __init__(self, local_path: Path, remote_path: str, size_bytes: int, size_class: str):
+        self.local_path = local_path
+        self.remote_path = remote_path
+        self.size_bytes = size_bytes
+        self.size_class = size_class
+
+
+class BundleFixtureSet:
+    """
+    Log bundle fixtures grouped by size class.
+
+    A bundle belongs to the last size class whose lower bound (bytes) its file
+    size reaches. The server reads the bundles from `remote_path_prefix` (the
+    location the fixture directory is mounted or uploaded to on the Panacea
+    side), which replaces the local fixture directory in the submitted paths.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        patterns: List[str],
+        size_classes: Dict[str, int],
+        size_weights: Dict[str, float],
+        remote_path_prefix: str = "",
+    ):
+        """
+        Args:
+            directory: Local fixture directory (searched recursively)
+            patterns: File name patterns of the bundles (e.g. "*.zip")
+            size_classes: Ordered mapping of size class name to its lower bound (bytes)
+            size_weights: Size class -> sampling weight
+            remote_path_prefix: Bundle path prefix on the server (default: the local directory)
+        """
+        self.directory = Path(directory) if directory else None
+        self.size_classes = dict(size_classes)
+        self.size_weights = size_weights
+        self.remote_path_prefix = remote_path_prefix
+        self.fixtures: Dict[str, List[BundleFixture]] = {}
+        if self.directory is not None:
+            self._load(patterns)
+
+    def _load(self, patterns: List[str]):
+        paths = sorted({path for pattern in patterns for path in self.directory.rglob(pattern) if path.is_file()})
+        for path in paths:
+            size_bytes = path.stat().st_size
+            size_class = self.get_size_class(size_bytes)
+            self.fixtures.setdefault(size_class, []).append(
+                BundleFixture(path, self._get_remote_path(path), size_bytes, size_class)
+            )
+        logger.info(
+            f"Loaded {len(paths)} bundle fixtures from {self.directory}: "
+            f"{ {size_class: len(fixtures) for size_class, fixtures in self.fixtures.items()} }"
+        )
+
+    def _get_remote_path(self, path: Path) -> str:
+        if not self.remote_path_prefix:
+            return str(path.resolve())
+        relative_path = path.relative_to(self.directory).as_posix()
+        return f"{self.remote_path_prefix.rstrip('/')}/{relative_path}"
+
+    def get_size_class(self, size_bytes: int) -> str:
+        size_class = next(iter(self.size_classes))
+        for name, lower_bound in self.size_classes.items():
+            if size_bytes >= lower_bound:
+                size_class = name
+        return size_class
+
+    def __len__(self) -> int:
+        return sum(len(fixtures) for fixtures in self.fixtures.values())
+
+    def sample(self, rng=random) -> Optional[BundleFixture]:
+        """Pick a size class by weight (among classes with fixtures), then one of its bundles."""
+        size_classes = [
+            size_class for size_class in self.fixtures if self.size_weights.get(size_class, 0) > 0
+        ]
+        if not size_classes:
+            return None
+        size_class = rng.choices(size_classes, weights=[self.size_weights[c] for c in size_classes])[0]
+        return rng.choice(self.fixtures[size_class])
+
+
+# Global bundle fixture set instance
+bundle_fixture_set = BundleFixtureSet(
+    config.INGESTION_FIXTURE_DIR,
+    config.INGESTION_FIXTURE_PATTERNS,
+    config.INGESTION_BUNDLE_SIZE_CLASSES,
+    config.INGESTION_SIZE_WEIGHTS,
+    remote_path_prefix=config.INGESTION_REMOTE_PATH_PREFIX,
+)
@@ -0,0 +1,163 @@
+"""
+Ingestion Tracker for Panacea Locust Load Testing
+
+This module collects the outcome of every bundle the ingestion user submits
+(time from the analyze request until the bundle is queryable, timeouts and
+failed analyses) per bundle size class, and reports ingestion throughput and
+time-to-queryable percentiles in the test summary.
+"""
+
+import logging
+import time
+from typing import Any, Dict
+
+from locust import events
+
+from config import config
+from event_handlers import test_metrics
+from metrics import LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class IngestionTracker:
+    """
+    Per size class time-to-queryable histograms and submitted / ingested byte counters.
+
+    Every finished bundle is one histogram entry; bundles that timed out or
+    whose analysis failed are recorded as failures with the time they took.
+    """
+
+    COUNTERS = ("submitted", "bytes_submitted", "bytes_queryable")
+
+    def __init__(self, size_classes: Dict[str, int]):
+        """
+        Args:
+            size_classes: Ordered mapping of size class name to its lower bound (bytes)
+        """
+        self.size_classes = dict(size_classes)
+        self.started_at = None
+        # size class -> histogram / counters
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def reset(self):
+        self.started_at = time.time()
+        self.histograms = {}
+        self.counters = {}
+
+    def _get_counters(self, size_class: str) -> Dict[str, int]:
+        return self.counters.setdefault(size_class, dict.fromkeys(self.COUNTERS, 0))
+
+    def record_submitted(self, size_class: str, size_bytes: int):
+        counters = self._get_counters(size_class)
+        counters["submitted"] += 1
+        counters["bytes_submitted"] += size_bytes
+
+    def record_finished(self, size_class: str, size_bytes: int, time_to_queryable: float, queryable: bool):
+        """
+        Record a finished bundle.
+
+        Args:
+            size_class: Size class of the bundle
+            size_bytes: Bundle file size
+            time_to_queryable: Milliseconds from the analyze request until the bundle
+                was queryable (or until it timed out / failed)
+            queryable: Whether the bundle became queryable
+        """
+        self.histograms.setdefault(size_class, LatencyHistogram()).record(time_to_queryable, not queryable)
+        if queryable:
+            self._get_counters(size_class)["bytes_queryable"] += size_bytes
+
+    def export_results(self) -> Dict[str, Any]:
+        """Serialize and clear the collected results (for worker -> master reports)."""
+        exported = {
+            "histograms": {size_class: histogram.to_dict() for size_class, histogram in self.histograms.items()},
+            "counters": self.counters,
+        }
+        self.histograms = {}
+        self.counters = {}
+        return exported
+
+    def import_results(self, data: Dict[str, Any]):
+        """Merge results exported by a worker."""
+        for size_class, histogram in data["histograms"].items():
+            self.histograms.setdefault(size_class, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+        for size_class, counters in data["counters"].items():
+            merged = self._get_counters(size_class)
+            for counter, value in counters.items():
+                merged[counter] += value
+
+    def _get_size_class_order(self, size_class: str) -> int:
+        size_classes = list(self.size_classes)
+        return size_classes.index(size_class) if size_class in size_classes else len(size_classes)
+
+    @staticmethod
+    def _get_throughput(histogram: LatencyHistogram, counters: Dict[str, int], duration: float) -> Dict[str, Any]:
+        queryable = histogram.num_requests - histogram.num_failures
+        return {
+            "submitted": counters["submitted"],
+            "queryable": queryable,
+            "failed_or_timed_out": histogram.num_failures,
+            "in_flight": counters["submitted"] - histogram.num_requests,
+            "bundles_per_minute": round(queryable * 60 / duration, 3) if duration else None,
+            "mb_per_second": round(counters["bytes_queryable"] / 1e6 / duration, 3) if duration else None,
+        }
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get ingestion throughput and time-to-queryable latency, overall and per size class."""
+        duration = time.time() - self.started_at if self.started_at else None
+        by_size_class = []
+        size_classes = sorted(set(self.histograms) | set(self.counters), key=self._get_size_class_order)
+        for size_class in size_classes:
+            histogram = self.histograms.get(size_class, LatencyHistogram())
+            counters = self._get_counters(size_class)
+            by_size_class.append(
+                {
+                    "size_class": size_class,
+                    "min_bytes": self.size_classes.get(size_class),
+                    **self._get_throughput(histogram, counters, duration),
+                    "time_to_queryable": histogram.get_summary(),
+                }
+            )
+        total_histogram = LatencyHistogram.merge_all(list(self.histograms.values()))
+        total_counters = {
+            counter: sum(counters[counter] for counters in self.counters.values()) for counter in self.COUNTERS
+        }
+        return {
+            "duration_seconds": round(duration, 1) if duration else None,
+            **self._get_throughput(total_histogram, total_counters, duration),
+            "time_to_queryable": total_histogram.get_summary(),
+            "by_size_class": by_size_class,
+        }
+
+
+# Global ingestion tracker instance
+ingestion_tracker = IngestionTracker(config.INGESTION_BUNDLE_SIZE_CLASSES)
+
+
+def on_test_start(environment, **kwargs):
+    ingestion_tracker.reset()
+
+
+def on_report_to_master(client_id, data, **kwargs):
+    data["ingestion_results"] = ingestion_tracker.export_results()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    if "ingestion_results" in data:
+        ingestion_tracker.import_results(data["ingestion_results"])
+
+
+def setup_ingestion_event_handlers():
+    """
+    Register the ingestion event handlers with Locust and add ingestion
+    throughput and time-to-queryable to the test summary.
+    """
+    events.test_start.add_listener(on_test_start)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("ingestion", ingestion_tracker.get_summary)
+
+    logger.info("🔧 Ingestion event handlers registered successfully")
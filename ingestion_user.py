@@ -0,0 +1,154 @@
+"""
+Ingestion User for Panacea Locust Load Testing
+
+This module contains a user that exercises the write path: it submits log
+bundles of the local fixture set to the analyze endpoint and polls the logs
+info endpoint until each bundle is queryable. Time-to-queryable is reported
+as request type TTQ under the analyze endpoint's name, and per size class in
+the test summary. It runs next to the read users, so read latency can be
+measured while ingestion is going on.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from locust import between, task
+
+from config import config
+from connections import get_request_timeout
+from ingestion import bundle_fixture_set, ingestion_tracker
+from panacea_user import PanaceaBaseUser
+from payloads.api_payloads.log_ingestion.analyze import LogsAnalyzeAPI
+from payloads.api_payloads.rca_summary.logs_info import LogsInfoAPI
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+TIME_TO_QUERYABLE_REQUEST_TYPE = "TTQ"
+
+
+def _get_response_field(body: Any, field: str) -> Any:
+    """Get a field of a JSON response body, at the top level or under "data"."""
+    if not isinstance(body, dict):
+        return None
+    if field in body:
+        return body[field]
+    data = body.get("data")
+    return data.get(field) if isinstance(data, dict) else None
+
+
+class PanaceaIngestionUser(PanaceaBaseUser):
+    """
+    Virtual user submitting bundle fixtures for analysis, one bundle at a time.
+
+    `INGESTION_USERS` of these users are spawned before the read users
+    (Locust `fixed_count`), so the ingestion load does not change with the
+    user count of the run.
+    """
+
+    wait_time = between(config.INGESTION_WAIT_MIN, config.INGESTION_WAIT_MAX)
+    fixed_count = config.INGESTION_USERS
+
+    def on_start(self):
+        super().on_start()
+        self.info_api = LogsInfoAPI(rng=self.get_rng("logs-info"))
+
+    @task
+    def ingest_bundle(self):
+        fixture = bundle_fixture_set.sample(self.get_rng("ingestion"))
+        if fixture is None:
+            logger.warning(f"No bundle fixtures to ingest in {config.INGESTION_FIXTURE_DIR!r}")
+            return
+        api = LogsAnalyzeAPI(fixture, rng=self.get_rng("ingestion"))
+
+        start_time = time.perf_counter()
+        # the bundle id is read from the body, so stream mode must not discard it
+        response = self.send_api_request(api, keep_body=True)
+        ingestion_tracker.record_submitted(fixture.size_class, fixture.size_bytes)
+
+        bundle_id = self._get_bundle_id(response) if response.ok else None
+        if bundle_id is None:
+            exception = Exception(f"No {config.INGESTION_BUNDLE_ID_FIELD} in analyze response ({response.status_code})")
+        else:
+            exception = self.wait_until_queryable(bundle_id, start_time)
+
+        time_to_queryable = (time.perf_counter() - start_time) * 1000
+        ingestion_tracker.record_finished(fixture.size_class, fixture.size_bytes, time_to_queryable, exception is None)
+        self.environment.events.request.fire(
+            request_type=TIME_TO_QUERYABLE_REQUEST_TYPE,
+            name=api.get_api_endpoint(),
+            response_time=time_to_queryable,
+            response_length=fixture.size_bytes,
+            exception=exception,
+            context=api.get_request_context(),
+        )
+
+    @staticmethod
+    def _get_bundle_id(response) -> Optional[Any]:
+        try:
+            return _get_response_field(response.json(), config.INGESTION_BUNDLE_ID_FIELD)
+        except ValueError:
+            return None
+
+    def wait_until_queryable(self, bundle_id, start_time: float) -> Optional[Exception]:
+        """
+        Poll the logs info endpoint until the bundle is queryable.
+
+        Args:
+            bundle_id: Bundle id returned by the analyze request
+            start_time: perf_counter() of the analyze request
+
+        Returns:
+            None once the bundle is queryable, else the exception of the failed
+            analysis or the timeout
+        """
+        while True:
+            status = self.poll_bundle_status(bundle_id)
+            if status is True:
+                return None
+            if status is False:
+                return Exception(f"Analysis of bundle {bundle_id} failed")
+            if time.perf_counter() - start_time > config.INGESTION_QUERYABLE_TIMEOUT_SECONDS:
+                return Exception(
+                    f"Bundle {bundle_id} not queryable after {config.INGESTION_QUERYABLE_TIMEOUT_SECONDS}s"
+                )
+            time.sleep(config.INGESTION_POLL_INTERVAL_SECONDS)
+
+    def poll_bundle_status(self, bundle_id) -> Optional[bool]:
+        """
+        Get the ingestion status of a bundle from the logs info endpoint.
+
+        Polls are grouped under their own name, so they do not mix with the
+        logs info requests of the read users. A not yet known bundle (HTTP
+        error) is pending, not a failure.
+
+        Returns:
+            True when queryable, False when the analysis failed, None while pending
+        """
+        self.info_api.bundle_id = bundle_id
+        payload = self.info_api.get_payload(LogsInfoAPI.PayloadTypes.BUNDLE_ID_ONLY)
+        url = self.info_api.get_api_endpoint()
+        with self.client.get(
+            url,
+            params=payload,
+            name=f"{url} (ingestion poll)",
+            catch_response=True,
+            timeout=get_request_timeout(),
+        ) as response:
+            response.success()
+            if not response.ok:
+                return None
+            try:
+                body: Dict[str, Any] = response.json()
+            except ValueError:
+                return None
+
+        status = _get_response_field(body, config.INGESTION_STATUS_FIELD)
+        if status is not None and str(status).lower() in config.INGESTION_FAILED_STATUSES:
+            return False
+        if not isinstance(body, dict) or body.get("api_status") != "success":
+            return None
+        if status is None or str(status).lower() in config.INGESTION_READY_STATUSES:
+            return True
+        return None
@@ -0,0 +1,7 @@
+"""
+Load shapes package for Panacea Locust Load Testing
+"""
+
+from .step_load_shape import StepLoadShape
+
+__all__ = ["StepLoadShape"]
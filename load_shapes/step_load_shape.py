@@ -0,0 +1,171 @@
+"""
+Step Load Shape for Panacea Locust Load Testing
+
+This module contains a load shape that adds users in fixed steps, checks
+per-endpoint p95/p99 latency and error rate over each step window and stops
+at the first step that breaches the SLO, reporting the last good step as the
+capacity of the Panacea API.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from locust import LoadTestShape
+
+from config import config
+from event_handlers import test_metrics
+from metrics import HTTP_METHODS, LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class StepLoadShape(LoadTestShape):
+    """
+    Step-wise user ramp with automatic capacity knee detection.
+
+    Each step runs `STEP_LOAD_STEP_SECONDS`; the first `STEP_LOAD_WARMUP_SECONDS`
+    of a step are ignored so the spawn ramp does not pollute the window. Step
+    windows are computed as deltas of the runner's cumulative stats, so this
+    works the same on a local runner and on a distributed master.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._reset_state()
+        test_metrics.register_summary_section("capacity", self.get_summary)
+
+    def _reset_state(self):
+        self.steps = []
+        self.capacity = None
+        self.stop_reason = None
+        self._current_step = 0
+        self._window_snapshot = None
+        self._window_start_time = None
+        self._stopped = False
+
+    def reset_time(self):
+        super().reset_time()
+        self._reset_state()
+
+    def get_step_users(self, step: int) -> int:
+        return config.STEP_LOAD_START_USERS + step * config.STEP_LOAD_USERS_INCREMENT
+
+    def tick(self):
+        if self._stopped:
+            return None
+
+        run_time = self.get_run_time()
+        step = int(run_time // config.STEP_LOAD_STEP_SECONDS)
+
+        if step != self._current_step:
+            step_report = self._evaluate_step(self._current_step)
+            if step_report is not None and not step_report["slo_ok"]:
+                self._stop(f"SLO breached at step {self._current_step}: {step_report['breaches']}")
+                return None
+            self._current_step = step
+            self._window_snapshot = None
+
+        users = self.get_step_users(step)
+        if users > config.STEP_LOAD_MAX_USERS:
+            self._stop(f"Reached STEP_LOAD_MAX_USERS={config.STEP_LOAD_MAX_USERS} without SLO breach")
+            return None
+
+        step_elapsed = run_time - step * config.STEP_LOAD_STEP_SECONDS
+        if self._window_snapshot is None and step_elapsed >= config.STEP_LOAD_WARMUP_SECONDS:
+            self._window_snapshot = self._snapshot_stats()
+            self._window_start_time = time.time()
+
+        return users, config.STEP_LOAD_SPAWN_RATE
+
+    def _stop(self, reason: str):
+        self._stopped = True
+        self.stop_reason = reason
+        logger.info(f"📈 Step load stopped: {reason}")
+        if self.capacity:
+            logger.info(
+                f"📈 Capacity: {self.capacity['users']} users, {self.capacity['rps']} req/s (step {self.capacity['step']})"
+            )
+        else:
+            logger.warning("📈 No step met the SLO, capacity is below the first step")
+
+    def _snapshot_stats(self) -> Dict[Any, LatencyHistogram]:
+        snapshot = {
+            f"{method} {name}": LatencyHistogram.from_stats_entry(entry)
+            for (name, method), entry in self.runner.stats.entries.items()
+        }
+        # custom metrics (TTFB, TRANSFER, ...) are reported per step but neither aggregated nor checked
+        snapshot["Aggregated"] = LatencyHistogram.merge_all(
+            [
+                histogram
+                for key, histogram in snapshot.items()
+                if key.split(" ", 1)[0] in HTTP_METHODS
+            ]
+        )
+        return snapshot
+
+    def _evaluate_step(self, step: int) -> Optional[Dict[str, Any]]:
+        """Compute the stats of a finished step window and check them against the SLO."""
+        if self._window_snapshot is None:
+            return None
+
+        window_seconds = time.time() - self._window_start_time
+        current = self._snapshot_stats()
+        endpoints = {}
+        breaches = []
+        for key, histogram in current.items():
+            window = histogram.subtract(self._window_snapshot.get(key, LatencyHistogram()))
+            if not window.num_requests:
+                continue
+            endpoints[key] = window.get_summary(window_seconds)
+            if key.split(" ", 1)[0] not in HTTP_METHODS or window.num_requests < config.STEP_LOAD_MIN_REQUESTS:
+                continue
+            p95 = window.get_percentile(0.95)
+            p99 = window.get_percentile(0.99)
+            if p95 > config.STEP_LOAD_SLO_P95_MS:
+                breaches.append(f"{key} p95 {p95}ms > {config.STEP_LOAD_SLO_P95_MS}ms")
+            if p99 > config.STEP_LOAD_SLO_P99_MS:
+                breaches.append(f"{key} p99 {p99}ms > {config.STEP_LOAD_SLO_P99_MS}ms")
+            if window.get_error_rate() > config.STEP_LOAD_SLO_MAX_ERROR_RATE:
+                breaches.append(
+                    f"{key} error rate {window.get_error_rate():.4f} > {config.STEP_LOAD_SLO_MAX_ERROR_RATE}"
+                )
+
+        users = self.get_step_users(step)
+        aggregate = endpoints.pop("Aggregated", LatencyHistogram().get_summary(window_seconds))
+        step_report = {
+            "step": step,
+            "users": users,
+            "offered_rps": round(users * config.USER_TARGET_RPS, 3) if config.USER_TARGET_RPS > 0 else None,
+            "window_seconds": round(window_seconds, 2),
+            "aggregate": aggregate,
+            "endpoints": endpoints,
+            "breaches": breaches,
+            "slo_ok": not breaches,
+        }
+        self.steps.append(step_report)
+
+        logger.info(
+            f"📈 Step {step}: {users} users, {aggregate.get('rps')} req/s, "
+            f"p95 {aggregate['p95_ms']}ms, p99 {aggregate['p99_ms']}ms - "
+            f"{'OK' if not breaches else 'SLO BREACHED'}"
+        )
+
+        if not breaches:
+            self.capacity = {"step": step, "users": users, "rps": aggregate.get("rps")}
+        return step_report
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the capacity found and the per-step curve for the test summary."""
+        return {
+            "slo": {
+                "p95_ms": config.STEP_LOAD_SLO_P95_MS,
+                "p99_ms": config.STEP_LOAD_SLO_P99_MS,
+                "max_error_rate": config.STEP_LOAD_SLO_MAX_ERROR_RATE,
+                "min_requests": config.STEP_LOAD_MIN_REQUESTS,
+            },
+            "capacity": self.capacity,
+            "stop_reason": self.stop_reason,
+            "steps": self.steps,
+        }
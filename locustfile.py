@@ -13,9 +13,34 @@ from config import config
 
 # Import event handlers and set them up
 from event_handlers import setup_event_handlers
-from panacea_user import PanaceaAPIUser
+from bundle_tiers import setup_bundle_tier_event_handlers
+from profiling import setup_sampling_profiler_event_handlers
 
+# Import the user classes (and load shape) for the selected load shape
+if config.LOAD_SHAPE == "sweep":
+    from sweep import LogViewerSweepShape, LogViewerSweepUser, setup_sweep_event_handlers
+else:
+    if config.PAYLOAD_CORPUS_FILE:
+        from corpus_user import PanaceaCorpusUser, setup_corpus_event_handlers
+    else:
+        from panacea_user import PanaceaAPIUser
 
+    if config.LOAD_SHAPE == "step":
+        from load_shapes import StepLoadShape
+    if config.CLICKHOUSE_LOAD_USER:
+        from clickhouse_user import ClickHouseDirectUser, setup_clickhouse_user_event_handlers
+    if config.INGESTION_USERS:
+        from ingestion import setup_ingestion_event_handlers
+        from ingestion_user import PanaceaIngestionUser
+
+if config.ASK_AI_CONVERSATION_MODE:
+    from conversation import setup_conversation_event_handlers
+if config.MEMORY_PROFILE:
+    from profiling import setup_memory_profiler_event_handlers
+if config.PAYLOAD_REPLAY:
+    from replay import setup_payload_replay_event_handlers
+if config.SESSION_CHURN_POLICY != "sticky":
+    from sessions import setup_session_event_handlers
 
 # Configure logging
 log_level = os.getenv("LOCUST_LOG_LEVEL", "INFO").upper()
@@ -27,12 +52,42 @@ logger = logging.getLogger(__name__)
 
 # Setup event handlers for monitoring and metrics
 setup_event_handlers()
+setup_bundle_tier_event_handlers()
+setup_sampling_profiler_event_handlers()
+if config.LOAD_SHAPE == "sweep":
+    setup_sweep_event_handlers()
+if config.ASK_AI_CONVERSATION_MODE:
+    setup_conversation_event_handlers()
+if config.MEMORY_PROFILE:
+    setup_memory_profiler_event_handlers()
+if config.LOAD_SHAPE != "sweep" and config.PAYLOAD_CORPUS_FILE:
+    setup_corpus_event_handlers()
+if config.PAYLOAD_REPLAY:
+    setup_payload_replay_event_handlers()
+if config.SESSION_CHURN_POLICY != "sticky":
+    setup_session_event_handlers()
+if config.LOAD_SHAPE != "sweep" and config.CLICKHOUSE_LOAD_USER:
+    setup_clickhouse_user_event_handlers()
+if config.LOAD_SHAPE != "sweep" and config.INGESTION_USERS:
+    setup_ingestion_event_handlers()
 
 # Log framework initialization
 logger.info("🚀 Panacea Locust Framework Initialized")
 
 # Export user classes for Locust to discover
 # Locust will automatically find these classes and use their weights
-__all__ = [
-    "PanaceaAPIUser",
-]
+if config.LOAD_SHAPE == "sweep":
+    __all__ = [
+        "LogViewerSweepUser",
+        "LogViewerSweepShape",
+    ]
+else:
+    __all__ = [
+        "PanaceaCorpusUser" if config.PAYLOAD_CORPUS_FILE else "PanaceaAPIUser",
+    ]
+    if config.LOAD_SHAPE == "step":
+        __all__.append("StepLoadShape")
+    if config.CLICKHOUSE_LOAD_USER:
+        __all__.append("ClickHouseDirectUser")
+    if config.INGESTION_USERS:
+        __all__.append("PanaceaIngestionUser")
@@ -0,0 +1,14 @@
+"""
+Metrics package for Panacea Locust Load Testing
+"""
+
+from .latency_histogram import LatencyHistogram
+from .slo import HTTP_METHODS, SLOEvaluator, group_stats_by_request_path, normalize_request_name
+
+__all__ = [
+    "HTTP_METHODS",
+    "LatencyHistogram",
+    "SLOEvaluator",
+    "group_stats_by_request_path",
+    "normalize_request_name",
+]
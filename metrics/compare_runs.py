@@ -0,0 +1,360 @@
+"""
+Run Comparison for Panacea Locust Load Testing
+
+This module compares the per-endpoint latency distributions of a baseline
+and a candidate test summary (results/test_summary_*.json), reports deltas
+with bootstrap confidence intervals and a Mann-Whitney U test, and flags
+regressions beyond a configurable tolerance.
+
+Usage:
+    python -m metrics.compare_runs results/test_summary_A.json results/test_summary_B.json \
+        --tolerance 0.1 --metrics p95,p99 --output results/comparison.json
+
+    python -m metrics.compare_runs --self-check
+
+Exits with status 1 when a regression is found (or the self-check fails).
+"""
+
+import argparse
+import json
+import logging
+import math
+import sys
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from config import config
+from metrics.latency_histogram import LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+METRIC_PERCENTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+
+def load_latency_histograms(path: str) -> Dict[str, LatencyHistogram]:
+    """
+    Load the per-endpoint latency histograms of a test summary.
+
+    Args:
+        path: Path of a test_summary_*.json file
+
+    Returns:
+        Dictionary mapping request path to its histogram
+
+    Raises:
+        ValueError: If the summary predates latency histogram recording
+    """
+    with open(path) as f:
+        summary = json.load(f)
+    if not summary.get("latency_histograms"):
+        raise ValueError(f"{path} has no latency_histograms, it cannot be compared")
+    return {
+        name: LatencyHistogram.from_dict(histogram)
+        for name, histogram in summary["latency_histograms"].items()
+    }
+
+
+class RunComparator:
+    """
+    Compares baseline and candidate latency distributions endpoint by endpoint.
+
+    Percentile and mean deltas get bootstrap confidence intervals computed by
+    resampling the recorded histogram counts (multinomial draws of the run's
+    own request count over its buckets). The verdict of every metric comes
+    from its own interval (see `is_regression`). The overall shift is also
+    tested with a one-sided Mann-Whitney U test computed directly on the
+    histogram buckets; it is reported per endpoint but does not decide the
+    verdict, since a small significant shift says nothing about a percentile.
+    """
+
+    def __init__(
+        self,
+        tolerance: float = config.REGRESSION_TOLERANCE,
+        confidence: float = config.REGRESSION_CONFIDENCE,
+        bootstrap_iterations: int = config.REGRESSION_BOOTSTRAP_ITERATIONS,
+        metrics: List[str] = None,
+        seed: Optional[int] = 0,
+        strict: bool = config.REGRESSION_STRICT,
+    ):
+        self.tolerance = tolerance
+        self.strict = strict
+        self.confidence = confidence
+        self.bootstrap_iterations = bootstrap_iterations
+        self.metrics = metrics or ["p50", "p95", "p99", "mean"]
+        self.rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def _get_resampled_metric(buckets: np.ndarray, counts: np.ndarray, metric: str) -> np.ndarray:
+        """Metric of every resampled histogram (one row of `counts` per bootstrap iteration)."""
+        num_requests = counts.sum(axis=1)
+        if metric == "mean":
+            return counts @ buckets / num_requests
+        # same rule as LatencyHistogram.get_percentile: first bucket reaching the target count
+        reached = counts.cumsum(axis=1) >= (num_requests * METRIC_PERCENTILES[metric])[:, None]
+        return buckets[reached.argmax(axis=1)]
+
+    @staticmethod
+    def _get_histogram_metric(histogram: LatencyHistogram, metric: str) -> float:
+        if metric == "mean":
+            return histogram.get_average()
+        return histogram.get_percentile(METRIC_PERCENTILES[metric])
+
+    def _resample(self, histogram: LatencyHistogram):
+        """Bootstrap resamples of a histogram: `bootstrap_iterations` x buckets count matrix."""
+        buckets = np.array(sorted(histogram.response_times), dtype=float)
+        counts = np.array([histogram.response_times[int(bucket)] for bucket in buckets], dtype=float)
+        resampled = self.rng.multinomial(int(counts.sum()), counts / counts.sum(), size=self.bootstrap_iterations)
+        return buckets, resampled
+
+    def _bootstrap_relative_delta(self, baseline: LatencyHistogram, candidate: LatencyHistogram):
+        """Bootstrap confidence interval of (candidate - baseline) / baseline per metric."""
+        baseline_buckets, baseline_counts = self._resample(baseline)
+        candidate_buckets, candidate_counts = self._resample(candidate)
+
+        alpha = 1.0 - self.confidence
+        intervals = {}
+        for metric in self.metrics:
+            baseline_values = self._get_resampled_metric(baseline_buckets, baseline_counts, metric)
+            candidate_values = self._get_resampled_metric(candidate_buckets, candidate_counts, metric)
+            valid = baseline_values > 0
+            if not valid.any():
+                intervals[metric] = (None, None)
+                continue
+            deltas = (candidate_values[valid] - baseline_values[valid]) / baseline_values[valid]
+            low, high = np.quantile(deltas, [alpha / 2, 1 - alpha / 2])
+            intervals[metric] = (float(low), float(high))
+        return intervals
+
+    @staticmethod
+    def mann_whitney_u(baseline: LatencyHistogram, candidate: LatencyHistogram) -> Dict[str, float]:
+        """
+        One-sided Mann-Whitney U test (candidate slower than baseline) with tie
+        correction, using the histogram buckets as tied ranks.
+        """
+        n_baseline = baseline.num_requests
+        n_candidate = candidate.num_requests
+        n_total = n_baseline + n_candidate
+
+        rank = 0
+        candidate_rank_sum = 0.0
+        tie_term = 0
+        for bucket in sorted(set(baseline.response_times) | set(candidate.response_times)):
+            baseline_count = baseline.response_times.get(bucket, 0)
+            candidate_count = candidate.response_times.get(bucket, 0)
+            ties = baseline_count + candidate_count
+            average_rank = rank + (ties + 1) / 2
+            candidate_rank_sum += candidate_count * average_rank
+            tie_term += ties**3 - ties
+            rank += ties
+
+        u_candidate = candidate_rank_sum - n_candidate * (n_candidate + 1) / 2
+        mean_u = n_baseline * n_candidate / 2
+        variance_u = n_baseline * n_candidate / 12 * ((n_total + 1) - tie_term / (n_total * (n_total - 1)))
+        if variance_u <= 0:
+            return {"u": u_candidate, "z": 0.0, "p_value": 1.0}
+        z = (u_candidate - mean_u) / math.sqrt(variance_u)
+        p_value = 0.5 * math.erfc(z / math.sqrt(2))
+        return {"u": u_candidate, "z": round(z, 4), "p_value": p_value}
+
+    def is_regression(self, ci_low: Optional[float], ci_high: Optional[float]) -> bool:
+        """
+        Verdict of a metric from the bootstrap confidence interval of its relative delta.
+
+        The metric got worse (the interval excludes zero) and the regression
+        can reach the tolerance (the interval reaches past it), so a true
+        shift of the tolerance's size is flagged. In strict mode the whole
+        interval must be beyond the tolerance, so only regressions clearly
+        larger than the tolerance are flagged.
+        """
+        if ci_low is None:
+            return False
+        if self.strict:
+            return ci_low > self.tolerance
+        return ci_low > 0 and ci_high > self.tolerance
+
+    def compare_endpoint(self, baseline: LatencyHistogram, candidate: LatencyHistogram) -> Dict[str, Any]:
+        intervals = self._bootstrap_relative_delta(baseline, candidate)
+        mann_whitney = self.mann_whitney_u(baseline, candidate)
+        mann_whitney["significant"] = mann_whitney["p_value"] < 1.0 - self.confidence
+        metrics = {}
+        for metric in self.metrics:
+            baseline_value = self._get_histogram_metric(baseline, metric)
+            candidate_value = self._get_histogram_metric(candidate, metric)
+            relative_delta = (candidate_value - baseline_value) / baseline_value if baseline_value else None
+            ci_low, ci_high = intervals[metric]
+            metrics[metric] = {
+                "baseline_ms": round(baseline_value, 2),
+                "candidate_ms": round(candidate_value, 2),
+                "relative_delta": round(relative_delta, 4) if relative_delta is not None else None,
+                "ci_low": round(ci_low, 4) if ci_low is not None else None,
+                "ci_high": round(ci_high, 4) if ci_high is not None else None,
+                "regression": self.is_regression(ci_low, ci_high),
+            }
+        return {
+            "baseline_requests": baseline.num_requests,
+            "candidate_requests": candidate.num_requests,
+            "baseline_error_rate": round(baseline.get_error_rate(), 4),
+            "candidate_error_rate": round(candidate.get_error_rate(), 4),
+            "mann_whitney": mann_whitney,
+            "metrics": metrics,
+            "regression": any(values["regression"] for values in metrics.values()),
+        }
+
+    def compare(
+        self,
+        baseline: Dict[str, LatencyHistogram],
+        candidate: Dict[str, LatencyHistogram],
+        endpoints: List[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compare all endpoints present in both runs.
+
+        Args:
+            baseline: Baseline histograms per request path
+            candidate: Candidate histograms per request path
+            endpoints: Optional subset of request paths to compare
+
+        Returns:
+            Comparison report with per-endpoint results and the regressions found
+        """
+        names = sorted(set(baseline) & set(candidate))
+        if endpoints:
+            names = [name for name in names if name in endpoints]
+
+        results = {}
+        for name in names:
+            if not baseline[name].num_requests or not candidate[name].num_requests:
+                continue
+            results[name] = self.compare_endpoint(baseline[name], candidate[name])
+
+        return {
+            "tolerance": self.tolerance,
+            "confidence": self.confidence,
+            "bootstrap_iterations": self.bootstrap_iterations,
+            "only_in_baseline": sorted(set(baseline) - set(candidate)),
+            "only_in_candidate": sorted(set(candidate) - set(baseline)),
+            "endpoints": results,
+            "regressions": [
+                f"{name} {metric}"
+                for name, result in results.items()
+                for metric, values in result["metrics"].items()
+                if values["regression"]
+            ],
+        }
+
+    @staticmethod
+    def format_table(report: Dict[str, Any]) -> str:
+        """Format a comparison report as a fixed width text table."""
+        lines = [
+            f"{'Endpoint':<45} {'Metric':<6} {'Baseline':>10} {'Candidate':>10} {'Delta':>8} "
+            f"{'CI':>19} {'MW p':>8}  Verdict"
+        ]
+        for name, result in report["endpoints"].items():
+            for metric, values in result["metrics"].items():
+                delta = f"{values['relative_delta']:+.1%}" if values["relative_delta"] is not None else "n/a"
+                ci = (
+                    f"[{values['ci_low']:+.1%}, {values['ci_high']:+.1%}]"
+                    if values["ci_low"] is not None
+                    else "n/a"
+                )
+                lines.append(
+                    f"{name:<45} {metric:<6} {values['baseline_ms']:>10} {values['candidate_ms']:>10} {delta:>8} "
+                    f"{ci:>19} {result['mann_whitney']['p_value']:>8.4f}  "
+                    f"{'REGRESSION' if values['regression'] else 'ok'}"
+                )
+        return "\n".join(lines)
+
+
+def self_check(num_requests: int = 20000, shift: float = 0.10, runs: int = 20, seed: int = 0) -> bool:
+    """
+    Check at the default tolerance and confidence that a true p99 regression
+    of `shift` at a realistic request count is flagged in at least 90% of
+    runs, and two runs of the same distribution in at most 10%.
+
+    Baseline and candidate latencies are independent draws of a lognormal
+    distribution (median ~150ms, heavy tail), the candidate's scaled by
+    1 + `shift`.
+    """
+    rng = np.random.default_rng(seed)
+
+    def draw_histogram(scale: float = 1.0) -> LatencyHistogram:
+        histogram = LatencyHistogram()
+        for latency in rng.lognormal(mean=math.log(150), sigma=0.6, size=num_requests) * scale:
+            histogram.record(float(latency))
+        return histogram
+
+    flagged = unchanged_flagged = 0
+    for run in range(runs):
+        comparator = RunComparator(metrics=["p99"], seed=seed + run)
+        baseline = draw_histogram()
+        flagged += comparator.compare_endpoint(baseline, draw_histogram(1 + shift))["metrics"]["p99"]["regression"]
+        unchanged_flagged += comparator.compare_endpoint(baseline, draw_histogram())["metrics"]["p99"]["regression"]
+
+    detection_rate = flagged / runs
+    false_alarm_rate = unchanged_flagged / runs
+    print(f"{shift:.0%} p99 regression at {num_requests:,} requests flagged in {detection_rate:.0%} of {runs} runs")
+    print(f"Same distribution at {num_requests:,} requests flagged in {false_alarm_rate:.0%} of {runs} runs")
+    return detection_rate >= 0.9 and false_alarm_rate <= 0.1
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two Panacea Locust test summaries")
+    parser.add_argument("baseline", nargs="?", help="Baseline test_summary_*.json")
+    parser.add_argument("candidate", nargs="?", help="Candidate test_summary_*.json")
+    parser.add_argument("--tolerance", type=float, default=config.REGRESSION_TOLERANCE)
+    parser.add_argument("--confidence", type=float, default=config.REGRESSION_CONFIDENCE)
+    parser.add_argument("--bootstrap-iterations", type=int, default=config.REGRESSION_BOOTSTRAP_ITERATIONS)
+    parser.add_argument("--metrics", default="p50,p95,p99,mean", help="Comma separated: p50,p95,p99,mean")
+    parser.add_argument("--endpoints", default=None, help="Comma separated request paths to compare")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Write the comparison report JSON to this path")
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        default=config.REGRESSION_STRICT,
+        help="Flag a metric only when its whole confidence interval is beyond the tolerance",
+    )
+    parser.add_argument(
+        "--self-check", action="store_true", help="Check that a 10%% p99 regression at 20k requests is flagged"
+    )
+    args = parser.parse_args(argv)
+
+    if args.self_check:
+        if self_check(seed=args.seed):
+            print("Self-check passed")
+            return 0
+        print("Self-check failed")
+        return 1
+    if not args.baseline or not args.candidate:
+        parser.error("baseline and candidate are required")
+
+    comparator = RunComparator(
+        tolerance=args.tolerance,
+        confidence=args.confidence,
+        bootstrap_iterations=args.bootstrap_iterations,
+        metrics=[metric.strip() for metric in args.metrics.split(",") if metric.strip()],
+        seed=args.seed,
+        strict=args.strict,
+    )
+    endpoints = [endpoint.strip() for endpoint in args.endpoints.split(",")] if args.endpoints else None
+    report = comparator.compare(
+        load_latency_histograms(args.baseline), load_latency_histograms(args.candidate), endpoints
+    )
+
+    print(RunComparator.format_table(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Comparison saved to: {args.output}")
+
+    if report["regressions"]:
+        print(f"Regressions beyond {args.tolerance:.0%}: {', '.join(report['regressions'])}")
+        return 1
+    print("No regressions found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
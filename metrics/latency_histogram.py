@@ -0,0 +1,144 @@
+"""
+Latency Histogram for Panacea Locust Load Testing
+
+This module provides a small, mergeable response time histogram used by the
+framework's own reports (sweeps, SLO checks, etc.) when Locust's global stats
+are not granular enough.
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+class LatencyHistogram:
+    """
+    Response time histogram with the same bucketing as Locust's StatsEntry.
+
+    Response times are rounded (exact below 100ms, 10ms buckets below 1s,
+    100ms buckets below 10s and 1s buckets above) so memory stays bounded
+    no matter how many requests are recorded.
+    """
+
+    def __init__(self):
+        self.response_times: Dict[int, int] = {}
+        self.num_requests = 0
+        self.num_failures = 0
+        self.total_response_time = 0.0
+
+    @staticmethod
+    def _round(response_time: float) -> int:
+        if response_time < 100:
+            return int(round(response_time))
+        elif response_time < 1000:
+            return int(round(response_time, -1))
+        elif response_time < 10000:
+            return int(round(response_time, -2))
+        return int(round(response_time, -3))
+
+    def record(self, response_time: float, failed: bool = False):
+        """Record a single response time in milliseconds."""
+        bucket = self._round(response_time)
+        self.response_times[bucket] = self.response_times.get(bucket, 0) + 1
+        self.num_requests += 1
+        self.total_response_time += response_time
+        if failed:
+            self.num_failures += 1
+
+    def merge(self, other: "LatencyHistogram"):
+        """Merge another histogram into this one."""
+        for bucket, count in other.response_times.items():
+            self.response_times[bucket] = self.response_times.get(bucket, 0) + count
+        self.num_requests += other.num_requests
+        self.num_failures += other.num_failures
+        self.total_response_time += other.total_response_time
+
+    def subtract(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Get the histogram of requests recorded since `other` was snapshotted.
+
+        Args:
+            other: Earlier snapshot of the same (cumulative) histogram
+
+        Returns:
+            New histogram holding only the difference
+        """
+        window = LatencyHistogram()
+        for bucket, count in self.response_times.items():
+            delta = count - other.response_times.get(bucket, 0)
+            if delta > 0:
+                window.response_times[bucket] = delta
+        window.num_requests = self.num_requests - other.num_requests
+        window.num_failures = self.num_failures - other.num_failures
+        window.total_response_time = self.total_response_time - other.total_response_time
+        return window
+
+    def get_percentile(self, percent: float) -> Optional[int]:
+        """Get the response time (ms) below which `percent` (0-1) of requests fall."""
+        if not self.num_requests:
+            return None
+        target = self.num_requests * percent
+        processed = 0
+        for bucket in sorted(self.response_times):
+            processed += self.response_times[bucket]
+            if processed >= target:
+                return bucket
+        return max(self.response_times)
+
+    def get_average(self) -> Optional[float]:
+        if not self.num_requests:
+            return None
+        return self.total_response_time / self.num_requests
+
+    def get_error_rate(self) -> float:
+        if not self.num_requests:
+            return 0.0
+        return self.num_failures / self.num_requests
+
+    def get_summary(self, duration_seconds: float = None) -> Dict[str, Any]:
+        """Get percentile, error rate and (optionally) throughput statistics."""
+        summary = {
+            "requests": self.num_requests,
+            "failures": self.num_failures,
+            "error_rate": round(self.get_error_rate(), 4),
+            "avg_ms": round(self.get_average(), 2) if self.num_requests else None,
+            "p50_ms": self.get_percentile(0.50),
+            "p95_ms": self.get_percentile(0.95),
+            "p99_ms": self.get_percentile(0.99),
+        }
+        if duration_seconds:
+            summary["rps"] = round(self.num_requests / duration_seconds, 3)
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for transport in worker reports (msgpack safe)."""
+        return {
+            "response_times": [[bucket, count] for bucket, count in self.response_times.items()],
+            "num_requests": self.num_requests,
+            "num_failures": self.num_failures,
+            "total_response_time": self.total_response_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.response_times = {int(bucket): count for bucket, count in data["response_times"]}
+        histogram.num_requests = data["num_requests"]
+        histogram.num_failures = data["num_failures"]
+        histogram.total_response_time = data["total_response_time"]
+        return histogram
+
+    @classmethod
+    def from_stats_entry(cls, entry) -> "LatencyHistogram":
+        """Snapshot a Locust StatsEntry (same bucketing) into a histogram."""
+        histogram = cls()
+        histogram.response_times = dict(entry.response_times)
+        histogram.num_requests = entry.num_requests
+        histogram.num_failures = entry.num_failures
+        histogram.total_response_time = entry.total_response_time
+        return histogram
+
+    @classmethod
+    def merge_all(cls, histograms: List["LatencyHistogram"]) -> "LatencyHistogram":
+        merged = cls()
+        for histogram in histograms:
+            merged.merge(histogram)
+        return merged
@@ -0,0 +1,139 @@
+"""
+SLO Evaluation for Panacea Locust Load Testing
+
+This module checks the collected Locust stats against the per-endpoint SLO
+specification from config.py (latency percentiles, error rate, throughput)
+and produces a verdict table for the test summary.
+"""
+
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+
+from metrics.latency_histogram import LatencyHistogram
+
+# request types of real HTTP requests; custom metrics (TTFB, TRANSFER, ...) use other types
+HTTP_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+
+
+def normalize_request_name(name: str) -> str:
+    """Reduce a request name (full URL or path) to its path without trailing '/'."""
+    path = urlparse(name).path or name
+    return "/" + path.strip("/")
+
+
+def group_stats_by_request_path(stats) -> Dict[str, LatencyHistogram]:
+    """
+    Merge the HTTP request stats entries by normalized request path.
+
+    Args:
+        stats: Locust RequestStats (environment.stats)
+
+    Returns:
+        Dictionary mapping request path to its merged histogram
+    """
+    grouped = {}
+    for (name, method), entry in stats.entries.items():
+        if method not in HTTP_METHODS:
+            continue
+        histogram = grouped.setdefault(normalize_request_name(name), LatencyHistogram())
+        histogram.merge(LatencyHistogram.from_stats_entry(entry))
+    return grouped
+
+
+class SLOEvaluator:
+    """
+    Evaluates per-endpoint SLOs against Locust request stats.
+
+    Stats entries are matched to SLO entries by normalized URL path, so the
+    same endpoint requested with or without host / trailing slash (or with
+    several HTTP methods) is checked as one. An endpoint without traffic gets
+    a NO_DATA verdict, which is not a pass: the evaluation fails when none of
+    the specified endpoints recorded a request.
+    """
+
+    PERCENTILE_THRESHOLDS = (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99))
+
+    def __init__(self, slo_spec: Dict[str, Dict[str, float]]):
+        self.slo_spec = {normalize_request_name(name): spec for name, spec in slo_spec.items()}
+
+    def evaluate(self, stats) -> Dict[str, Any]:
+        """
+        Evaluate all SLOs.
+
+        Args:
+            stats: Locust RequestStats (environment.stats)
+
+        Returns:
+            Dictionary with the overall verdict and one row per checked metric
+        """
+        grouped = group_stats_by_request_path(stats)
+        duration = None
+        if stats.start_time and stats.last_request_timestamp:
+            duration = max(stats.last_request_timestamp - stats.start_time, 1e-9)
+
+        verdicts: List[Dict[str, Any]] = []
+        for name, spec in self.slo_spec.items():
+            histogram = grouped.get(name)
+            if histogram is None or not histogram.num_requests:
+                # no traffic fails an endpoint that has a throughput floor, otherwise it is reported
+                verdicts.append(
+                    {
+                        "name": name,
+                        "metric": "requests",
+                        "threshold": None,
+                        "actual": 0,
+                        "passed": False,
+                        "no_data": not spec.get("min_rps"),
+                    }
+                )
+                continue
+
+            for metric, percent in self.PERCENTILE_THRESHOLDS:
+                if metric in spec:
+                    actual = histogram.get_percentile(percent)
+                    verdicts.append(
+                        {"name": name, "metric": metric, "threshold": spec[metric], "actual": actual, "passed": actual <= spec[metric]}
+                    )
+            if "max_error_rate" in spec:
+                actual = round(histogram.get_error_rate(), 4)
+                verdicts.append(
+                    {
+                        "name": name,
+                        "metric": "error_rate",
+                        "threshold": spec["max_error_rate"],
+                        "actual": actual,
+                        "passed": actual <= spec["max_error_rate"],
+                    }
+                )
+            if spec.get("min_rps"):
+                actual = round(histogram.num_requests / duration, 3) if duration else 0.0
+                verdicts.append(
+                    {"name": name, "metric": "rps", "threshold": spec["min_rps"], "actual": actual, "passed": actual >= spec["min_rps"]}
+                )
+
+        failed_checks = sum(1 for verdict in verdicts if not verdict["passed"] and not verdict.get("no_data"))
+        no_data = sum(1 for verdict in verdicts if verdict.get("no_data"))
+        return {
+            "passed": failed_checks == 0 and any(verdict["passed"] for verdict in verdicts),
+            "failed_checks": failed_checks,
+            "no_data_endpoints": no_data,
+            "verdicts": verdicts,
+        }
+
+    @staticmethod
+    def get_verdict_label(verdict: Dict[str, Any]) -> str:
+        """Get the PASS / FAIL / NO_DATA label of a verdict row."""
+        if verdict.get("no_data"):
+            return "NO_DATA"
+        return "PASS" if verdict["passed"] else "FAIL"
+
+    @staticmethod
+    def format_table(report: Dict[str, Any]) -> str:
+        """Format an evaluation report as a fixed width text table."""
+        lines = [f"{'Endpoint':<45} {'Metric':<12} {'Threshold':>10} {'Actual':>10}  Verdict"]
+        for verdict in report["verdicts"]:
+            lines.append(
+                f"{verdict['name']:<45} {verdict['metric']:<12} {str(verdict['threshold']):>10} "
+                f"{str(verdict['actual']):>10}  {SLOEvaluator.get_verdict_label(verdict)}"
+            )
+        return "\n".join(lines)
@@ -1,8 +1,9 @@
 """
 Base User Module for Panacea Locust Load Testing
 
-This module contains the base PanaceaAPIUser class with core functionality
-for session management, request handling, and user initialization.
+This module contains the abstract PanaceaBaseUser class with core functionality
+for session management, request handling, and user initialization, and the
+PanaceaAPIUser class which exercises all Panacea API endpoints.
 """
 
 import json
@@ -10,17 +11,26 @@ import logging
 import random
 from typing import Any, Dict
 
-from locust import HttpUser, between, task
+from locust import HttpUser, between, constant_throughput
+from payloads.api_payloads.rca_summary.ask_ai import AskAIAPI, AskAIConversation
+from payloads.api_registry import api_registry
+from payloads.behavior_model import behavior_model
 from payloads.json_payload import json_payload
+from payloads.payload_replay import PayloadReplayLRU
+from payloads.rng_streams import RngStreams
+from sessions.session_churn import SESSION_STATE_CONTEXT_KEY, STICKY, SessionChurn, session_pool
 
 from config import config
+from connections import get_pool_manager, get_request_timeout, get_session_headers
+from streaming import response_streamer, token_stream_reader
+from validation import response_validator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class PanaceaAPIUser(HttpUser):
+class PanaceaBaseUser(HttpUser):
     """
     Base virtual user for testing Panacea API endpoints.
     Each user has unique session ID and user-specific payload generation.
@@ -30,19 +40,40 @@ class PanaceaAPIUser(HttpUser):
     - Session management with X-Session-Id headers
     - Common HTTP request handling with error management
     - Base configuration for wait times and weights
+
+    It declares no tasks, so specialised users (e.g. the parametric sweep user)
+    can reuse it without inheriting the standard task mix.
     """
 
-    wait_time = between(config.STANDARD_USER_WAIT_MIN, config.STANDARD_USER_WAIT_MAX)
+    abstract = True
+    if config.USER_TARGET_RPS > 0:
+        wait_time = constant_throughput(config.USER_TARGET_RPS)
+    else:
+        wait_time = between(config.STANDARD_USER_WAIT_MIN, config.STANDARD_USER_WAIT_MAX)
     weight = config.STANDARD_USER_WEIGHT
 
     def __init__(self, *args, **kwargs):
         """Initialize the user class, ensuring parent classes are properly initialized."""
+        # HttpUser builds the client on the pool manager of the connection policy
+        self.pool_manager = get_pool_manager()
         super().__init__(*args, **kwargs)
+        self.rng_streams = RngStreams.for_user(self)
+
+    def get_rng(self, name: str):
+        """Get this user's random stream `name` (seeded from `Config.RUN_SEED` when set)."""
+        return self.rng_streams.get(name)
 
     def on_start(self):
         """Initialize user-specific data when the user starts."""
         # Generate unique user identifier
-        self.session_id = random.choice(json_payload.get_session_ids())
+        if config.SESSION_CHURN_POLICY == STICKY:
+            self.session_churn = None
+            self.session_id = json_payload.sample_session_id(self.get_rng("session"))
+        else:
+            self.session_churn = SessionChurn(
+                session_pool, config.SESSION_CHURN_POLICY, config.SESSION_CHURN_REQUESTS, rng=self.get_rng("session")
+            )
+            self.session_id = session_pool.sample(self.get_rng("session"))
         # Set up session headers
         self._setup_session()
 
@@ -55,6 +86,7 @@ class PanaceaAPIUser(HttpUser):
                 config.SESSION_HEADER_NAME: self.session_id,
                 "Content-Type": "application/json",
                 "User-Agent": f"PanaceaLocust/1.0",
+                **get_session_headers(),
             }
         )
 
@@ -62,6 +94,13 @@ class PanaceaAPIUser(HttpUser):
 
         logger.info(f"Session headers set with session_id: {self.session_id}")
 
+    def _rotate_session(self):
+        """Switch to a new session when the churn policy says so."""
+        session_id = self.session_churn.next_session(self.session_id)
+        if session_id is not None:
+            self.session_id = session_id
+            self.client.headers[config.SESSION_HEADER_NAME] = session_id
+
     def _log_curl_command(
         self,
         method: str,
@@ -105,6 +144,8 @@ class PanaceaAPIUser(HttpUser):
         json_data: Dict[str, Any] = None,
         params: Dict[str, Any] = None,
         name: str = None,
+        context: Dict[str, Any] = None,
+        keep_body: bool = False,
     ):
         """
         Make an HTTP request with optional name for Locust statistics grouping.
@@ -115,6 +156,16 @@ class PanaceaAPIUser(HttpUser):
             json_data: JSON payload for POST requests
             params: Query parameters for GET requests
             name: Optional name to group requests in Locust statistics (defaults to endpoint)
+            context: Optional request context passed on to request event listeners
+            keep_body: Keep the body readable (`response.content` / `json()`)
+                in stream mode, for callers that use it
+
+        Returns:
+            The response; a sampled fraction of responses (per endpoint) is
+            validated and counted as failure on api_status errors or empty bodies.
+            In stream mode the body has already been read and discarded (unless
+            `keep_body`); token streamed (LLM) endpoints have been read with
+            TTFT metrics recorded and keep their body.
         """
         if name is None:
             # Use endpoint as default name, removing query params for grouping
@@ -123,192 +174,172 @@ class PanaceaAPIUser(HttpUser):
         # Log curl command randomly (10% chance)
         self._log_curl_command(method, endpoint, json_data, params)
 
+        if context is None:
+            context = {}
+        if self.session_churn is not None:
+            self._rotate_session()
+            context = {**context, SESSION_STATE_CONTEXT_KEY: session_pool.use(self.session_id)}
+
+        validate = response_validator.should_validate(name)
+        stream_tokens = token_stream_reader.should_stream(name)
+        stream = stream_tokens or response_streamer.should_stream(name)
+        request_kwargs = {
+            "params": params,
+            "name": name,
+            "context": context,
+            "catch_response": validate or stream,
+            "timeout": get_request_timeout(),
+        }
+        if stream:
+            request_kwargs["stream"] = True
+        if stream_tokens:
+            request_kwargs["headers"] = token_stream_reader.get_request_headers()
+
         if method == "POST":
-            self.client.post(endpoint, json=json_data, params=params, name=name)
+            response = self.client.post(endpoint, json=json_data, **request_kwargs)
         elif method == "GET":
-            self.client.get(endpoint, params=params, name=name)
+            response = self.client.get(endpoint, **request_kwargs)
         else:
             raise ValueError(f"Invalid method: {method}")
 
-    @task(config.TASK_WEIGHTS["reports"])
-    def test_reports_endpoint(self):
-        from payloads.api_payloads.reports.reports_api import ReportsAPI
-
-        logger.info(f"Session ID: {self.session_id}")
-        api = ReportsAPI()
-        # Generate payload with random selection handled by the API
-        payload = api.generate_payload()
-
-        self.make_request(
-            api.get_api_method(), api.get_api_endpoint(), json_data=payload, name="/api/v1/insights/reports"
-        )
-
-    @task(config.TASK_WEIGHTS["list-combos"])
-    def test_list_combos_endpoint(self):
-        from payloads.api_payloads.reports.list_combos import ListCombosAPI
-
-        logger.info(f"Session ID: {self.session_id}")
-        api = ListCombosAPI()
-        # Generate payload with random selection handled by the API
-        payload = api.generate_payload()
-
-        self.make_request(
-            api.get_api_method(), api.get_api_endpoint(), json_data=payload, name=api.get_api_endpoint()
-        )
-
-    @task(config.TASK_WEIGHTS["events"])
-    def test_events_endpoint(self):
-        from payloads.api_payloads.rca_summary.events import EventsAPI
-
-        logger.info(f"Session ID: {self.session_id}")
-        api = EventsAPI()
-        # Generate payload with random selection handled by the API (query parameters for GET request)
-        payload = api.generate_payload()
-
-        # For GET requests, pass payload as params instead of json_data
-        # Use a consistent name to group all events requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
-            api.get_api_endpoint(),
-            params=payload,
-            name="/api/v1/insights/events",
-        )
-
-    @task(config.TASK_WEIGHTS["ask-ai"])
-    def test_ask_ai_endpoint(self):
-        from payloads.api_payloads.rca_summary.ask_ai import AskAIAPI
-
-        logger.info(f"Session ID: {self.session_id}")
-        api = AskAIAPI()
-        # Generate payload with random selection handled by the API
-        payload = api.generate_payload()
-
-        self.make_request(
-            api.get_api_method(), api.get_api_endpoint(), json_data=payload, name=api.get_api_endpoint()
-        )
-
-    @task(config.TASK_WEIGHTS["report-summary"])
-    def test_report_summary_endpoint(self):
-        from payloads.api_payloads.rca_summary.ai_summary import AISummaryAPI
-
-        logger.info(f"Session ID: {self.session_id}")
-        api = AISummaryAPI()
-        # Generate payload with random selection handled by the API (query parameters for GET request)
-        payload = api.generate_payload()
-
-        # For GET requests, pass payload as params instead of json_data
-        # Use a consistent name to group all report_summary requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
-            api.get_api_endpoint(),
-            params=payload,
-            name=api.get_api_endpoint(),
-        )
-
-    @task(config.TASK_WEIGHTS["logs-info"])
-    def test_logs_info_endpoint(self):
-        from payloads.api_payloads.rca_summary.logs_info import LogsInfoAPI
-
-        logger.info(f"Session ID: {self.session_id}")
-        api = LogsInfoAPI()
-        # Generate payload with random selection handled by the API (query parameters for GET request)
-        payload = api.generate_payload()
+        if validate or stream:
+            with response:
+                # in stream mode only the head of the body is kept for validation
+                content = None
+                if stream_tokens:
+                    content = token_stream_reader.read(response, self.environment.events.request)
+                elif stream:
+                    content = response_streamer.drain(response, self.environment.events.request, keep_body=keep_body)
+                # HTTP errors keep Locust's default handling, only bad 200s are marked here
+                if validate and response.ok:
+                    failure_reason = response_validator.validate(content if stream else response.content)
+                    if failure_reason:
+                        response.failure(failure_reason)
+
+        return response
+
+    def send_api_request(
+        self, api, payload: Dict[str, Any] = None, context: Dict[str, Any] = None, keep_body: bool = False
+    ):
+        """
+        Send the request of an API object, grouped under its endpoint in Locust statistics.
 
-        # For GET requests, pass payload as params instead of json_data
-        # Use a consistent name to group all logs_info requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
+        Args:
+            api: BaseAPI instance
+            payload: Payload to send (default: a newly generated one); GET payloads
+                are sent as query parameters, others as JSON body
+            context: Request context (default: the API's request context)
+            keep_body: Keep the body readable in stream mode (see make_request)
+
+        Returns:
+            The response (see make_request)
+        """
+        if payload is None:
+            payload = api.generate_payload()
+        if context is None:
+            context = api.get_request_context()
+        method = api.get_api_method()
+        return self.make_request(
+            method,
             api.get_api_endpoint(),
-            params=payload,
+            json_data=payload if method != "GET" else None,
+            params=payload if method == "GET" else None,
             name=api.get_api_endpoint(),
+            context=context,
+            keep_body=keep_body,
         )
 
-    @task(config.TASK_WEIGHTS["logs-filter-options"])
-    def test_logs_filter_options_endpoint(self):
-        from payloads.api_payloads.log_viewer.filter_options import LogsFilterOptionsAPI
 
-        logger.info(f"Session ID: {self.session_id}")
-        api = LogsFilterOptionsAPI()
-        # Generate payload with random selection handled by the API (query parameters for GET request)
-        payload = api.generate_payload()
+def _build_api_task(task_name: str):
+    def run_api_task(user):
+        user.run_api_task(task_name)
 
-        # For GET requests, pass payload as params instead of json_data
-        # Use a consistent name to group all logs_filter_options requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
-            api.get_api_endpoint(),
-            params=payload,
-            name=api.get_api_endpoint(),
-        )
+    run_api_task.__name__ = f"test_{task_name.replace('-', '_')}_endpoint"
+    return run_api_task
 
-    @task(config.TASK_WEIGHTS["logs-search"])
-    def test_logs_search_endpoint(self):
-        from payloads.api_payloads.log_viewer.search import LogsSearchAPI
-
-        logger.info(f"Session ID: {self.session_id}")
-        api = LogsSearchAPI()
-        # Generate payload with random selection handled by the API
-        payload = api.generate_payload()
-
-        # For POST requests, pass payload as json_data
-        # Use a consistent name to group all logs_search requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
-            api.get_api_endpoint(),
-            json_data=payload,
-            name=api.get_api_endpoint(),
-        )
 
-    @task(config.TASK_WEIGHTS["logs-histogram"])
-    def test_logs_histogram_endpoint(self):
-        from payloads.api_payloads.log_viewer.histogram import LogsHistogramAPI
+def run_behavior_model_task(user):
+    """Run the task following the user's previous one in the behavior model."""
+    rng = user.get_rng("task-mix")
+    if user.session_churn is not None and behavior_model.starts_journey(user.current_task):
+        user.session_churn.start_journey()
+    task_name = behavior_model.sample_next_task(user.current_task, rng)
+    # None once the journey ends, the next task then starts a new journey
+    user.current_task = None if behavior_model.sample_journey_end(task_name, rng) else task_name
+    user.run_api_task(task_name)
 
-        logger.info(f"Session ID: {self.session_id}")
-        api = LogsHistogramAPI()
-        # Generate payload with random selection handled by the API
-        payload = api.generate_payload()
 
-        # For POST requests, pass payload as json_data
-        # Use a consistent name to group all logs_histogram requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
-            api.get_api_endpoint(),
-            json_data=payload,
-            name=api.get_api_endpoint(),
-        )
+class PanaceaAPIUser(PanaceaBaseUser):
+    """
+    Virtual user exercising every registered Panacea API endpoint according
+    to `Config.TASK_WEIGHTS`.
 
-    @task(config.TASK_WEIGHTS["logs-heatmap"])
-    def test_logs_heatmap_endpoint(self):
-        from payloads.api_payloads.log_viewer.heatmap import LogsHeatmapAPI
+    API objects are kept per user and reused for `API_STICKINESS` requests
+    (per task overrides in `API_STICKINESS_OVERRIDES`), so a user can stay on
+    the same bundle / combo for several requests while filters still vary.
 
-        logger.info(f"Session ID: {self.session_id}")
-        api = LogsHeatmapAPI()
-        # Generate payload with random selection handled by the API
-        payload = api.generate_payload()
+    With a repeat ratio (`PAYLOAD_REPEAT_RATIO`, per task overrides in
+    `PAYLOAD_REPEAT_RATIO_OVERRIDES`) a request re-sends an exact payload from
+    the user's LRU of recently sent payloads of the task with that probability.
 
-        # For POST requests, pass payload as json_data
-        # Use a consistent name to group all logs_heatmap requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
-            api.get_api_endpoint(),
-            json_data=payload,
-            name=api.get_api_endpoint(),
-        )
+    With `BEHAVIOR_MODEL` on, think times, gaps between journeys and the next
+    task are sampled from the behavior model learned from the request log
+    instead of the wait time settings and the task weights.
+    """
 
-    @task(config.TASK_WEIGHTS["logs-severity-count"])
-    def test_logs_severity_count_endpoint(self):
-        from payloads.api_payloads.log_viewer.severity_count import LogsSeverityCountAPI
+    tasks = {
+        _build_api_task(task_name): weight
+        for task_name, weight in api_registry.get_task_weights(config.TASK_WEIGHTS).items()
+    }
+    if behavior_model is not None:
+        tasks = [run_behavior_model_task]
 
-        logger.info(f"Session ID: {self.session_id}")
-        api = LogsSeverityCountAPI()
-        # Generate payload with random selection handled by the API
-        payload = api.generate_payload()
+        def wait_time(self):
+            if self.current_task is None:
+                return behavior_model.sample_journey_gap(self.get_rng("think-time"))
+            return behavior_model.sample_think_time(self.get_rng("think-time"))
 
-        # For POST requests, pass payload as json_data
-        # Use a consistent name to group all logs_severity_count requests together in Locust stats
-        self.make_request(
-            api.get_api_method(),
-            api.get_api_endpoint(),
-            json_data=payload,
-            name=api.get_api_endpoint(),
+    def on_start(self):
+        super().on_start()
+        # multi-turn Ask-AI history, created on the first Ask-AI task
+        self.ask_ai_conversation = None
+        # task name -> [API object, requests left before it is replaced]
+        self.apis = {}
+        # previous task of the behavior model journey (None = the next task starts a journey)
+        self.current_task = None
+        self.payload_replay = PayloadReplayLRU(config.PAYLOAD_REPLAY_LRU_SIZE, rng=self.get_rng("payload-replay"))
+
+    def get_api(self, task_name: str):
+        """Get the user's API object of a task, creating a new one once its stickiness is used up."""
+        entry = self.apis.get(task_name)
+        if entry is None or entry[1] <= 0:
+            api = api_registry.create(task_name, rng=self.get_rng(task_name))
+            entry = [api, config.API_STICKINESS_OVERRIDES.get(task_name, config.API_STICKINESS)]
+            self.apis[task_name] = entry
+        entry[1] -= 1
+        return entry[0]
+
+    def run_api_task(self, task_name: str):
+        api = self.get_api(task_name)
+        if task_name == AskAIAPI.TASK_NAME and config.ASK_AI_CONVERSATION_MODE:
+            self._send_ask_ai_conversation_turn(api)
+            return
+        repeat_ratio = config.PAYLOAD_REPEAT_RATIO_OVERRIDES.get(task_name, config.PAYLOAD_REPEAT_RATIO)
+        if repeat_ratio > 0:
+            payload, context = self.payload_replay.next_payload(task_name, api, repeat_ratio)
+            self.send_api_request(api, payload=payload, context=context)
+            return
+        self.send_api_request(api)
+
+    def _send_ask_ai_conversation_turn(self, api):
+        """Send the next turn of this user's Ask-AI conversation, keeping the reply in the history."""
+        if self.ask_ai_conversation is None:
+            self.ask_ai_conversation = AskAIConversation(api.messages, rng=self.get_rng("ask-ai-conversation"))
+        conversation = self.ask_ai_conversation
+        response = self.send_api_request(
+            api,
+            payload=conversation.next_payload(),
+            context=conversation.get_request_context(),
+            keep_body=config.ASK_AI_CONVERSATION_REPLAY_REPLIES,
         )
+        conversation.record_reply(response)
@@ -1,16 +1,26 @@
 import json
+import random
 from abc import ABC, abstractmethod
 
 from config import config
 
 
 class BaseAPI(ABC):
-    def __init__(self):
+    # Config.TASK_WEIGHTS key of the endpoint; classes without one are not registered as tasks
+    TASK_NAME = None
+
+    def __init__(self, rng: random.Random = None):
         self.endpoint = ""
+        # payload draws use this stream (the global random module when none is injected)
+        self.rng = rng if rng is not None else random
 
     def get_api_endpoint(self):
         return f"{config.DEFAULT_HOST}/{self.endpoint}"
 
+    def get_request_context(self):
+        """Request context passed on to request event listeners."""
+        return {}
+
     @abstractmethod
     def get_api_method(self):
         pass
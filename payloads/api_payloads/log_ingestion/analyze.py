@@ -0,0 +1,43 @@
+from payloads.api_payloads.base_api import BaseAPI
+from payloads.json_payload import json_payload
+
+
+class LogsAnalyzeAPI(BaseAPI):
+    class PayloadTypes:
+        """Payload type constants for LogsAnalyzeAPI"""
+        NEW_BUNDLE = "new_bundle"
+
+    # write path, driven by the ingestion user with its bundle fixtures (no read task)
+    TASK_NAME = None
+
+    def __init__(self, fixture, rng=None):
+        """
+        Args:
+            fixture: BundleFixture to submit
+            rng: Random stream for the payload draws
+        """
+        super().__init__(rng)
+        # do not use '/' at the beginning of the endpoint
+        self.endpoint = "api/v1/insights/logs/analyze"
+        self.fixture = fixture
+        self.sfdc_case_numbers = json_payload.get_sfdc_case_numbers()
+
+    def get_api_method(self):
+        return "POST"
+
+    def get_request_context(self):
+        return {"bundle_size_class": self.fixture.size_class}
+
+    def generate_payload(self, payload_type: str = None):
+        if payload_type is None:
+            payload_type = LogsAnalyzeAPI.PayloadTypes.NEW_BUNDLE
+        return self.get_payload(payload_type)
+
+    def get_payload(self, payload_type: str):
+        match payload_type:
+            case LogsAnalyzeAPI.PayloadTypes.NEW_BUNDLE:
+                return {
+                    "remote_log_bundle_path": self.fixture.remote_path,
+                    "sfdc_case_no": self.rng.choice(self.sfdc_case_numbers) if self.sfdc_case_numbers else "",
+                    "is_retry": False
+                }
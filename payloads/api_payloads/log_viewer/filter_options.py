@@ -1,5 +1,4 @@
-import random
-
+from config import config
 from payloads.api_payloads.base_api import BaseAPI
 from payloads.json_payload import json_payload
 
@@ -8,15 +7,19 @@ class LogsFilterOptionsAPI(BaseAPI):
     class PayloadTypes:
         """Payload type constants for LogsFilterOptionsAPI"""
         BUNDLE_IDS_ONLY = "bundle_ids_only"
-    
-    MAX_BUNDLE_IDS_PER_REQUEST = 3
 
-    def __init__(self):
-        super().__init__()
+    TASK_NAME = "logs-filter-options"
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
         # do not use '/' at the beginning of the endpoint
         self.endpoint = "api/v1/insights/logs/filter-options"
-        n_bundle_ids = random.randint(1, LogsFilterOptionsAPI.MAX_BUNDLE_IDS_PER_REQUEST)
-        self.bundle_ids = random.sample(json_payload.get_valid_bundle_ids(), n_bundle_ids)
+        n_bundle_ids = self.rng.randint(1, config.MAX_BUNDLE_IDS_PER_REQUEST)
+        self.bundle_ids = json_payload.sample_bundle_ids(n_bundle_ids, self.rng)
+
+    def apply_sweep_point(self, sweep_point: dict):
+        """Pin the number of requested bundle ids to a parametric sweep grid point."""
+        self.bundle_ids = json_payload.sample_bundle_ids(sweep_point["bundle_count"], self.rng)
 
     def get_api_method(self):
         return "GET"
@@ -8,10 +8,12 @@ class LogsHistogramAPI(LogViewerAPI):
         """Payload type constants for LogsHistogramAPI"""
         DEFAULT = "default"
 
+    TASK_NAME = "logs-histogram"
+
     DEFAULT_PAGE_SIZE = 100
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng=None):
+        super().__init__(rng)
         # do not use '/' at the beginning of the endpoint
         self.endpoint = "api/v1/insights/logs/histogram/"
 
@@ -28,9 +30,9 @@ class LogsHistogramAPI(LogViewerAPI):
             case LogsHistogramAPI.PayloadTypes.DEFAULT:
                 start_time, end_time = self.get_start_and_end_time_for_payload()
                 return {
-                    "bundle_ids": [self.bundle_id],
+                    "bundle_ids": self.get_bundle_ids_for_payload(),
                     "page_no": 1,
-                    "page_size": LogsHistogramAPI.DEFAULT_PAGE_SIZE,
+                    "page_size": self.get_page_size_for_payload(LogsHistogramAPI.DEFAULT_PAGE_SIZE),
                     "filters": {
                         "source_log_filenames": self.get_source_log_filenames_for_payload(),
                         "components": self.get_components_for_payload(),
@@ -1,7 +1,8 @@
-import random
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from typing import Any, Dict
 
+from config import config
 from payloads.api_payloads.base_api import BaseAPI
 from payloads.json_payload import json_payload
 
@@ -13,17 +14,21 @@ class LogViewerAPI(BaseAPI):
 
     DEFAULT_PAGE_SIZE = 20
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng=None):
+        super().__init__(rng)
         # do not use '/' at the beginning of the endpoint
         self.endpoint = "api/v1/insights/logs/viewer/"
-        self.bundle_id = random.choice(json_payload.get_bundle_ids_for_log_viewer_apis())
+        self.bundle_id = json_payload.sample_bundle_id_for_log_viewer_apis(self.rng)
         self.bundle_data = json_payload.get_bundle_data(self.bundle_id)
+        self.bundle_tier = json_payload.get_bundle_tier(self.bundle_id)
         self.components = self.bundle_data["components"]
         self.source_log_filenames = self.bundle_data["source_log_filenames"]
         self.log_levels = json_payload.get_valid_log_level_types()
         self.start_time = self.bundle_data["start_time"]
         self.end_time = self.bundle_data["end_time"]
+        self.bundle_ids = [self.bundle_id]
+        # set by apply_sweep_point, pins the payload parameters to a sweep grid point
+        self.sweep_point = None
 
     @abstractmethod
     def get_api_method(self):
@@ -32,54 +37,106 @@ class LogViewerAPI(BaseAPI):
     @abstractmethod
     def generate_payload(self, payload_type: str = None):
         pass
-    
+
+    def get_request_context(self) -> Dict[str, Any]:
+        """Request context tagging the request with the size tier of its bundle."""
+        return {"bundle_tier": self.bundle_tier}
+
+    def apply_sweep_point(self, sweep_point: Dict[str, Any]):
+        """
+        Pin payload parameters to a parametric sweep grid point.
+
+        The swept dimensions (time span, bundle count, page size, component
+        count, search on/off) are taken from the point; every other optional
+        filter is left empty so only the swept dimensions vary.
+
+        Args:
+            sweep_point: Grid point as built by sweep.sweep_engine.SweepEngine
+        """
+        self.sweep_point = sweep_point
+        other_bundle_ids = [
+            bundle_id
+            for bundle_id in json_payload.get_bundle_ids_for_log_viewer_apis()
+            if bundle_id != self.bundle_id
+        ]
+        n_other_bundle_ids = min(sweep_point["bundle_count"] - 1, len(other_bundle_ids))
+        self.bundle_ids = [self.bundle_id] + self.rng.sample(other_bundle_ids, n_other_bundle_ids)
+
+    def get_bundle_ids_for_payload(self):
+        return list(self.bundle_ids)
+
+    def get_page_size_for_payload(self, default_page_size: int):
+        if self.sweep_point is not None:
+            return self.sweep_point["page_size"]
+        return default_page_size
+
     def get_components_for_payload(self):
+        if self.sweep_point is not None:
+            components_count_to_use = min(self.sweep_point["component_count"], len(self.components))
+            return self.rng.sample(self.components, components_count_to_use)
+
         components = []
-        use_components = random.choice([True, False, False, False, False])
+        use_components = self.rng.choice([True, False, False, False, False])
         if use_components:
-            components_count_to_use = min(random.randint(1, 3), len(self.components))
-            components_to_use = random.sample(self.components, components_count_to_use)
+            components_count_to_use = min(self.rng.randint(1, 3), len(self.components))
+            components_to_use = self.rng.sample(self.components, components_count_to_use)
             components.extend(components_to_use)
         return components
 
     def get_source_log_filenames_for_payload(self):
+        if self.sweep_point is not None:
+            return []
+
         source_log_filenames = []
-        use_source_log_filenames = random.choice([True, False, False, False, False])
+        use_source_log_filenames = self.rng.choice([True, False, False, False, False])
         if use_source_log_filenames:
-            source_log_filenames_count_to_use = min(random.randint(1, 3), len(self.source_log_filenames))
-            source_log_filenames_to_use = random.sample(self.source_log_filenames, source_log_filenames_count_to_use)
+            source_log_filenames_count_to_use = min(self.rng.randint(1, 3), len(self.source_log_filenames))
+            source_log_filenames_to_use = self.rng.sample(self.source_log_filenames, source_log_filenames_count_to_use)
             source_log_filenames.extend(source_log_filenames_to_use)
         return source_log_filenames
     
     def get_log_levels_for_payload(self):
+        if self.sweep_point is not None:
+            return []
+
         log_levels = []
-        use_log_levels = random.choice([True, False, False, False, False])
+        use_log_levels = self.rng.choice([True, False, False, False, False])
         if use_log_levels:
-            log_levels_count_to_use = min(random.randint(1, 3), len(self.log_levels))
-            log_levels_to_use = random.sample(self.log_levels, log_levels_count_to_use)
+            log_levels_count_to_use = min(self.rng.randint(1, 3), len(self.log_levels))
+            log_levels_to_use = self.rng.sample(self.log_levels, log_levels_count_to_use)
             log_levels.extend(log_levels_to_use)
         return log_levels
     
     def get_start_and_end_time_for_payload(self):
         start_dt = datetime.strptime(self.start_time, "%Y-%m-%d %H:%M:%S")
         end_dt = datetime.strptime(self.end_time, "%Y-%m-%d %H:%M:%S")
+        if self.sweep_point is not None:
+            # fixed span, placed randomly inside the bundle's time range when it fits
+            span = timedelta(hours=self.sweep_point["time_span_hours"])
+            latest_start_seconds = int((end_dt - start_dt - span).total_seconds())
+            start_time = start_dt + timedelta(seconds=self.rng.randint(0, max(latest_start_seconds, 0)))
+            return start_time, start_time + span
         if start_dt >= end_dt:
             # fallback in case data is nonsense
             start_time = start_dt
-            end_time = start_dt + timedelta(hours=random.randint(0, 240))
+            end_time = start_dt + timedelta(hours=self.rng.randint(0, 240))
         else:
             total_seconds = int((end_dt - start_dt).total_seconds())
-            rand_offset = random.randint(0, total_seconds)
+            rand_offset = self.rng.randint(0, total_seconds)
             start_time = start_dt + timedelta(seconds=rand_offset)
-            end_time = start_time + timedelta(hours=random.randint(0, 24))
+            end_time = start_time + timedelta(hours=self.rng.randint(0, config.DEFAULT_TIME_RANGE_HOURS))
         return start_time, end_time
 
     def get_is_curated_for_payload(self):
-        return random.choice([True, None, None, None, None])
+        if self.sweep_point is not None:
+            return None
+        return self.rng.choice([True, None, None, None, None])
 
     def get_search_log_string_for_payload(self):
-        search_log_string_sample = ["", "", "", "", "", "", random.choice(json_payload.get_messages())]
-        return random.choice(search_log_string_sample)
+        if self.sweep_point is not None:
+            return self.rng.choice(json_payload.get_messages()) if self.sweep_point["search"] else ""
+        search_log_string_sample = ["", "", "", "", "", "", self.rng.choice(json_payload.get_messages())]
+        return self.rng.choice(search_log_string_sample)
 
     def get_cvm_ips_for_payload(self):
         cvm_ips = []
@@ -11,10 +11,12 @@ class LogsSearchAPI(LogViewerAPI):
         """Payload type constants for LogsSearchAPI"""
         DEFAULT = "default"
 
+    TASK_NAME = "logs-search"
+
     DEFAULT_PAGE_SIZE = 20
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng=None):
+        super().__init__(rng)
         # do not use '/' at the beginning of the endpoint
         self.endpoint = "api/v1/insights/logs/search"
 
@@ -31,9 +33,9 @@ class LogsSearchAPI(LogViewerAPI):
             case LogsSearchAPI.PayloadTypes.DEFAULT:
                 start_time, end_time = self.get_start_and_end_time_for_payload()
                 return {
-                    "bundle_ids": [self.bundle_id],
+                    "bundle_ids": self.get_bundle_ids_for_payload(),
                     "page_no": 1,
-                    "page_size": LogsSearchAPI.DEFAULT_PAGE_SIZE,
+                    "page_size": self.get_page_size_for_payload(LogsSearchAPI.DEFAULT_PAGE_SIZE),
                     "filters": {
                         "source_log_filenames": self.get_source_log_filenames_for_payload(),
                         "components": self.get_components_for_payload(),
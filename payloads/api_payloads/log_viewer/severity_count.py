@@ -8,8 +8,10 @@ class LogsSeverityCountAPI(LogViewerAPI):
         """Payload type constants for LogsSeverityCountAPI"""
         DEFAULT = "default"
 
-    def __init__(self):
-        super().__init__()
+    TASK_NAME = "logs-severity-count"
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
         # do not use '/' at the beginning of the endpoint
         self.endpoint = "api/v1/insights/logs/severity-count/"
 
@@ -26,7 +28,7 @@ class LogsSeverityCountAPI(LogViewerAPI):
             case LogsSeverityCountAPI.PayloadTypes.DEFAULT:
                 start_time, end_time = self.get_start_and_end_time_for_payload()
                 return {
-                    "bundle_ids": [self.bundle_id],
+                    "bundle_ids": self.get_bundle_ids_for_payload(),
                     "filters": {
                         "components": self.get_components_for_payload(),
                         "log_levels": self.get_log_levels_for_payload(),
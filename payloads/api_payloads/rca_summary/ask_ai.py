@@ -1,5 +1,7 @@
+import json
 import random
 
+from config import config
 from payloads.api_payloads.base_api import BaseAPI
 from payloads.json_payload import json_payload
 
@@ -9,8 +11,10 @@ class AskAIAPI(BaseAPI):
         """Payload type constants for AskAIAPI"""
         DEFAULT = "default"
 
-    def __init__(self):
-        super().__init__()
+    TASK_NAME = "ask-ai"
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
         # do not use '/' at the beginning of the endpoint
         self.endpoint = "api/v1/insights/ai/ask-ai/"
         # Sample messages for AI queries
@@ -25,6 +29,83 @@ class AskAIAPI(BaseAPI):
     def get_payload(self, payload_type: str):
         if payload_type is None:
             payload_type = AskAIAPI.PayloadTypes.DEFAULT
-        message = random.choice(self.messages)
+        message = self.rng.choice(self.messages)
         return {"messages": [message] }
 
+
+class AskAIConversation:
+    """
+    Growing Ask-AI conversation of a single user.
+
+    Every turn appends a sampled message to the history and sends the whole
+    history; the reply (or, when replies are not replayed, another sampled
+    message of similar size) is appended before the next turn. The
+    conversation restarts after `ASK_AI_MAX_TURNS` turns, once the prompt
+    exceeds `ASK_AI_MAX_PROMPT_CHARS` or when a turn fails.
+    """
+
+    REPLY_TEXT_KEYS = ("answer", "response", "message", "content", "text", "summary")
+
+    def __init__(self, messages, rng=None):
+        self.sample_messages = messages
+        self.rng = rng if rng is not None else random
+        self.messages = []
+        self.turn = 0
+
+    def reset(self):
+        self.messages = []
+        self.turn = 0
+
+    def get_prompt_chars(self) -> int:
+        return sum(len(message) for message in self.messages)
+
+    def next_payload(self):
+        if self.turn >= config.ASK_AI_MAX_TURNS or self.get_prompt_chars() >= config.ASK_AI_MAX_PROMPT_CHARS:
+            self.reset()
+        self.messages.append(self.rng.choice(self.sample_messages))
+        self.turn += 1
+        return {"messages": list(self.messages)}
+
+    def get_request_context(self):
+        """Request context used to bucket latency by turn and prompt size."""
+        return {"conversation_turn": self.turn, "prompt_chars": self.get_prompt_chars()}
+
+    def record_reply(self, response):
+        """Append the reply of the last turn to the history (or restart on failure)."""
+        if not response.ok:
+            self.reset()
+            return
+        if config.ASK_AI_CONVERSATION_REPLAY_REPLIES:
+            reply = self.extract_reply_text(response.content)
+        else:
+            reply = self.rng.choice(self.sample_messages)
+        if reply:
+            self.messages.append(reply[: config.ASK_AI_REPLY_MAX_CHARS])
+
+    @classmethod
+    def extract_reply_text(cls, content: bytes) -> str:
+        """
+        Get the reply text of an Ask-AI response body.
+
+        SSE streams are joined from their data events; JSON bodies use the first
+        text field found in `data`, falling back to the serialized `data`.
+        """
+        if not content:
+            return ""
+        text = content.decode("utf-8", errors="replace")
+        if text.lstrip().startswith("data:"):
+            events = (line[5:].strip() for line in text.splitlines() if line.startswith("data:"))
+            return "".join(event for event in events if event and event != "[DONE]")
+
+        try:
+            body = json.loads(text)
+        except ValueError:
+            return text
+        data = body.get("data", body) if isinstance(body, dict) else body
+        if isinstance(data, str):
+            return data
+        if isinstance(data, dict):
+            for key in cls.REPLY_TEXT_KEYS:
+                if isinstance(data.get(key), str):
+                    return data[key]
+        return json.dumps(data)
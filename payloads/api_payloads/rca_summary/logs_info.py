@@ -1,5 +1,3 @@
-import random
-
 from payloads.api_payloads.base_api import BaseAPI
 from payloads.json_payload import json_payload
 
@@ -10,12 +8,14 @@ class LogsInfoAPI(BaseAPI):
         COMBO_ID_ONLY = "combo_id_only"
         BUNDLE_ID_ONLY = "bundle_id_only"
 
-    def __init__(self):
-        super().__init__()
+    TASK_NAME = "logs-info"
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
         # do not use '/' at the beginning of the endpoint
         self.endpoint = "api/v1/insights/logs/info"
-        self.bundle_id = random.choice(json_payload.get_valid_bundle_ids())
-        self.combo_id = random.choice(json_payload.get_valid_combo_ids())
+        self.bundle_id = json_payload.sample_bundle_id(self.rng)
+        self.combo_id = json_payload.sample_combo_id(self.rng)
 
     def get_api_method(self):
         return "GET"
@@ -27,7 +27,7 @@ class LogsInfoAPI(BaseAPI):
                 LogsInfoAPI.PayloadTypes.COMBO_ID_ONLY,
                 LogsInfoAPI.PayloadTypes.BUNDLE_ID_ONLY,
             ]
-            payload_type = random.choice(payload_types)
+            payload_type = self.rng.choice(payload_types)
         return self.get_payload(payload_type)
 
     def get_payload(self, payload_type: str):
@@ -0,0 +1,46 @@
+from config import config
+from payloads.api_payloads.reports.reports_api import ReportsAPI
+
+
+class ListCombosAPI(ReportsAPI):
+    class PayloadTypes:
+        """Payload type constants for ListCombosAPI"""
+        DEFAULT = "default"
+        DEEP_PAGE = "deep_page"
+        SFDC_CASE_FILTER = "sfdc_case_filter"
+        SORTED = "sorted"
+
+    TASK_NAME = "list-combos"
+
+    SORT_FIELDS = config.LIST_COMBOS_SORT_VALUES
+    PAYLOAD_TYPE_WEIGHTS = config.LIST_COMBOS_PAYLOAD_TYPE_WEIGHTS
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        # do not use '/' at the beginning of the endpoint
+        self.endpoint = config.LIST_COMBOS_ENDPOINT
+
+    def get_payload(self, payload_type: str):
+        match payload_type:
+            case ListCombosAPI.PayloadTypes.DEFAULT:
+                return {
+                    "page_size": config.DEFAULT_PAGE_SIZE,
+                    "page_no": 1
+                }
+            case ListCombosAPI.PayloadTypes.DEEP_PAGE:
+                return {
+                    "page_size": self.get_page_size_for_payload(),
+                    "page_no": self.get_deep_page_no_for_payload()
+                }
+            case ListCombosAPI.PayloadTypes.SFDC_CASE_FILTER:
+                return {
+                    "page_size": config.DEFAULT_PAGE_SIZE,
+                    "page_no": 1,
+                    **self.get_sfdc_case_filter_for_payload()
+                }
+            case ListCombosAPI.PayloadTypes.SORTED:
+                return {
+                    "page_size": self.get_page_size_for_payload(),
+                    "page_no": 1,
+                    **self.get_sort_for_payload()
+                }
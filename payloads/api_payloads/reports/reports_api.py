@@ -0,0 +1,113 @@
+from config import config
+from payloads.api_payloads.base_api import BaseAPI
+from payloads.json_payload import json_payload
+
+
+class ReportsAPI(BaseAPI):
+    class PayloadTypes:
+        """Payload type constants for ReportsAPI"""
+        DEFAULT = "default"
+        DEEP_PAGE = "deep_page"
+        CASE_OWNER_FILTER = "case_owner_filter"
+        SFDC_CASE_FILTER = "sfdc_case_filter"
+        SORTED = "sorted"
+        COMBINED = "combined"
+
+    TASK_NAME = "reports"
+
+    PAGE_SIZES = [10, 20, 50, 100]
+    SORT_FIELDS = config.REPORTS_SORT_VALUES
+    SORT_ORDERS = ["asc", "desc"]
+    MAX_FILTER_VALUES = 3
+    # filter / sort field names are unconfirmed, so by default only pagination
+    # payloads are weighted (the UI opens the first, unfiltered page most of the time)
+    PAYLOAD_TYPE_WEIGHTS = config.REPORTS_PAYLOAD_TYPE_WEIGHTS
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        # do not use '/' at the beginning of the endpoint
+        self.endpoint = "api/v1/insights/reports"
+        self.case_owner_emails = json_payload.get_case_owner_emails()
+        self.sfdc_case_numbers = json_payload.get_sfdc_case_numbers()
+
+    def get_api_method(self):
+        return "POST"
+
+    def generate_payload(self, payload_type: str = None):
+        if payload_type is None:
+            # Randomly select a payload type, weighted like the UI usage
+            payload_types = list(self.PAYLOAD_TYPE_WEIGHTS)
+            payload_type = self.rng.choices(payload_types, weights=list(self.PAYLOAD_TYPE_WEIGHTS.values()))[0]
+        payload = self.get_payload(payload_type)
+        if payload is None:
+            raise ValueError(f"Invalid {self.TASK_NAME} payload type: {payload_type}")
+        return payload
+
+    def get_page_size_for_payload(self):
+        return self.rng.choice([page_size for page_size in self.PAGE_SIZES if page_size <= config.MAX_PAGE_SIZE])
+
+    def get_deep_page_no_for_payload(self):
+        return self.rng.randint(2, max(config.MAX_PAGE_NUMBER, 2))
+
+    def get_sort_for_payload(self):
+        return {
+            config.REPORTS_SORT_BY_FIELD: self.rng.choice(self.SORT_FIELDS),
+            config.REPORTS_SORT_ORDER_FIELD: self.rng.choice(self.SORT_ORDERS),
+        }
+
+    def sample_filter_values(self, values):
+        if not values:
+            return []
+        return self.rng.sample(values, min(self.rng.randint(1, self.MAX_FILTER_VALUES), len(values)))
+
+    def get_case_owner_filter_for_payload(self):
+        return {
+            config.REPORTS_FILTERS_FIELD: {
+                config.REPORTS_CASE_OWNER_FILTER_FIELD: self.sample_filter_values(self.case_owner_emails)
+            }
+        }
+
+    def get_sfdc_case_filter_for_payload(self):
+        return {
+            config.REPORTS_FILTERS_FIELD: {
+                config.REPORTS_SFDC_CASE_FILTER_FIELD: self.sample_filter_values(self.sfdc_case_numbers)
+            }
+        }
+
+    def get_payload(self, payload_type: str):
+        match payload_type:
+            case ReportsAPI.PayloadTypes.DEFAULT:
+                return {
+                    "page_size": config.DEFAULT_PAGE_SIZE,
+                    "page_no": 1
+                }
+            case ReportsAPI.PayloadTypes.DEEP_PAGE:
+                return {
+                    "page_size": self.get_page_size_for_payload(),
+                    "page_no": self.get_deep_page_no_for_payload()
+                }
+            case ReportsAPI.PayloadTypes.CASE_OWNER_FILTER:
+                return {
+                    "page_size": config.DEFAULT_PAGE_SIZE,
+                    "page_no": 1,
+                    **self.get_case_owner_filter_for_payload()
+                }
+            case ReportsAPI.PayloadTypes.SFDC_CASE_FILTER:
+                return {
+                    "page_size": config.DEFAULT_PAGE_SIZE,
+                    "page_no": 1,
+                    **self.get_sfdc_case_filter_for_payload()
+                }
+            case ReportsAPI.PayloadTypes.SORTED:
+                return {
+                    "page_size": self.get_page_size_for_payload(),
+                    "page_no": 1,
+                    **self.get_sort_for_payload()
+                }
+            case ReportsAPI.PayloadTypes.COMBINED:
+                return {
+                    "page_size": self.get_page_size_for_payload(),
+                    "page_no": self.get_deep_page_no_for_payload(),
+                    **self.get_sort_for_payload(),
+                    **self.get_case_owner_filter_for_payload()
+                }
@@ -0,0 +1,90 @@
+"""
+API Registry for Panacea Locust Load Testing
+
+This module discovers the `BaseAPI` subclasses under `payloads/api_payloads`
+and maps them to their task names (`Config.TASK_WEIGHTS` keys), so adding an
+endpoint takes a single new payload file with a `TASK_NAME`.
+"""
+
+import importlib
+import inspect
+from pathlib import Path
+from typing import Dict, List, Type
+
+from payloads.api_payloads.base_api import BaseAPI
+
+API_PAYLOADS_DIR = Path(__file__).parent / "api_payloads"
+API_PAYLOADS_PACKAGE = "payloads.api_payloads"
+
+
+class APIRegistry:
+    """
+    Task name -> API class registry, filled by importing every module under
+    the API payloads directory and collecting the concrete `BaseAPI`
+    subclasses that declare a `TASK_NAME`.
+
+    Import errors propagate: a broken payload module must stop the run
+    instead of silently dropping its endpoint from the load mix.
+    """
+
+    def __init__(self):
+        self.api_classes: Dict[str, Type[BaseAPI]] = {}
+
+    def discover(self, directory: Path = API_PAYLOADS_DIR, package: str = API_PAYLOADS_PACKAGE):
+        for path in sorted(directory.rglob("*.py")):
+            if path.name.startswith("_"):
+                continue
+            relative_parts = path.relative_to(directory).with_suffix("").parts
+            module = importlib.import_module(".".join((package, *relative_parts)))
+            for _, api_class in inspect.getmembers(module, inspect.isclass):
+                if self._is_task_api(api_class):
+                    self.register(api_class)
+        return self
+
+    @staticmethod
+    def _is_task_api(api_class) -> bool:
+        return (
+            issubclass(api_class, BaseAPI)
+            and not inspect.isabstract(api_class)
+            and api_class.__dict__.get("TASK_NAME") is not None
+        )
+
+    def register(self, api_class: Type[BaseAPI]):
+        task_name = api_class.TASK_NAME
+        registered = self.api_classes.get(task_name)
+        if registered is not None and registered is not api_class:
+            raise ValueError(
+                f"Task {task_name} is declared by both {registered.__name__} and {api_class.__name__}"
+            )
+        self.api_classes[task_name] = api_class
+
+    def __contains__(self, task_name: str) -> bool:
+        return task_name in self.api_classes
+
+    def get_api_class(self, task_name: str) -> Type[BaseAPI]:
+        return self.api_classes[task_name]
+
+    def create(self, task_name: str, rng=None) -> BaseAPI:
+        return self.api_classes[task_name](rng=rng)
+
+    def get_task_weights(self, task_weights: Dict[str, float]) -> Dict[str, float]:
+        """
+        Get the weights of the tasks with a positive weight.
+
+        Raises:
+            ValueError: If a task with a positive weight has no API class
+        """
+        missing: List[str] = [
+            task_name for task_name, weight in task_weights.items() if weight > 0 and task_name not in self
+        ]
+        if missing:
+            raise ValueError(f"No API class registered for tasks {missing} with a positive weight")
+        return {
+            task_name: weight
+            for task_name, weight in task_weights.items()
+            if weight > 0
+        }
+
+
+# Global API registry instance
+api_registry = APIRegistry().discover()
@@ -0,0 +1,131 @@
+"""
+Behavior Model for Panacea Locust Load Testing
+
+This module samples think times and the next task of a user from the
+behavior model learned from the request log (database.behavior_model):
+think times and gaps between journeys by inverse transform sampling of the
+empirical quantiles, tasks by walking the task transition matrix from the
+journey start distribution until the journey ends.
+"""
+
+import bisect
+import itertools
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import config
+from payloads.api_registry import api_registry
+from payloads.json_payload import json_payload
+
+
+class BehaviorModel:
+    """
+    Empirical think-time distribution plus a first-order Markov chain over
+    tasks with a journey end state.
+
+    After every task the journey ends with the task's end probability; the
+    next task then comes from the start distribution, after a gap between
+    journeys instead of a think time. Only tasks in `tasks` (the tasks the
+    user can run) are kept; transition rows are renormalized over them and
+    the end state, so a task without (kept) transitions always ends the
+    journey.
+    """
+
+    def __init__(self, model: Dict[str, Any], tasks: List[str]):
+        """
+        Args:
+            model: Behavior model from the dataset
+            tasks: Task names the user can run
+        """
+        if "end_probabilities" not in model:
+            raise ValueError(
+                "The behavior model has no journey end probabilities, rebuild it with python -m database.behavior_model"
+            )
+        self.think_time_quantiles = [value / 1000 for value in model["think_time"]["quantiles_ms"]]
+        # without learned gaps between journeys, a journey gap is at least the journey split threshold
+        self.journey_gap_quantiles = [value / 1000 for value in model["journey_gap"]["quantiles_ms"]] or [
+            model["max_gap_seconds"]
+        ]
+        self.start_distribution = self._build_distribution(model["start_probabilities"], tasks)
+        if self.start_distribution is None:
+            raise ValueError("The behavior model has no journey start for any registered task")
+        self.transitions = {
+            source: distribution
+            for source, targets in model["transition_probabilities"].items()
+            if source in tasks and (distribution := self._build_distribution(targets, tasks)) is not None
+        }
+        self.end_probabilities = {
+            source: self._get_end_probability(model["transition_probabilities"].get(source, {}), end, tasks)
+            for source, end in model["end_probabilities"].items()
+            if source in tasks
+        }
+
+    @staticmethod
+    def _build_distribution(probabilities: Dict[str, float], tasks: List[str]) -> Optional[Tuple[List[str], List[float]]]:
+        """Get (task names, cumulative weights) of the tasks in `tasks`, or None when none is left."""
+        names = [name for name, probability in probabilities.items() if name in tasks and probability > 0]
+        if not names:
+            return None
+        return names, list(itertools.accumulate(probabilities[name] for name in names))
+
+    @staticmethod
+    def _get_end_probability(targets: Dict[str, float], end_probability: float, tasks: List[str]) -> float:
+        """End probability renormalized over the end state and the transitions to kept tasks."""
+        kept = sum(probability for name, probability in targets.items() if name in tasks)
+        return end_probability / (end_probability + kept) if end_probability + kept > 0 else 1.0
+
+    @staticmethod
+    def _sample_quantiles(quantiles: List[float], rng: random.Random) -> float:
+        if not quantiles:
+            return 0.0
+        if len(quantiles) == 1:
+            return quantiles[0]
+        # linear interpolation between the quantile points
+        position = rng.random() * (len(quantiles) - 1)
+        index = int(position)
+        lower, upper = quantiles[index], quantiles[min(index + 1, len(quantiles) - 1)]
+        return lower + (upper - lower) * (position - index)
+
+    @staticmethod
+    def _sample(distribution: Tuple[List[str], List[float]], rng: random.Random) -> str:
+        names, cumulative_weights = distribution
+        return names[bisect.bisect_right(cumulative_weights, rng.random() * cumulative_weights[-1])]
+
+    def sample_think_time(self, rng: random.Random = random) -> float:
+        """Sample a think time in seconds (0 without learned think times)."""
+        return self._sample_quantiles(self.think_time_quantiles, rng)
+
+    def sample_journey_gap(self, rng: random.Random = random) -> float:
+        """Sample the gap in seconds between the end of a journey and the start of the next one."""
+        return self._sample_quantiles(self.journey_gap_quantiles, rng)
+
+    def sample_journey_end(self, task: str, rng: random.Random = random) -> bool:
+        """Sample whether the journey ends after `task`."""
+        if task not in self.transitions:
+            return True
+        return rng.random() < self.end_probabilities.get(task, 0.0)
+
+    def starts_journey(self, current_task: Optional[str]) -> bool:
+        """Whether the task following `current_task` starts a new journey."""
+        return current_task not in self.transitions
+
+    def sample_next_task(self, current_task: Optional[str], rng: random.Random = random) -> str:
+        """Sample the task following `current_task` in its journey (None = journey start)."""
+        distribution = self.transitions.get(current_task, self.start_distribution)
+        return self._sample(distribution, rng)
+
+
+def load_behavior_model(tasks: List[str]) -> Optional[BehaviorModel]:
+    """Load the dataset's behavior model when `BEHAVIOR_MODEL` is on."""
+    if not config.BEHAVIOR_MODEL:
+        return None
+    model = json_payload.get_behavior_model()
+    if model is None:
+        raise ValueError(
+            "BEHAVIOR_MODEL is on but the dataset has no behavior_model, build it with python -m database.behavior_model"
+        )
+    return BehaviorModel(model, tasks)
+
+
+# Global behavior model instance (None unless BEHAVIOR_MODEL is on), over the tasks with a positive weight
+behavior_model = load_behavior_model(list(api_registry.get_task_weights(config.TASK_WEIGHTS)))
@@ -1,11 +1,71 @@
 import json
+import random
 
-from config import payload_config
+from config import config, payload_config
+from payloads.key_sampler import AliasSampler, build_key_weights
 
 
 class JsonPayload:
     def __init__(self, session_id: str):
         self.payload_data = json.load(open(payload_config.PAYLOAD_JSON_FILE_PATH))
+        # alias tables are built once at load, so every draw is O(1)
+        self.bundle_id_sampler = self._build_sampler(self.payload_data["bundle_ids"], config.BUNDLE_ID_DISTRIBUTION)
+        self.log_viewer_bundle_id_sampler = self._build_sampler(
+            list(self.payload_data["bundle_data"].keys()), config.BUNDLE_ID_DISTRIBUTION
+        )
+        self.bundle_tier_samplers, self.bundle_tier_sampler = self._build_bundle_tier_samplers(
+            self.payload_data["bundle_data"]
+        )
+        self.combo_id_sampler = self._build_sampler(self.payload_data["combo_ids"], config.COMBO_ID_DISTRIBUTION)
+        self.session_id_sampler = self._build_sampler(self.payload_data["session_ids"], config.SESSION_ID_DISTRIBUTION)
+
+    @staticmethod
+    def _build_sampler(keys, distribution: str):
+        if not keys:
+            return None
+        weights = build_key_weights(
+            len(keys),
+            distribution,
+            zipf_exponent=config.ZIPF_EXPONENT,
+            hot_set_fraction=config.HOT_SET_FRACTION,
+            hot_set_traffic_share=config.HOT_SET_TRAFFIC_SHARE,
+        )
+        return AliasSampler(keys, weights, distribution)
+
+    @staticmethod
+    def get_bundle_size_tier(row_count) -> str:
+        """Get the size tier of a bundle from its row count ("unknown" without a row count)."""
+        tier = config.UNKNOWN_BUNDLE_TIER
+        if row_count is None:
+            return tier
+        for tier_name, lower_bound in config.BUNDLE_SIZE_TIERS.items():
+            if row_count >= lower_bound:
+                tier = tier_name
+        return tier
+
+    def _build_bundle_tier_samplers(self, bundle_data):
+        """
+        Build one bundle sampler per size tier and a tier sampler following
+        BUNDLE_TIER_WEIGHTS. Without row counts in the dataset, or without
+        weighted tiers holding bundles, log viewer bundles are sampled untiered.
+        """
+        tier_bundle_ids = {}
+        for bundle_id, data in bundle_data.items():
+            tier = self.get_bundle_size_tier(data.get("row_count"))
+            tier_bundle_ids.setdefault(tier, []).append(bundle_id)
+
+        tiers = [
+            tier
+            for tier in config.BUNDLE_SIZE_TIERS
+            if tier_bundle_ids.get(tier) and config.BUNDLE_TIER_WEIGHTS.get(tier, 0) > 0
+        ]
+        if not tiers:
+            return {}, None
+        tier_samplers = {
+            tier: self._build_sampler(tier_bundle_ids[tier], config.BUNDLE_ID_DISTRIBUTION) for tier in tiers
+        }
+        tier_sampler = AliasSampler(tiers, [config.BUNDLE_TIER_WEIGHTS[tier] for tier in tiers], "bundle_tier_weights")
+        return tier_samplers, tier_sampler
 
     def get_valid_bundle_ids(self):
         return self.payload_data["bundle_ids"]
@@ -34,11 +94,69 @@ class JsonPayload:
     def get_messages(self):
         return self.payload_data["messages"]
 
+    def get_behavior_model(self):
+        return self.payload_data.get("behavior_model")
+
     def get_bundle_ids_for_log_viewer_apis(self):
         return list(self.payload_data["bundle_data"].keys())
 
     def get_bundle_data(self, bundle_id: int):
         return self.payload_data["bundle_data"][bundle_id]
 
+    def sample_bundle_id(self, rng: random.Random = random):
+        return self.bundle_id_sampler.sample(rng)
+
+    def sample_bundle_ids(self, n: int, rng: random.Random = random):
+        return self.bundle_id_sampler.sample_distinct(n, rng)
+
+    def get_bundle_tier(self, bundle_id) -> str:
+        return self.get_bundle_size_tier(self.payload_data["bundle_data"][bundle_id].get("row_count"))
+
+    def sample_bundle_id_for_log_viewer_apis(self, rng: random.Random = random):
+        if self.bundle_tier_sampler is None:
+            return self.log_viewer_bundle_id_sampler.sample(rng)
+        tier = self.bundle_tier_sampler.sample(rng)
+        return self.bundle_tier_samplers[tier].sample(rng)
+
+    def sample_combo_id(self, rng: random.Random = random):
+        return self.combo_id_sampler.sample(rng)
+
+    def sample_session_id(self, rng: random.Random = random):
+        return self.session_id_sampler.sample(rng)
+
+    def _get_samplers(self):
+        return {
+            "bundle_ids": self.bundle_id_sampler,
+            "log_viewer_bundle_ids": self.log_viewer_bundle_id_sampler,
+            "combo_ids": self.combo_id_sampler,
+            "session_ids": self.session_id_sampler,
+            "bundle_tiers": self.bundle_tier_sampler,
+            **{
+                f"log_viewer_bundle_ids_{tier}": sampler
+                for tier, sampler in self.bundle_tier_samplers.items()
+            },
+        }
+
+    def get_key_frequency_histogram(self):
+        """Get the realized key frequencies per key type."""
+        return {
+            key_type: sampler.get_frequency_histogram()
+            for key_type, sampler in self._get_samplers().items()
+            if sampler is not None
+        }
+
+    def export_key_counts(self):
+        return {
+            key_type: sampler.export_counts()
+            for key_type, sampler in self._get_samplers().items()
+            if sampler is not None
+        }
+
+    def import_key_counts(self, key_counts):
+        samplers = self._get_samplers()
+        for key_type, counts in key_counts.items():
+            if samplers.get(key_type) is not None:
+                samplers[key_type].import_counts(counts)
+
 
 json_payload = JsonPayload(session_id="")
@@ -0,0 +1,156 @@
+"""
+Key Popularity Sampling for Panacea Locust Load Testing
+
+This module provides O(1) weighted sampling of dataset keys (bundle ids,
+combo ids, session ids) using Vose's alias method, so load can concentrate
+on a few hot keys the way real traffic does.
+"""
+
+import random
+from collections import Counter
+from typing import Any, Dict, List, Sequence
+
+
+class KeyDistributions:
+    """Key popularity distribution names"""
+    UNIFORM = "uniform"
+    ZIPF = "zipf"
+    HOT_SET = "hot_set"
+
+
+def build_key_weights(
+    n_keys: int,
+    distribution: str,
+    zipf_exponent: float = 1.0,
+    hot_set_fraction: float = 0.2,
+    hot_set_traffic_share: float = 0.8,
+) -> List[float]:
+    """
+    Build popularity weights for `n_keys` keys ranked by dataset order.
+
+    Args:
+        n_keys: Number of keys
+        distribution: One of KeyDistributions
+        zipf_exponent: Exponent s of the Zipf distribution (weight of rank r is 1 / r^s)
+        hot_set_fraction: Fraction of keys in the hot set
+        hot_set_traffic_share: Share of the traffic going to the hot set
+
+    Returns:
+        List of (unnormalized) weights, one per key
+    """
+    match distribution:
+        case KeyDistributions.UNIFORM:
+            return [1.0] * n_keys
+        case KeyDistributions.ZIPF:
+            return [1.0 / (rank**zipf_exponent) for rank in range(1, n_keys + 1)]
+        case KeyDistributions.HOT_SET:
+            n_hot_keys = min(max(1, round(n_keys * hot_set_fraction)), n_keys)
+            if n_hot_keys == n_keys:
+                return [1.0] * n_keys
+            hot_weight = hot_set_traffic_share / n_hot_keys
+            cold_weight = (1.0 - hot_set_traffic_share) / (n_keys - n_hot_keys)
+            return [hot_weight] * n_hot_keys + [cold_weight] * (n_keys - n_hot_keys)
+        case _:
+            raise ValueError(f"Invalid key distribution: {distribution}")
+
+
+class AliasSampler:
+    """
+    Weighted sampler over a fixed key list using Vose's alias method.
+
+    The alias table is built once in O(n); every draw afterwards costs one
+    random number and two list lookups. Drawn keys are counted so the
+    realized key frequencies can be reported.
+    """
+
+    def __init__(self, keys: Sequence[Any], weights: Sequence[float], distribution: str = None):
+        if not keys:
+            raise ValueError("AliasSampler needs at least one key")
+        self.keys = list(keys)
+        self.distribution = distribution
+        self.counts = Counter()
+        self._probabilities, self._aliases = self._build_alias_table(weights)
+
+    @staticmethod
+    def _build_alias_table(weights: Sequence[float]):
+        n_keys = len(weights)
+        total = float(sum(weights))
+        scaled = [weight * n_keys / total for weight in weights]
+        probabilities = [1.0] * n_keys
+        aliases = list(range(n_keys))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # leftovers are 1.0 up to floating point error
+        return probabilities, aliases
+
+    def _draw(self, rng: random.Random) -> Any:
+        u = rng.random() * len(self.keys)
+        index = int(u)
+        if u - index >= self._probabilities[index]:
+            index = self._aliases[index]
+        return self.keys[index]
+
+    def sample(self, rng: random.Random = random) -> Any:
+        """Draw a single key."""
+        key = self._draw(rng)
+        self.counts[key] += 1
+        return key
+
+    def sample_distinct(self, n: int, rng: random.Random = random) -> List[Any]:
+        """Draw up to `n` distinct keys, following the popularity distribution."""
+        n = min(n, len(self.keys))
+        selected = []
+        seen = set()
+        attempts = 0
+        while len(selected) < n and attempts < n * 20:
+            key = self._draw(rng)
+            attempts += 1
+            if key not in seen:
+                seen.add(key)
+                selected.append(key)
+        if len(selected) < n:
+            # very skewed distributions, top up uniformly from the remaining keys
+            remaining = [key for key in self.keys if key not in seen]
+            selected.extend(rng.sample(remaining, n - len(selected)))
+        # count only the keys actually returned (not rejected duplicates)
+        self.counts.update(selected)
+        return selected
+
+    def get_frequency_histogram(self, top_n: int = 20) -> Dict[str, Any]:
+        """Get the realized key frequencies of all draws so far."""
+        total = sum(self.counts.values())
+        top_keys = self.counts.most_common(top_n)
+        top_decile = self.counts.most_common(max(1, len(self.keys) // 10))
+        return {
+            "distribution": self.distribution,
+            "total_draws": total,
+            "keys": len(self.keys),
+            "unique_keys_drawn": len(self.counts),
+            "top_10_percent_keys_share": (
+                round(sum(count for _, count in top_decile) / total, 4) if total else None
+            ),
+            "top_keys": [
+                {"key": key, "count": count, "share": round(count / total, 4)}
+                for key, count in top_keys
+            ],
+        }
+
+    def export_counts(self) -> List[List[Any]]:
+        """Serialize and reset the draw counts (for worker -> master reports)."""
+        exported = [[key, count] for key, count in self.counts.items()]
+        self.counts = Counter()
+        return exported
+
+    def import_counts(self, counts: List[List[Any]]):
+        for key, count in counts:
+            self.counts[key] += count
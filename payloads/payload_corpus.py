@@ -0,0 +1,209 @@
+"""
+Payload Corpus for Panacea Locust Load Testing
+
+This module compiles a fixed, seeded stream of API requests (method, endpoint,
+payload and request context) offline, and replays it during a test, so every
+run against every API build sends the same requests and payload generation
+costs nothing at run time.
+
+A corpus is two files:
+    <name>.jsonl        one compact JSON request record per line
+    <name>.jsonl.idx.npz per task: the byte offsets of its records (uint64)
+                         plus the corpus metadata
+
+The index lets every task read its own records in order straight from a
+memory-mapped corpus file, without loading the corpus into memory.
+
+Usage:
+    python -m payloads.payload_corpus corpus/requests.jsonl --size 1000000 --seed 42
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from config import config
+from payloads.api_registry import api_registry
+from payloads.rng_streams import create_rng
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx.npz"
+OFFSETS_PREFIX = "offsets__"
+
+class PayloadCorpusCompiler:
+    """
+    Compiles a request corpus from the API classes' own payload generators.
+
+    The task of every record is drawn in NumPy batches following the task
+    weights, so the corpus interleaves tasks like the live task mix; each
+    payload comes from the task's `generate_payload`, so corpus and live
+    payloads never drift apart. The NumPy generator and the per-task payload
+    streams are seeded, so a seed always compiles the same corpus.
+    """
+
+    def __init__(self, task_weights: Dict[str, float], seed: int, batch_size: int = 10000):
+        """
+        Args:
+            task_weights: Task name -> weight (tasks without a registered API class or weight are left out)
+            seed: Random seed
+            batch_size: Records whose tasks are drawn at once
+        """
+        self.seed = seed
+        self.batch_size = batch_size
+        task_weights = api_registry.get_task_weights(task_weights)
+        self.tasks = list(task_weights)
+        weights = np.array([task_weights[task_name] for task_name in self.tasks], dtype=float)
+        self.task_probabilities = weights / weights.sum() if self.tasks else weights
+
+    def build_record(self, task_name: str) -> Dict[str, Any]:
+        api = api_registry.create(task_name, rng=self.task_rngs[task_name])
+        return {
+            "task": task_name,
+            "method": api.get_api_method(),
+            "endpoint": api.endpoint,
+            "payload": api.generate_payload(),
+            "context": api.get_request_context(),
+        }
+
+    def compile(self, path: str, size: int) -> Dict[str, Any]:
+        """
+        Compile `size` records into `path` and its index.
+
+        Returns:
+            Corpus metadata
+        """
+        if not self.tasks:
+            raise ValueError("No task with a positive weight and an API class to compile")
+        self.task_rngs = {task_name: create_rng("corpus", task_name, run_seed=self.seed) for task_name in self.tasks}
+        rng = np.random.default_rng(self.seed)
+        offsets: Dict[str, List[int]] = {task_name: [] for task_name in self.tasks}
+        started_at = time.perf_counter()
+
+        with open(path, "wb") as f:
+            position = 0
+            for batch_start in range(0, size, self.batch_size):
+                batch_tasks = rng.choice(
+                    len(self.tasks), min(self.batch_size, size - batch_start), p=self.task_probabilities
+                )
+                lines = []
+                for task_index in batch_tasks:
+                    task_name = self.tasks[task_index]
+                    line = json.dumps(self.build_record(task_name), separators=(",", ":"), default=str).encode()
+                    offsets[task_name].append(position)
+                    position += len(line) + 1
+                    lines.append(line)
+                f.write(b"\n".join(lines) + b"\n")
+                logger.info(f"Compiled {batch_start + len(batch_tasks):,}/{size:,} payloads")
+
+        metadata = {
+            "seed": self.seed,
+            "size": size,
+            "records_per_task": {task_name: len(task_offsets) for task_name, task_offsets in offsets.items()},
+            "compiled_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "compile_seconds": round(time.perf_counter() - started_at, 2),
+        }
+        np.savez(
+            path + INDEX_SUFFIX,
+            metadata=np.array(json.dumps(metadata)),
+            **{
+                OFFSETS_PREFIX + task_name: np.array(task_offsets, dtype=np.uint64)
+                for task_name, task_offsets in offsets.items()
+            },
+        )
+        return metadata
+
+
+class PayloadCorpus:
+    """
+    Reads a compiled corpus task by task.
+
+    Every task has its own cursor. Workers split each task's records by
+    worker index (worker i of n reads records i, i + n, ...), so a fixed
+    worker count replays the same requests on every run. Cursors wrap around
+    at the end of a task's records.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with np.load(path + INDEX_SUFFIX) as index:
+            self.metadata = json.loads(str(index["metadata"]))
+            self.offsets = {
+                key[len(OFFSETS_PREFIX):]: index[key] for key in index.files if key.startswith(OFFSETS_PREFIX)
+            }
+        self.tasks = [task_name for task_name, offsets in self.offsets.items() if len(offsets)]
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.worker_index = 0
+        self.worker_count = 1
+        self._cursors: Dict[str, int] = {}
+        self._wrapped = set()
+        self.reset()
+
+    def set_partition(self, worker_index: int, worker_count: int):
+        """Read only this worker's share of the records."""
+        self.worker_index = worker_index % worker_count
+        self.worker_count = worker_count
+        self.reset()
+
+    def reset(self):
+        """Restart every task at its first record."""
+        self._cursors = {task_name: self.worker_index for task_name in self.tasks}
+        self._wrapped = set()
+
+    def read_record(self, task_name: str, position: int) -> Dict[str, Any]:
+        start = int(self.offsets[task_name][position])
+        end = self._mmap.find(b"\n", start)
+        return json.loads(self._mmap[start:end])
+
+    def next_record(self, task_name: str) -> Dict[str, Any]:
+        """Get the task's next record of this worker's share."""
+        n_records = len(self.offsets[task_name])
+        position = self._cursors[task_name]
+        if position >= n_records:
+            if task_name not in self._wrapped:
+                logger.warning(f"Payload corpus exhausted for task {task_name}, starting over")
+                self._wrapped.add(task_name)
+            position %= n_records
+        self._cursors[task_name] = position + self.worker_count
+        return self.read_record(task_name, position)
+
+    def iter_records(self, task_name: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate all records of a task (or of the whole corpus, in file order)."""
+        if task_name is not None:
+            for position in range(len(self.offsets[task_name])):
+                yield self.read_record(task_name, position)
+            return
+        self._mmap.seek(0)
+        for line in iter(self._mmap.readline, b""):
+            yield json.loads(line)
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile a Panacea payload corpus")
+    parser.add_argument("output", help="Corpus file (.jsonl); the index is written next to it")
+    parser.add_argument("--size", type=int, default=config.PAYLOAD_CORPUS_SIZE)
+    parser.add_argument("--seed", type=int, default=config.PAYLOAD_CORPUS_SEED)
+    parser.add_argument("--batch-size", type=int, default=config.PAYLOAD_CORPUS_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    compiler = PayloadCorpusCompiler(config.TASK_WEIGHTS, seed=args.seed, batch_size=args.batch_size)
+    metadata = compiler.compile(args.output, args.size)
+    print(json.dumps(metadata, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Payload Replay for Panacea Locust Load Testing
+
+This module keeps a small LRU of the payloads a user recently sent per task
+and re-sends an exact earlier payload with a target probability, so the share
+of requests the API's response caches can serve is controlled instead of
+being close to zero with freshly randomized payloads.
+"""
+
+import random
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+# request context key marking a request as a "repeat" or "fresh" payload
+REPLAY_CONTEXT_KEY = "payload_replay"
+REPEAT = "repeat"
+FRESH = "fresh"
+
+
+class PayloadReplayLRU:
+    """
+    Per task LRU of recently sent (payload, request context) pairs of one user.
+
+    A repeat picks one of the remembered payloads uniformly and marks it as
+    recently used; a fresh payload is generated by the API object and evicts
+    the least recently used one once the LRU is full. The first request of a
+    task is always fresh.
+    """
+
+    def __init__(self, size: int, rng: random.Random = random):
+        """
+        Args:
+            size: Payloads remembered per task
+            rng: Random stream deciding repeats and picking the repeated payload
+        """
+        self.size = size
+        self.rng = rng
+        self._next_id = 0
+        # task name -> entry id -> (payload, context), least recently used first
+        self.entries: Dict[str, "OrderedDict[int, Tuple[Any, Dict[str, Any]]]"] = {}
+
+    def next_payload(self, task_name: str, api, repeat_ratio: float) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Get the payload and request context of the task's next request.
+
+        Args:
+            task_name: Task the payload is for
+            api: BaseAPI instance generating fresh payloads
+            repeat_ratio: Probability (0-1) of re-sending a remembered payload
+
+        Returns:
+            Tuple of (payload, context); the context carries `REPLAY_CONTEXT_KEY`
+        """
+        entries = self.entries.setdefault(task_name, OrderedDict())
+        if entries and self.rng.random() < repeat_ratio:
+            entry_id = self.rng.choice(list(entries))
+            entries.move_to_end(entry_id)
+            payload, context = entries[entry_id]
+            return payload, {**context, REPLAY_CONTEXT_KEY: REPEAT}
+
+        payload, context = api.generate_payload(), api.get_request_context()
+        entries[self._next_id] = (payload, context)
+        self._next_id += 1
+        if len(entries) > self.size:
+            entries.popitem(last=False)
+        return payload, {**context, REPLAY_CONTEXT_KEY: FRESH}
@@ -0,0 +1,71 @@
+"""
+RNG Streams for Panacea Locust Load Testing
+
+This module derives independent random number streams from the run seed
+(`Config.RUN_SEED`): one per virtual user and stream name (endpoint), so
+payload draws are reproducible across runs and distributed workers no matter
+how the tasks of different users interleave.
+"""
+
+import hashlib
+import itertools
+import random
+from typing import Dict, Optional
+
+from config import config
+
+# per-process user counter; users of a worker are numbered in spawn order
+_user_counter = itertools.count()
+
+
+def derive_seed(run_seed: int, *keys) -> int:
+    """Derive a 64-bit seed for `keys` from the run seed (stable across processes and Python runs)."""
+    key_source = ":".join(str(key) for key in (run_seed, *keys))
+    return int.from_bytes(hashlib.sha256(key_source.encode()).digest()[:8], "big")
+
+
+def create_rng(*keys, run_seed: Optional[int] = None) -> random.Random:
+    """
+    Create the random stream of `keys`.
+
+    Without a run seed the stream is seeded from OS entropy, so unseeded runs
+    keep varying from run to run.
+    """
+    if run_seed is None:
+        run_seed = config.RUN_SEED
+    if run_seed is None:
+        return random.Random()
+    return random.Random(derive_seed(run_seed, *keys))
+
+
+def reset_user_counter():
+    """Number the users of the next run from zero again (web UI restarts)."""
+    global _user_counter
+    _user_counter = itertools.count()
+
+
+class RngStreams:
+    """
+    Random streams of one virtual user, created lazily by stream name.
+
+    A user is identified by its worker index and its spawn order on that
+    worker, so the same worker and user count reproduce the same streams.
+    """
+
+    def __init__(self, worker_index: int, user_index: int):
+        self.worker_index = worker_index
+        self.user_index = user_index
+        self._streams: Dict[str, random.Random] = {}
+
+    @classmethod
+    def for_user(cls, user) -> "RngStreams":
+        """Create the streams of a newly spawned Locust user."""
+        runner = user.environment.runner
+        return cls(getattr(runner, "worker_index", 0) if runner is not None else 0, next(_user_counter))
+
+    def get(self, name: str) -> random.Random:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = create_rng("user", self.worker_index, self.user_index, name)
+            self._streams[name] = stream
+        return stream
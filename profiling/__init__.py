@@ -0,0 +1,15 @@
+"""
+Profiling package for Panacea Locust Load Testing
+"""
+
+from .memory_profiler import MemoryProfiler, memory_profiler, setup_memory_profiler_event_handlers
+from .sampling_profiler import SamplingProfiler, sampling_profiler, setup_sampling_profiler_event_handlers
+
+__all__ = [
+    "MemoryProfiler",
+    "SamplingProfiler",
+    "memory_profiler",
+    "sampling_profiler",
+    "setup_memory_profiler_event_handlers",
+    "setup_sampling_profiler_event_handlers",
+]
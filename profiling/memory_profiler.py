@@ -0,0 +1,262 @@
+"""
+Memory Profiler for Panacea Locust Load Testing
+
+This module accounts for the memory used by the virtual users of a worker:
+it takes tracemalloc snapshots at test start, whenever spawning completes,
+periodically while the test runs and at test stop, derives the traced bytes
+per active user, lists the top allocation sites, and samples the process RSS
+(psutil) over the run. Every worker profiles itself; the master collects the
+latest profile of each worker into the test summary.
+"""
+
+import logging
+import os
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+import gevent
+from locust import events
+from locust.runners import MasterRunner
+
+from config import config
+from event_handlers import test_metrics
+
+try:
+    import psutil
+except ImportError:
+    # psutil not installed, RSS is not sampled
+    psutil = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# allocations of the profiler itself and of the import machinery are not user memory
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+class MemoryProfiler:
+    """
+    tracemalloc / RSS memory profile of this process over one test run.
+
+    Bytes per user compare the traced memory (and RSS) after the last
+    completed spawn with the test start baseline. Top allocation sites are the
+    source lines whose traced memory grew the most since the baseline
+    (`top_sites`) and since the last completed spawn (`growth_sites`, memory
+    still growing with a constant user count hints at a leak).
+
+    The sites are recomputed whenever spawning completes and every
+    `sites_interval` seconds, not only at test stop: a worker's test stop
+    comes after the master has built the summary, so the master only ever
+    sees the profile of the worker's last regular report.
+    """
+
+    def __init__(self, top_sites: int, frames: int, rss_interval: float, sites_interval: float):
+        """
+        Args:
+            top_sites: Allocation sites listed per comparison
+            frames: Frames kept per tracemalloc traceback
+            rss_interval: Seconds between RSS samples
+            sites_interval: Seconds between allocation site refreshes
+        """
+        self.top_sites = top_sites
+        self.frames = frames
+        self.rss_interval = rss_interval
+        self.sites_interval = sites_interval
+        self.process = psutil.Process() if psutil is not None else None
+        self.environment = None
+        self._sampler_greenlet = None
+        self.reset()
+        # client id -> latest profile reported by the worker
+        self.worker_profiles: Dict[str, Dict[str, Any]] = {}
+
+    def reset(self):
+        self.started_at = None
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.spawned: Optional[tracemalloc.Snapshot] = None
+        self.checkpoints: List[Dict[str, Any]] = []
+        self.rss_samples: List[Dict[str, Any]] = []
+        self.top_allocation_sites: List[Dict[str, Any]] = []
+        self.growth_allocation_sites: List[Dict[str, Any]] = []
+
+    def _get_user_count(self) -> int:
+        runner = self.environment.runner if self.environment is not None else None
+        return runner.user_count if runner is not None else 0
+
+    def _get_rss(self) -> Optional[int]:
+        return self.process.memory_info().rss if self.process is not None else None
+
+    def _take_snapshot(self, event: str) -> tracemalloc.Snapshot:
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        self.checkpoints.append(
+            {
+                "event": event,
+                "elapsed_seconds": round(time.time() - self.started_at, 1),
+                "users": self._get_user_count(),
+                "traced_bytes": sum(stat.size for stat in snapshot.statistics("filename")),
+                "rss_bytes": self._get_rss(),
+            }
+        )
+        return snapshot
+
+    def start(self, environment):
+        """Start tracing and take the baseline snapshot (test start)."""
+        self.reset()
+        self.environment = environment
+        self.started_at = time.time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        self.baseline = self._take_snapshot("test_start")
+        if self._sampler_greenlet is None:
+            self._sampler_greenlet = gevent.spawn(self._sample)
+
+    def checkpoint_spawned(self):
+        """Snapshot the memory of the spawned users (spawning complete)."""
+        if self.baseline is None:
+            return
+        self.spawned = self._take_snapshot("spawning_complete")
+        self._update_sites(self.spawned)
+
+    def refresh_sites(self):
+        """Snapshot the current memory and recompute the allocation sites."""
+        if self.baseline is None:
+            return
+        self._update_sites(self._take_snapshot("running"))
+
+    def _update_sites(self, snapshot: tracemalloc.Snapshot):
+        self.top_allocation_sites = self._get_top_sites(snapshot, self.baseline)
+        if self.spawned is not None and snapshot is not self.spawned:
+            self.growth_allocation_sites = self._get_top_sites(snapshot, self.spawned)
+
+    def stop(self):
+        """Take the final snapshot, compute the allocation sites and stop tracing (test stop)."""
+        if self.baseline is None:
+            return
+        if self._sampler_greenlet is not None:
+            self._sampler_greenlet.kill(block=False)
+            self._sampler_greenlet = None
+        self._update_sites(self._take_snapshot("test_stop"))
+        self.baseline = self.spawned = None
+        tracemalloc.stop()
+        if self.process is not None:
+            self.sample_rss()
+
+    def sample_rss(self):
+        self.rss_samples.append(
+            {
+                "elapsed_seconds": round(time.time() - self.started_at, 1),
+                "users": self._get_user_count(),
+                "rss_bytes": self._get_rss(),
+            }
+        )
+
+    def _sample(self):
+        """Sample the RSS every `rss_interval` and refresh the sites every `sites_interval` seconds."""
+        sites_refreshed_at = time.time()
+        while True:
+            if self.process is not None:
+                self.sample_rss()
+            if time.time() - sites_refreshed_at >= self.sites_interval:
+                self.refresh_sites()
+                sites_refreshed_at = time.time()
+            gevent.sleep(min(self.rss_interval, self.sites_interval))
+
+    def _get_top_sites(self, snapshot: tracemalloc.Snapshot, since: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        sites = []
+        for stat in snapshot.compare_to(since, "lineno")[: self.top_sites]:
+            frame = stat.traceback[0]
+            filename = frame.filename
+            if filename.startswith(REPO_DIR):
+                filename = os.path.relpath(filename, REPO_DIR)
+            sites.append(
+                {
+                    "site": f"{filename}:{frame.lineno}",
+                    "size_bytes": stat.size,
+                    "size_diff_bytes": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                }
+            )
+        return sites
+
+    def get_profile(self) -> Dict[str, Any]:
+        """Get this process' memory profile."""
+        start = self.checkpoints[0] if self.checkpoints else None
+        spawned = [checkpoint for checkpoint in self.checkpoints if checkpoint["event"] == "spawning_complete"]
+        bytes_per_user = {}
+        if start is not None and spawned and spawned[-1]["users"]:
+            last_spawn = spawned[-1]
+            bytes_per_user["traced"] = round((last_spawn["traced_bytes"] - start["traced_bytes"]) / last_spawn["users"])
+            if last_spawn["rss_bytes"] is not None:
+                bytes_per_user["rss"] = round((last_spawn["rss_bytes"] - start["rss_bytes"]) / last_spawn["users"])
+        return {
+            "bytes_per_user": bytes_per_user,
+            "checkpoints": self.checkpoints,
+            "top_allocation_sites": self.top_allocation_sites,
+            "growth_allocation_sites": self.growth_allocation_sites,
+            "rss_samples": self.rss_samples,
+        }
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the memory profile of every worker (or of this process when not distributed)."""
+        if self.environment is not None and isinstance(self.environment.runner, MasterRunner):
+            return {"workers": self.worker_profiles}
+        return {"workers": {"local": self.get_profile()}}
+
+
+# Global memory profiler instance
+memory_profiler = MemoryProfiler(
+    top_sites=config.MEMORY_PROFILE_TOP_SITES,
+    frames=config.MEMORY_PROFILE_FRAMES,
+    rss_interval=config.MEMORY_PROFILE_RSS_INTERVAL_SECONDS,
+    sites_interval=config.MEMORY_PROFILE_SITES_INTERVAL_SECONDS,
+)
+
+
+def on_test_start(environment, **kwargs):
+    if isinstance(environment.runner, MasterRunner):
+        memory_profiler.environment = environment
+        memory_profiler.worker_profiles = {}
+        return
+    memory_profiler.start(environment)
+
+
+def on_spawning_complete(user_count, **kwargs):
+    memory_profiler.checkpoint_spawned()
+
+
+def on_test_stop(environment, **kwargs):
+    if not isinstance(environment.runner, MasterRunner):
+        memory_profiler.stop()
+
+
+def on_report_to_master(client_id, data, **kwargs):
+    data["memory_profile"] = memory_profiler.get_profile()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    if "memory_profile" in data:
+        memory_profiler.worker_profiles[client_id] = data["memory_profile"]
+
+
+def setup_memory_profiler_event_handlers():
+    """
+    Register the memory profiler event handlers with Locust and add the
+    per-worker memory profile to the test summary.
+    """
+    events.test_start.add_listener(on_test_start)
+    events.spawning_complete.add_listener(on_spawning_complete)
+    events.test_stop.add_listener(on_test_stop)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("memory", memory_profiler.get_summary)
+
+    if psutil is None:
+        logger.warning("psutil is not installed, RSS is not sampled")
+    logger.info("🔧 Memory profiler event handlers registered successfully")
@@ -0,0 +1,220 @@
+"""
+Sampling Profiler for Panacea Locust Load Testing
+
+This module contains an in-process, signal based stack sampler for finding
+where a CPU-bound worker spends its time (payload generation, JSON, logging,
+the HTTP client, ...). A profiling window is started at test start
+(`SAMPLING_PROFILE`) or on demand from the web UI (`/profiler/start`, which
+the master forwards to all workers), and writes the sampled stacks in
+collapsed format (one `frame;frame;... count` line per stack, the input of
+flamegraph.pl and speedscope) to the results directory.
+"""
+
+import logging
+import os
+import signal
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Optional
+
+import gevent
+from locust import events
+from locust.runners import LocalRunner, MasterRunner, WorkerRunner
+
+from config import config
+from event_handlers import test_metrics
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+START_MESSAGE = "start_sampling_profiler"
+
+# SAMPLING_PROFILE window waiting for its delay, killed when the test stops first
+_scheduled_window: Optional[gevent.Greenlet] = None
+
+
+class SamplingProfiler:
+    """
+    Samples the Python stack of the running greenlet on SIGPROF.
+
+    The profiling timer (ITIMER_PROF) counts the CPU time of the process, so
+    samples are only taken while the worker is busy and idle time in the
+    gevent hub does not show up. A sample only stores the code objects of the
+    stack; frames are formatted when the profile is written.
+    """
+
+    def __init__(self, interval: float, results_dir: str):
+        """
+        Args:
+            interval: Seconds of CPU time between samples
+            results_dir: Directory the collapsed stack files are written to
+        """
+        self.interval = interval
+        self.results_dir = results_dir
+        self.stacks: Counter = Counter()
+        self.running = False
+        self.tag = None
+        self.windows = 0
+        self._previous_handler = None
+        self._stop_greenlet = None
+        self._frame_names: Dict[object, str] = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def start(self, seconds: float, tag: str) -> bool:
+        """
+        Start a profiling window.
+
+        Args:
+            seconds: Window length (wall clock)
+            tag: File name tag of the profile (run timestamp and process)
+
+        Returns:
+            False when a window is already running or signals are not supported
+        """
+        if self.running or not self.is_supported():
+            return False
+        self.stacks = Counter()
+        self.tag = tag
+        self.running = True
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self._stop_greenlet = gevent.spawn_later(seconds, self.stop)
+        logger.info(f"🔬 Sampling profiler started for {seconds}s")
+        return True
+
+    def stop(self) -> Optional[str]:
+        """Stop the running window and write its profile; returns the file path."""
+        if not self.running:
+            return None
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        self.running = False
+        if self._stop_greenlet is not None and self._stop_greenlet is not gevent.getcurrent():
+            self._stop_greenlet.kill(block=False)
+        self._stop_greenlet = None
+        self.windows += 1
+        return self.write_profile()
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        self.stacks[tuple(stack)] += 1
+
+    def _get_frame_name(self, code) -> str:
+        name = self._frame_names.get(code)
+        if name is None:
+            filename = code.co_filename
+            if filename.startswith(REPO_DIR):
+                filename = os.path.relpath(filename, REPO_DIR)
+            else:
+                # library frames by package path, e.g. site-packages/urllib3/connectionpool.py
+                filename = "/".join(filename.split(os.sep)[-2:])
+            name = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            self._frame_names[code] = name
+        return name
+
+    def get_collapsed_stacks(self) -> Dict[str, int]:
+        """Get the sampled stacks as `outermost;...;innermost` -> sample count."""
+        collapsed: Counter = Counter()
+        for stack, count in self.stacks.items():
+            collapsed[";".join(self._get_frame_name(code) for code in reversed(stack))] += count
+        return collapsed
+
+    def write_profile(self) -> str:
+        os.makedirs(self.results_dir, exist_ok=True)
+        filepath = os.path.join(self.results_dir, f"profile_{self.tag}_{self.windows}.collapsed")
+        collapsed = self.get_collapsed_stacks()
+        with open(filepath, "w") as f:
+            for stack, count in sorted(collapsed.items(), key=lambda item: -item[1]):
+                f.write(f"{stack} {count}\n")
+        logger.info(f"🔬 Sampling profile ({sum(collapsed.values())} samples) saved to: {filepath}")
+        return filepath
+
+
+# Global sampling profiler instance
+sampling_profiler = SamplingProfiler(
+    interval=config.SAMPLING_PROFILE_INTERVAL_MS / 1000,
+    results_dir=config.SAMPLING_PROFILE_DIR,
+)
+
+
+def _get_run_timestamp() -> str:
+    start_time = test_metrics.start_time or datetime.utcnow()
+    return start_time.strftime("%Y%m%d_%H%M%S")
+
+
+def _get_process_tag(runner) -> str:
+    if isinstance(runner, WorkerRunner):
+        return f"worker{runner.worker_index}"
+    return "local"
+
+
+def start_profile_window(environment, seconds: float, run_timestamp: str = None) -> bool:
+    """Start a profiling window of this process, tagged with the run timestamp and the process."""
+    tag = f"{run_timestamp or _get_run_timestamp()}_{_get_process_tag(environment.runner)}"
+    return sampling_profiler.start(seconds, tag)
+
+
+def on_start_message(environment, msg, **kwargs):
+    start_profile_window(environment, msg.data["seconds"], msg.data["run_timestamp"])
+
+
+def _register_web_ui_routes(environment):
+    from flask import jsonify, request
+
+    @environment.web_ui.app.route("/profiler/start", methods=["GET", "POST"])
+    def start_profiler():
+        seconds = float(request.args.get("seconds", config.SAMPLING_PROFILE_SECONDS))
+        runner = environment.runner
+        if isinstance(runner, MasterRunner):
+            runner.send_message(START_MESSAGE, {"seconds": seconds, "run_timestamp": _get_run_timestamp()})
+            return jsonify({"started": True, "workers": runner.worker_count, "seconds": seconds})
+        return jsonify({"started": start_profile_window(environment, seconds), "seconds": seconds})
+
+
+def on_init(environment, **kwargs):
+    if isinstance(environment.runner, WorkerRunner):
+        environment.runner.register_message(START_MESSAGE, on_start_message)
+    if environment.web_ui is not None:
+        _register_web_ui_routes(environment)
+
+
+def on_test_start(environment, **kwargs):
+    global _scheduled_window
+    if config.SAMPLING_PROFILE and isinstance(environment.runner, (LocalRunner, WorkerRunner)):
+        _scheduled_window = gevent.spawn_later(
+            config.SAMPLING_PROFILE_DELAY_SECONDS,
+            start_profile_window,
+            environment,
+            config.SAMPLING_PROFILE_SECONDS,
+        )
+
+
+def on_test_stop(environment, **kwargs):
+    global _scheduled_window
+    # a window not started yet is dropped, one still running is cut short
+    if _scheduled_window is not None:
+        _scheduled_window.kill(block=False)
+        _scheduled_window = None
+    sampling_profiler.stop()
+
+
+def setup_sampling_profiler_event_handlers():
+    """
+    Register the sampling profiler event handlers with Locust: the
+    `SAMPLING_PROFILE` window at test start and the `/profiler/start` web UI route.
+    """
+    if not SamplingProfiler.is_supported():
+        logger.warning("Signal based sampling is not supported on this platform, profiler disabled")
+        return
+    events.init.add_listener(on_init)
+    events.test_start.add_listener(on_test_start)
+    events.test_stop.add_listener(on_test_stop)
+
+    logger.info("🔧 Sampling profiler event handlers registered successfully")
@@ -0,0 +1,7 @@
+"""
+Payload replay package for Panacea Locust Load Testing
+"""
+
+from .replay_tracker import PayloadReplayTracker, payload_replay_tracker, setup_payload_replay_event_handlers
+
+__all__ = ["PayloadReplayTracker", "payload_replay_tracker", "setup_payload_replay_event_handlers"]
@@ -0,0 +1,124 @@
+"""
+Payload Replay Tracker for Panacea Locust Load Testing
+
+This module splits the latency of every endpoint into requests that re-sent
+an earlier payload (repeat) and requests with a fresh payload, and reports
+the realized repeat ratio, so the benefit of the API's response caches shows
+up in the test summary.
+"""
+
+import logging
+from typing import Any, Dict
+
+from locust import events
+
+from config import config
+from event_handlers import test_metrics
+from metrics import HTTP_METHODS, LatencyHistogram
+from payloads.payload_replay import FRESH, REPEAT, REPLAY_CONTEXT_KEY
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class PayloadReplayTracker:
+    """
+    Collects repeat / fresh latency histograms of requests sent with a `payload_replay` context.
+    """
+
+    def __init__(self):
+        # request name -> "repeat" / "fresh" -> histogram
+        self.results: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    def record(self, name: str, replay: str, response_time: float, failed: bool):
+        histograms = self.results.setdefault(name, {})
+        histograms.setdefault(replay, LatencyHistogram()).record(response_time, failed)
+
+    def reset(self):
+        self.results = {}
+
+    def export_results(self) -> Dict[str, Any]:
+        """Serialize and reset the collected results (for worker -> master reports)."""
+        exported = {
+            name: {replay: histogram.to_dict() for replay, histogram in histograms.items()}
+            for name, histograms in self.results.items()
+        }
+        self.reset()
+        return exported
+
+    def import_results(self, data: Dict[str, Any]):
+        """Merge results exported by a worker."""
+        for name, histograms in data.items():
+            merged = self.results.setdefault(name, {})
+            for replay, histogram in histograms.items():
+                merged.setdefault(replay, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+
+    @staticmethod
+    def _get_repeat_ratio(repeat: LatencyHistogram, fresh: LatencyHistogram):
+        total = repeat.num_requests + fresh.num_requests
+        return round(repeat.num_requests / total, 4) if total else None
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the realized repeat ratio and the repeat / fresh latency of every request name."""
+        by_endpoint = {}
+        total_repeat, total_fresh = LatencyHistogram(), LatencyHistogram()
+        for name, histograms in sorted(self.results.items()):
+            repeat = histograms.get(REPEAT, LatencyHistogram())
+            fresh = histograms.get(FRESH, LatencyHistogram())
+            total_repeat.merge(repeat)
+            total_fresh.merge(fresh)
+            repeat_summary, fresh_summary = repeat.get_summary(), fresh.get_summary()
+            by_endpoint[name] = {
+                "repeat_ratio": self._get_repeat_ratio(repeat, fresh),
+                REPEAT: repeat_summary,
+                FRESH: fresh_summary,
+                # latency the caches save on a repeated payload (fresh minus repeat)
+                "cache_benefit_ms": {
+                    statistic: round(fresh_summary[statistic] - repeat_summary[statistic], 2)
+                    for statistic in ("avg_ms", "p50_ms", "p95_ms", "p99_ms")
+                    if fresh_summary[statistic] is not None and repeat_summary[statistic] is not None
+                },
+            }
+        return {
+            "target_repeat_ratio": config.PAYLOAD_REPEAT_RATIO,
+            "target_repeat_ratio_overrides": config.PAYLOAD_REPEAT_RATIO_OVERRIDES,
+            "lru_size": config.PAYLOAD_REPLAY_LRU_SIZE,
+            "realized_repeat_ratio": self._get_repeat_ratio(total_repeat, total_fresh),
+            "by_endpoint": by_endpoint,
+        }
+
+
+# Global payload replay tracker instance
+payload_replay_tracker = PayloadReplayTracker()
+
+
+def on_test_start(environment, **kwargs):
+    payload_replay_tracker.reset()
+
+
+def on_request(request_type, name, response_time, response_length, context=None, exception=None, **kwargs):
+    if context and REPLAY_CONTEXT_KEY in context and request_type in HTTP_METHODS:
+        payload_replay_tracker.record(name, context[REPLAY_CONTEXT_KEY], response_time, exception is not None)
+
+
+def on_report_to_master(client_id, data, **kwargs):
+    data["payload_replay_results"] = payload_replay_tracker.export_results()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    if "payload_replay_results" in data:
+        payload_replay_tracker.import_results(data["payload_replay_results"])
+
+
+def setup_payload_replay_event_handlers():
+    """
+    Register the payload replay event handlers with Locust and add the
+    realized repeat ratio and repeat / fresh latency to the test summary.
+    """
+    events.test_start.add_listener(on_test_start)
+    events.request.add_listener(on_request)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("payload_replay", payload_replay_tracker.get_summary)
+
+    logger.info("🔧 Payload replay event handlers registered successfully")
@@ -0,0 +1,15 @@
+"""
+Session churn package for Panacea Locust Load Testing
+"""
+
+from .session_churn import SessionChurn, SessionPool, session_pool
+from .session_tracker import SessionTracker, session_tracker, setup_session_event_handlers
+
+__all__ = [
+    "SessionChurn",
+    "SessionPool",
+    "SessionTracker",
+    "session_pool",
+    "session_tracker",
+    "setup_session_event_handlers",
+]
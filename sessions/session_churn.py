@@ -0,0 +1,154 @@
+"""
+Session Churn for Panacea Locust Load Testing
+
+This module rotates the X-Session-Id of a user per request, per N requests or
+per journey, drawing from a pool of dataset sessions, so the API's session
+lookup and validation also take their cold path. Every request is classified
+as sent with a cold or warm session by modelling the API's session cache as
+an LRU with a TTL.
+"""
+
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from config import config
+from payloads.json_payload import json_payload
+from payloads.rng_streams import create_rng
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# request context key holding "cold" / "warm"
+SESSION_STATE_CONTEXT_KEY = "session_state"
+COLD = "cold"
+WARM = "warm"
+
+STICKY = "sticky"
+PER_REQUEST = "per_request"
+PER_N_REQUESTS = "per_n_requests"
+PER_JOURNEY = "per_journey"
+
+
+class SessionPool:
+    """
+    Pool of the session ids users rotate through, shared by the users of a worker.
+
+    A session counts as warm while it is among the `cache_size` most recently
+    used sessions of this worker (0 = no capacity limit) and was used within
+    `warm_ttl_seconds`; otherwise the API is assumed to validate it again.
+    A pool larger than the API's session cache keeps a share of the requests
+    on cold sessions. Uses by other workers are not seen, so with several
+    workers some requests counted as cold hit a warm session.
+    """
+
+    def __init__(self, session_ids: List[str], size: int, cache_size: int, warm_ttl_seconds: float):
+        """
+        Args:
+            session_ids: Dataset session ids
+            size: Sessions in the pool (0 = all dataset sessions)
+            cache_size: Modelled API session cache capacity (0 = unlimited)
+            warm_ttl_seconds: Modelled API session cache TTL
+        """
+        session_ids = list(session_ids)
+        if size and size > len(session_ids):
+            logger.warning(f"SESSION_POOL_SIZE {size} is larger than the {len(session_ids)} dataset sessions")
+        if size:
+            # the same pool on every worker and run
+            create_rng("session-pool", run_seed=0).shuffle(session_ids)
+            session_ids = session_ids[:size]
+        self.session_ids = session_ids
+        self.cache_size = cache_size
+        self.warm_ttl_seconds = warm_ttl_seconds
+        # session id -> last use (monotonic), least recently used first
+        self._last_used: "OrderedDict[str, float]" = OrderedDict()
+
+    def sample(self, rng: random.Random = random) -> str:
+        return rng.choice(self.session_ids)
+
+    def use(self, session_id: str) -> str:
+        """Record a request with the session and get its state ("cold" / "warm")."""
+        now = time.monotonic()
+        last_used = self._last_used.pop(session_id, None)
+        self._last_used[session_id] = now
+        if self.cache_size and len(self._last_used) > self.cache_size:
+            self._last_used.popitem(last=False)
+        if last_used is None or now - last_used > self.warm_ttl_seconds:
+            return COLD
+        return WARM
+
+    def reset(self):
+        self._last_used.clear()
+
+
+class SessionChurn:
+    """
+    Session rotation of one user following `SESSION_CHURN_POLICY`.
+
+    per_journey rotates when the user starts a new journey: behavior model
+    journeys for users that report them (`start_journey`, PanaceaAPIUser with
+    `BEHAVIOR_MODEL` on), otherwise journeys ending after each request with
+    probability 1 / `SESSION_CHURN_REQUESTS`.
+    """
+
+    def __init__(self, pool: SessionPool, policy: str, requests_per_session: int, rng: random.Random = random):
+        """
+        Args:
+            pool: Session pool to draw from
+            policy: "per_request", "per_n_requests" or "per_journey"
+            requests_per_session: N of per_n_requests (mean journey length of per_journey)
+            rng: Random stream of the session draws
+        """
+        self.pool = pool
+        self.policy = policy
+        self.requests_per_session = requests_per_session
+        self.rng = rng
+        self.requests_in_session = 0
+        # whether the user reports its journeys, set by its first start_journey
+        self.model_journeys = False
+        self.journey_started = False
+
+    def start_journey(self):
+        """Mark the start of a new journey (per_journey rotates before its next request)."""
+        self.model_journeys = True
+        self.journey_started = True
+
+    def _should_rotate(self) -> bool:
+        if self.requests_in_session == 0:
+            return False
+        if self.policy == PER_REQUEST:
+            return True
+        if self.policy == PER_N_REQUESTS:
+            return self.requests_in_session >= self.requests_per_session
+        if self.model_journeys:
+            return self.journey_started
+        return self.rng.random() < 1 / self.requests_per_session
+
+    def next_session(self, session_id: str) -> Optional[str]:
+        """
+        Get the session of the next request.
+
+        Args:
+            session_id: Session of the previous request
+
+        Returns:
+            The new session id when the session rotates, else None
+        """
+        rotate = self._should_rotate()
+        self.journey_started = False
+        if rotate:
+            self.requests_in_session = 1
+            return self.pool.sample(self.rng)
+        self.requests_in_session += 1
+        return None
+
+
+# Global session pool instance
+session_pool = SessionPool(
+    json_payload.get_session_ids(),
+    config.SESSION_POOL_SIZE,
+    config.SESSION_CACHE_SIZE,
+    config.SESSION_WARM_TTL_SECONDS,
+)
@@ -0,0 +1,129 @@
+"""
+Session Tracker for Panacea Locust Load Testing
+
+This module splits the latency of every endpoint into requests sent with a
+cold and with a warm session (see sessions.session_churn), so the cost of
+session lookup and validation under load shows up in the test summary.
+"""
+
+import logging
+from typing import Any, Dict
+
+from locust import events
+
+from config import config
+from event_handlers import test_metrics
+from metrics import HTTP_METHODS, LatencyHistogram
+from sessions.session_churn import COLD, SESSION_STATE_CONTEXT_KEY, WARM, session_pool
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class SessionTracker:
+    """
+    Collects cold / warm session latency histograms of requests sent with a `session_state` context.
+    """
+
+    def __init__(self):
+        # request name -> "cold" / "warm" -> histogram
+        self.results: Dict[str, Dict[str, LatencyHistogram]] = {}
+
+    def record(self, name: str, session_state: str, response_time: float, failed: bool):
+        histograms = self.results.setdefault(name, {})
+        histograms.setdefault(session_state, LatencyHistogram()).record(response_time, failed)
+
+    def reset(self):
+        self.results = {}
+
+    def export_results(self) -> Dict[str, Any]:
+        """Serialize and reset the collected results (for worker -> master reports)."""
+        exported = {
+            name: {state: histogram.to_dict() for state, histogram in histograms.items()}
+            for name, histograms in self.results.items()
+        }
+        self.reset()
+        return exported
+
+    def import_results(self, data: Dict[str, Any]):
+        """Merge results exported by a worker."""
+        for name, histograms in data.items():
+            merged = self.results.setdefault(name, {})
+            for state, histogram in histograms.items():
+                merged.setdefault(state, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+
+    @staticmethod
+    def _get_cold_ratio(cold: LatencyHistogram, warm: LatencyHistogram):
+        total = cold.num_requests + warm.num_requests
+        return round(cold.num_requests / total, 4) if total else None
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get the cold session share and the cold / warm session latency of every request name."""
+        by_endpoint = {}
+        total_cold, total_warm = LatencyHistogram(), LatencyHistogram()
+        for name, histograms in sorted(self.results.items()):
+            cold = histograms.get(COLD, LatencyHistogram())
+            warm = histograms.get(WARM, LatencyHistogram())
+            total_cold.merge(cold)
+            total_warm.merge(warm)
+            cold_summary, warm_summary = cold.get_summary(), warm.get_summary()
+            by_endpoint[name] = {
+                "cold_ratio": self._get_cold_ratio(cold, warm),
+                COLD: cold_summary,
+                WARM: warm_summary,
+                # latency a cold session adds (cold minus warm)
+                "session_overhead_ms": {
+                    statistic: round(cold_summary[statistic] - warm_summary[statistic], 2)
+                    for statistic in ("avg_ms", "p50_ms", "p95_ms", "p99_ms")
+                    if cold_summary[statistic] is not None and warm_summary[statistic] is not None
+                },
+            }
+        return {
+            "policy": config.SESSION_CHURN_POLICY,
+            "requests_per_session": config.SESSION_CHURN_REQUESTS,
+            "pool_size": len(session_pool.session_ids),
+            "modelled_cache_size": config.SESSION_CACHE_SIZE,
+            "warm_ttl_seconds": config.SESSION_WARM_TTL_SECONDS,
+            "cold_ratio": self._get_cold_ratio(total_cold, total_warm),
+            COLD: total_cold.get_summary(),
+            WARM: total_warm.get_summary(),
+            "by_endpoint": by_endpoint,
+        }
+
+
+# Global session tracker instance
+session_tracker = SessionTracker()
+
+
+def on_test_start(environment, **kwargs):
+    session_tracker.reset()
+    # every run starts with a cold session cache model
+    session_pool.reset()
+
+
+def on_request(request_type, name, response_time, response_length, context=None, exception=None, **kwargs):
+    if context and SESSION_STATE_CONTEXT_KEY in context and request_type in HTTP_METHODS:
+        session_tracker.record(name, context[SESSION_STATE_CONTEXT_KEY], response_time, exception is not None)
+
+
+def on_report_to_master(client_id, data, **kwargs):
+    data["session_results"] = session_tracker.export_results()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    if "session_results" in data:
+        session_tracker.import_results(data["session_results"])
+
+
+def setup_session_event_handlers():
+    """
+    Register the session churn event handlers with Locust and add the cold /
+    warm session latency to the test summary.
+    """
+    events.test_start.add_listener(on_test_start)
+    events.request.add_listener(on_request)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("session_churn", session_tracker.get_summary)
+
+    logger.info("🔧 Session churn event handlers registered successfully")
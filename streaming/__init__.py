@@ -0,0 +1,8 @@
+"""
+Response streaming package for Panacea Locust Load Testing
+"""
+
+from .response_streamer import ResponseStreamer, response_streamer
+from .token_stream_reader import TokenStreamReader, token_stream_reader
+
+__all__ = ["ResponseStreamer", "TokenStreamReader", "response_streamer", "token_stream_reader"]
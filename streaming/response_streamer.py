@@ -0,0 +1,127 @@
+"""
+Response Streamer for Panacea Locust Load Testing
+
+This module reads response bodies in chunks and discards them instead of
+buffering them, and splits the response time into time-to-first-byte and
+body transfer time, so slow log viewer calls can be attributed to server
+compute (ClickHouse) or to payload size.
+"""
+
+import time
+from typing import Dict
+
+from requests.exceptions import RequestException
+
+from config import config
+from metrics import normalize_request_name
+
+
+class ResponseStreamer:
+    """
+    Stream-and-discard response reader.
+
+    Locust's HttpSession stops its timer once the headers arrive when
+    `stream=True`, so the recorded response time is the time-to-first-byte.
+    `drain` then reads the body, reports TTFB (request type "TTFB") and
+    transfer time (request type "TRANSFER", with the bytes received as
+    response length) as separate metrics, and rewrites the main request's
+    response time and length to the totals so it stays comparable with
+    buffered runs.
+    """
+
+    TTFB_REQUEST_TYPE = "TTFB"
+    TRANSFER_REQUEST_TYPE = "TRANSFER"
+
+    def __init__(
+        self,
+        enabled: bool = config.RESPONSE_STREAM_MODE,
+        endpoints=None,
+        chunk_bytes: int = config.RESPONSE_STREAM_CHUNK_BYTES,
+        head_bytes: int = config.RESPONSE_VALIDATION_PREFIX_BYTES,
+    ):
+        self.enabled = enabled
+        self.endpoints = {
+            normalize_request_name(endpoint)
+            for endpoint in (endpoints if endpoints is not None else config.RESPONSE_STREAM_ENDPOINTS)
+        }
+        self.chunk_bytes = chunk_bytes
+        self.head_bytes = head_bytes
+        # request name -> stream or not, avoids re-parsing URLs on every request
+        self._should_stream_cache: Dict[str, bool] = {}
+
+    def should_stream(self, name: str) -> bool:
+        if not self.enabled:
+            return False
+        should_stream = self._should_stream_cache.get(name)
+        if should_stream is None:
+            should_stream = not self.endpoints or normalize_request_name(name) in self.endpoints
+            self._should_stream_cache[name] = should_stream
+        return should_stream
+
+    def drain(self, response, request_event, keep_body: bool = False) -> bytes:
+        """
+        Read and discard a streamed response body, recording the timing split.
+
+        Must be called inside the response's `with` block (catch_response=True)
+        so the main request is reported after its meta data is updated.
+
+        Args:
+            response: Locust ResponseContextManager of a `stream=True` request
+            request_event: Locust request event hook used for the custom metrics
+            keep_body: Keep the chunks as `response.content` for callers that
+                read the body (otherwise it is discarded and cannot be read again)
+
+        Returns:
+            The first `head_bytes` bytes of the body (for response validation)
+        """
+        if response.error is not None:
+            # HTTP / connection error, skip the body and give the connection back to its pool
+            response.close()
+            return b""
+
+        request_meta = response.request_meta
+        ttfb_ms = request_meta["response_time"]
+        head = b""
+        chunks = []
+        bytes_received = 0
+
+        transfer_start = time.perf_counter()
+        try:
+            for chunk in response.iter_content(chunk_size=self.chunk_bytes):
+                if len(head) < self.head_bytes:
+                    head += chunk[: self.head_bytes - len(head)]
+                bytes_received += len(chunk)
+                if keep_body:
+                    chunks.append(chunk)
+        except RequestException as e:
+            response.failure(f"Response body transfer failed: {e}")
+        transfer_ms = (time.perf_counter() - transfer_start) * 1000
+        if keep_body:
+            response._content = b"".join(chunks)
+
+        request_meta["response_time"] = ttfb_ms + transfer_ms
+        request_meta["response_length"] = bytes_received
+
+        name = request_meta["name"]
+        context = request_meta["context"]
+        request_event.fire(
+            request_type=self.TTFB_REQUEST_TYPE,
+            name=name,
+            response_time=ttfb_ms,
+            response_length=0,
+            exception=None,
+            context=context,
+        )
+        request_event.fire(
+            request_type=self.TRANSFER_REQUEST_TYPE,
+            name=name,
+            response_time=transfer_ms,
+            response_length=bytes_received,
+            exception=None,
+            context=context,
+        )
+        return head
+
+
+# Global response streamer instance
+response_streamer = ResponseStreamer()
@@ -0,0 +1,236 @@
+"""
+Token Stream Reader for Panacea Locust Load Testing
+
+This module reads streamed (SSE / NDJSON) responses of the LLM backed
+endpoints (ask-ai, report_summary) and reports time-to-first-token,
+inter-chunk gaps and output throughput as custom Locust metrics. When the
+server does not stream, the whole response is timed as before.
+"""
+
+import time
+from typing import Any, Dict, List
+
+from requests.exceptions import RequestException
+
+from config import config
+from metrics import LatencyHistogram, normalize_request_name
+
+
+class TokenStreamReader:
+    """
+    Reader for token streams, one metric row per endpoint and request type:
+
+    - TTFT: request start to the first non-empty data event
+    - ITL: mean gap between consecutive data events of a response, with the
+      number of gaps as content size (one event per response, so long
+      answers do not flood the stats)
+    - OUTPUT: first to last data event, with the number of data events as
+      content size, so output throughput = avg content size / avg time
+
+    Every individual gap is also kept in a per-endpoint histogram for the
+    `llm_streaming` summary section.
+    """
+
+    TTFT_REQUEST_TYPE = "TTFT"
+    INTER_CHUNK_REQUEST_TYPE = "ITL"
+    OUTPUT_REQUEST_TYPE = "OUTPUT"
+    SSE_CONTENT_TYPE = "text/event-stream"
+    NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+    def __init__(
+        self,
+        enabled: bool = config.LLM_STREAMING,
+        endpoints=None,
+        head_bytes: int = config.RESPONSE_VALIDATION_PREFIX_BYTES,
+    ):
+        self.enabled = enabled
+        self.endpoints = {
+            normalize_request_name(endpoint)
+            for endpoint in (endpoints if endpoints is not None else config.LLM_STREAMING_ENDPOINTS)
+        }
+        self.head_bytes = head_bytes
+        # request name -> stream or not, avoids re-parsing URLs on every request
+        self._should_stream_cache: Dict[str, bool] = {}
+        # request path -> histogram of every inter-chunk gap
+        self.inter_chunk_gaps: Dict[str, LatencyHistogram] = {}
+
+    def should_stream(self, name: str) -> bool:
+        if not self.enabled:
+            return False
+        should_stream = self._should_stream_cache.get(name)
+        if should_stream is None:
+            should_stream = normalize_request_name(name) in self.endpoints
+            self._should_stream_cache[name] = should_stream
+        return should_stream
+
+    def get_request_headers(self) -> Dict[str, str]:
+        """Headers asking the server for a streamed response, JSON still accepted."""
+        return {"Accept": f"{self.SSE_CONTENT_TYPE}, {self.NDJSON_CONTENT_TYPE}, application/json"}
+
+    @staticmethod
+    def _fire(request_event, request_type: str, request_meta, response_time: float, response_length: int = 0):
+        request_event.fire(
+            request_type=request_type,
+            name=request_meta["name"],
+            response_time=response_time,
+            response_length=response_length,
+            exception=None,
+            context=request_meta["context"],
+        )
+
+    def read(self, response, request_event) -> bytes:
+        """
+        Read a `stream=True` response, recording token stream metrics.
+
+        Must be called inside the response's `with` block (catch_response=True)
+        so the main request is reported with the total response time. LLM
+        replies are small, so the streamed body is kept as `response.content`.
+
+        Args:
+            response: Locust ResponseContextManager of a `stream=True` request
+            request_event: Locust request event hook used for the custom metrics
+
+        Returns:
+            The first `head_bytes` bytes of the body (for response validation)
+        """
+        if response.error is not None:
+            # HTTP / connection error, skip the body and give the connection back to its pool
+            response.close()
+            return b""
+
+        request_meta = response.request_meta
+        # Locust stops its timer at the response headers for streamed requests
+        headers_ms = request_meta["response_time"]
+        content_type = response.headers.get("Content-Type", "")
+        is_sse = self.SSE_CONTENT_TYPE in content_type
+        read_start = time.perf_counter()
+
+        if not is_sse and self.NDJSON_CONTENT_TYPE not in content_type:
+            # server did not stream, fall back to whole-response timing
+            try:
+                content = response.content
+            except RequestException as e:
+                response.failure(f"Response body transfer failed: {e}")
+                content = b""
+            request_meta["response_time"] = headers_ms + (time.perf_counter() - read_start) * 1000
+            request_meta["response_length"] = len(content)
+            return content[: self.head_bytes]
+
+        lines = []
+        gaps = []
+        bytes_received = 0
+        chunks = 0
+        first_chunk_time = None
+        last_chunk_time = None
+        try:
+            for line in response.iter_lines():
+                lines.append(line)
+                bytes_received += len(line) + 1
+                if is_sse:
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if not data or data == b"[DONE]":
+                        continue
+                elif not line.strip():
+                    continue
+
+                now = time.perf_counter()
+                if first_chunk_time is None:
+                    first_chunk_time = now
+                    self._fire(request_event, self.TTFT_REQUEST_TYPE, request_meta, headers_ms + (now - read_start) * 1000)
+                else:
+                    gaps.append((now - last_chunk_time) * 1000)
+                last_chunk_time = now
+                chunks += 1
+        except RequestException as e:
+            response.failure(f"Response stream failed: {e}")
+
+        request_meta["response_time"] = headers_ms + (time.perf_counter() - read_start) * 1000
+        request_meta["response_length"] = bytes_received
+        response._content = b"\n".join(lines)
+        if gaps:
+            self._record_gaps(request_meta["name"], gaps)
+            self._fire(
+                request_event,
+                self.INTER_CHUNK_REQUEST_TYPE,
+                request_meta,
+                sum(gaps) / len(gaps),
+                response_length=len(gaps),
+            )
+        if chunks:
+            self._fire(
+                request_event,
+                self.OUTPUT_REQUEST_TYPE,
+                request_meta,
+                (last_chunk_time - first_chunk_time) * 1000,
+                response_length=chunks,
+            )
+        return response._content[: self.head_bytes]
+
+    def _record_gaps(self, name: str, gaps: List[float]):
+        path = normalize_request_name(name)
+        histogram = self.inter_chunk_gaps.get(path)
+        if histogram is None:
+            histogram = self.inter_chunk_gaps[path] = LatencyHistogram()
+        for gap in gaps:
+            histogram.record(gap)
+
+    def reset(self):
+        self.inter_chunk_gaps = {}
+
+    def export_results(self) -> Dict[str, Any]:
+        """Serialize and reset the inter-chunk gap histograms (for worker -> master reports)."""
+        exported = {path: histogram.to_dict() for path, histogram in self.inter_chunk_gaps.items()}
+        self.reset()
+        return exported
+
+    def import_results(self, data: Dict[str, Any]):
+        """Merge inter-chunk gap histograms exported by a worker."""
+        for path, histogram in data.items():
+            self.inter_chunk_gaps.setdefault(path, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+
+    def get_summary(self, stats) -> Dict[str, Any]:
+        """
+        Get TTFT / inter-chunk gap percentiles and output throughput per endpoint.
+
+        Args:
+            stats: Locust RequestStats (environment.stats)
+        """
+        per_request_type = {}
+        requests_per_name = {}
+        for (name, method), entry in stats.entries.items():
+            path = normalize_request_name(name)
+            if path not in self.endpoints:
+                continue
+            if method in (self.TTFT_REQUEST_TYPE, self.INTER_CHUNK_REQUEST_TYPE, self.OUTPUT_REQUEST_TYPE):
+                per_request_type.setdefault(path, {})[method] = entry
+            else:
+                requests_per_name[path] = requests_per_name.get(path, 0) + entry.num_requests
+
+        summary = {}
+        for path, entries in per_request_type.items():
+            endpoint_summary = {"requests": requests_per_name.get(path, 0)}
+            if self.TTFT_REQUEST_TYPE in entries:
+                endpoint_summary["streamed_requests"] = entries[self.TTFT_REQUEST_TYPE].num_requests
+                endpoint_summary["ttft"] = LatencyHistogram.from_stats_entry(entries[self.TTFT_REQUEST_TYPE]).get_summary()
+            if path in self.inter_chunk_gaps:
+                endpoint_summary["inter_chunk_gap"] = self.inter_chunk_gaps[path].get_summary()
+            if self.INTER_CHUNK_REQUEST_TYPE in entries:
+                endpoint_summary["mean_inter_chunk_gap_per_response"] = LatencyHistogram.from_stats_entry(
+                    entries[self.INTER_CHUNK_REQUEST_TYPE]
+                ).get_summary()
+            if self.OUTPUT_REQUEST_TYPE in entries:
+                output = entries[self.OUTPUT_REQUEST_TYPE]
+                endpoint_summary["output_chunks"] = output.total_content_length
+                endpoint_summary["output_chunks_per_second"] = (
+                    round(output.total_content_length / (output.total_response_time / 1000), 2)
+                    if output.total_response_time
+                    else None
+                )
+            summary[path] = endpoint_summary
+        return summary
+
+
+# Global token stream reader instance
+token_stream_reader = TokenStreamReader()
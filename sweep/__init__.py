@@ -0,0 +1,14 @@
+"""
+Parametric sweep package for Panacea Locust Load Testing
+"""
+
+from .sweep_engine import SweepEngine, setup_sweep_event_handlers, sweep_engine
+from .sweep_user import LogViewerSweepShape, LogViewerSweepUser
+
+__all__ = [
+    "SweepEngine",
+    "LogViewerSweepShape",
+    "LogViewerSweepUser",
+    "setup_sweep_event_handlers",
+    "sweep_engine",
+]
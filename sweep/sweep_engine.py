@@ -0,0 +1,207 @@
+"""
+Parametric Sweep Engine for Panacea Locust Load Testing
+
+This module builds a grid of log viewer payload parameters (time span, number
+of bundle ids, page size, number of components, search string on/off), walks
+through it one timed step per grid point and aggregates latency and throughput
+per grid point, endpoint and dimension.
+"""
+
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from locust import events
+
+from config import config
+from event_handlers import test_metrics
+from metrics import HTTP_METHODS, LatencyHistogram
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class SweepEngine:
+    """
+    Walks a parameter grid in fixed time steps and collects per-point stats.
+
+    The current grid point is derived from the time elapsed since test start,
+    so the master and all workers agree on it without extra messaging.
+    """
+
+    DIMENSIONS = ("time_span_hours", "bundle_count", "page_size", "component_count", "search")
+
+    def __init__(self, dimension_values: Dict[str, List[Any]], step_seconds: int, mode: str = "axis"):
+        """
+        Args:
+            dimension_values: Values to sweep per dimension; the first value of
+                each dimension is the baseline
+            step_seconds: Duration of each grid point step
+            mode: "axis" varies one dimension at a time around the baseline,
+                "grid" runs the full cartesian product
+        """
+        self.dimension_values = dimension_values
+        self.step_seconds = step_seconds
+        self.mode = mode
+        self.points = self._build_points()
+        self.start_time = None
+        # point index -> request name -> histogram
+        self.results: Dict[int, Dict[str, LatencyHistogram]] = {}
+
+    def _get_baseline_point(self) -> Dict[str, Any]:
+        return {dimension: self.dimension_values[dimension][0] for dimension in self.DIMENSIONS}
+
+    def _build_points(self) -> List[Dict[str, Any]]:
+        if self.mode == "grid":
+            return [
+                dict(zip(self.DIMENSIONS, values))
+                for values in itertools.product(*(self.dimension_values[d] for d in self.DIMENSIONS))
+            ]
+
+        baseline = self._get_baseline_point()
+        points = [baseline]
+        for dimension in self.DIMENSIONS:
+            for value in self.dimension_values[dimension][1:]:
+                points.append({**baseline, dimension: value})
+        return points
+
+    def start(self):
+        """Start the sweep clock and drop results of a previous run."""
+        self.start_time = time.time()
+        self.results = {}
+        logger.info(
+            f"Sweep started: {len(self.points)} points x {self.step_seconds}s ({self.mode} mode)"
+        )
+
+    def get_total_run_time(self) -> int:
+        return len(self.points) * self.step_seconds
+
+    def get_current_point_index(self) -> Optional[int]:
+        """Get the index of the active grid point, or None before start / after the last step."""
+        if self.start_time is None:
+            return None
+        point_index = int((time.time() - self.start_time) // self.step_seconds)
+        if point_index >= len(self.points):
+            return None
+        return point_index
+
+    def record(self, point_index: int, name: str, response_time: float, failed: bool):
+        histograms = self.results.setdefault(point_index, {})
+        histograms.setdefault(name, LatencyHistogram()).record(response_time, failed)
+
+    def export_results(self) -> Dict[str, Any]:
+        """Serialize and reset the collected results (for worker -> master reports)."""
+        exported = {
+            str(point_index): {name: histogram.to_dict() for name, histogram in histograms.items()}
+            for point_index, histograms in self.results.items()
+        }
+        self.results = {}
+        return exported
+
+    def import_results(self, data: Dict[str, Any]):
+        """Merge results exported by a worker."""
+        for point_index, histograms in data.items():
+            for name, histogram in histograms.items():
+                merged = self.results.setdefault(int(point_index), {})
+                merged.setdefault(name, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+
+    def _get_curve_point_indices(self, dimension: str, value: Any) -> List[int]:
+        """Grid points contributing to `dimension` == `value` on the dimension's curve."""
+        baseline = self._get_baseline_point()
+        indices = []
+        for point_index, point in enumerate(self.points):
+            if point[dimension] != value:
+                continue
+            if self.mode == "axis" and any(
+                point[other] != baseline[other] for other in self.DIMENSIONS if other != dimension
+            ):
+                continue
+            indices.append(point_index)
+        return indices
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Get per-point stats and per-dimension latency/throughput curves."""
+        points = []
+        for point_index, point in enumerate(self.points):
+            histograms = self.results.get(point_index, {})
+            points.append(
+                {
+                    "index": point_index,
+                    "point": point,
+                    "endpoints": {
+                        name: histogram.get_summary(self.step_seconds)
+                        for name, histogram in histograms.items()
+                    },
+                }
+            )
+
+        curves = {}
+        for dimension in self.DIMENSIONS:
+            curve = {}
+            for value in self.dimension_values[dimension]:
+                point_indices = self._get_curve_point_indices(dimension, value)
+                names = {name for i in point_indices for name in self.results.get(i, {})}
+                for name in names:
+                    merged = LatencyHistogram.merge_all(
+                        [self.results[i][name] for i in point_indices if name in self.results.get(i, {})]
+                    )
+                    curve.setdefault(name, []).append(
+                        {"value": value, **merged.get_summary(self.step_seconds * len(point_indices))}
+                    )
+            curves[dimension] = curve
+
+        return {
+            "mode": self.mode,
+            "step_seconds": self.step_seconds,
+            "points": points,
+            "curves": curves,
+        }
+
+
+# Global sweep engine instance
+sweep_engine = SweepEngine(
+    dimension_values={
+        "time_span_hours": config.SWEEP_TIME_SPAN_HOURS,
+        "bundle_count": config.SWEEP_BUNDLE_COUNTS,
+        "page_size": config.SWEEP_PAGE_SIZES,
+        "component_count": config.SWEEP_COMPONENT_COUNTS,
+        "search": config.SWEEP_SEARCH,
+    },
+    step_seconds=config.SWEEP_STEP_SECONDS,
+    mode=config.SWEEP_MODE,
+)
+
+
+def on_test_start(environment, **kwargs):
+    sweep_engine.start()
+
+
+def on_request(request_type, name, response_time, response_length, context=None, exception=None, **kwargs):
+    if context and "sweep_point_index" in context:
+        # custom metrics (e.g. TTFB) get their own curve next to the endpoint's
+        key = name if request_type in HTTP_METHODS else f"{request_type} {name}"
+        sweep_engine.record(context["sweep_point_index"], key, response_time, exception is not None)
+
+
+def on_report_to_master(client_id, data, **kwargs):
+    data["sweep_results"] = sweep_engine.export_results()
+
+
+def on_worker_report(client_id, data, **kwargs):
+    if "sweep_results" in data:
+        sweep_engine.import_results(data["sweep_results"])
+
+
+def setup_sweep_event_handlers():
+    """
+    Register the sweep event handlers with Locust and add the sweep
+    curves to the test summary.
+    """
+    events.test_start.add_listener(on_test_start)
+    events.request.add_listener(on_request)
+    events.report_to_master.add_listener(on_report_to_master)
+    events.worker_report.add_listener(on_worker_report)
+    test_metrics.register_summary_section("sweep", sweep_engine.get_summary)
+
+    logger.info("🔧 Sweep event handlers registered successfully")
@@ -0,0 +1,60 @@
+"""
+Parametric Sweep User and Load Shape for Panacea Locust Load Testing
+
+This module contains the user that drives the log viewer APIs with the
+payload parameters of the active sweep grid point, and the load shape that
+holds the user count constant until every grid point has run.
+"""
+
+import logging
+
+from locust import LoadTestShape, task
+
+from config import config
+from panacea_user import PanaceaBaseUser
+from payloads.api_payloads.log_viewer.filter_options import LogsFilterOptionsAPI
+from payloads.api_payloads.log_viewer.heatmap import LogsHeatmapAPI
+from payloads.api_payloads.log_viewer.histogram import LogsHistogramAPI
+from payloads.api_payloads.log_viewer.search import LogsSearchAPI
+from payloads.api_payloads.log_viewer.severity_count import LogsSeverityCountAPI
+from sweep.sweep_engine import sweep_engine
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class LogViewerSweepUser(PanaceaBaseUser):
+    """
+    Virtual user sending log viewer requests pinned to the active sweep grid point.
+    """
+
+    SWEEP_API_CLASSES = [
+        LogsSearchAPI,
+        LogsHistogramAPI,
+        LogsHeatmapAPI,
+        LogsSeverityCountAPI,
+        LogsFilterOptionsAPI,
+    ]
+
+    @task
+    def test_log_viewer_sweep_endpoint(self):
+        point_index = sweep_engine.get_current_point_index()
+        if point_index is None:
+            # sweep not started yet or already finished, the shape stops the test
+            return
+
+        rng = self.get_rng("sweep")
+        api = rng.choice(self.SWEEP_API_CLASSES)(rng=rng)
+        api.apply_sweep_point(sweep_engine.points[point_index])
+        self.send_api_request(api, context={"sweep_point_index": point_index})
+
+
+class LogViewerSweepShape(LoadTestShape):
+    """
+    Keeps `SWEEP_USERS` users running until every sweep grid point has had its step.
+    """
+
+    def tick(self):
+        if self.get_run_time() >= sweep_engine.get_total_run_time():
+            return None
+        return config.SWEEP_USERS, config.SWEEP_SPAWN_RATE
@@ -0,0 +1,7 @@
+"""
+Response validation package for Panacea Locust Load Testing
+"""
+
+from .response_validator import ResponseValidator, response_validator
+
+__all__ = ["ResponseValidator", "response_validator"]
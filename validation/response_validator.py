@@ -0,0 +1,91 @@
+"""
+Response Validator for Panacea Locust Load Testing
+
+This module checks a sample of Panacea API responses for application level
+errors (HTTP 200 with api_status != "success", empty bodies) without parsing
+the (possibly multi-MB) JSON body, so bad 200s are counted as failures while
+generator CPU stays low.
+"""
+
+import random
+import re
+from typing import Dict, Optional
+
+from config import config
+from metrics import normalize_request_name
+
+API_STATUS_KEY = b'"api_status"'
+API_STATUS_PATTERN = re.compile(rb'"api_status"\s*:\s*"([^"]*)"')
+EMPTY_BODIES = (b"", b"{}", b"[]", b"null")
+
+
+class ResponseValidator:
+    """
+    Sampled, byte level response validator.
+
+    `api_status` is located with a regex over the first
+    `RESPONSE_VALIDATION_PREFIX_BYTES` bytes (where the API serializes it);
+    only when it is not there the whole body is scanned with a plain byte
+    search, which is still far cheaper than json.loads.
+    """
+
+    def __init__(
+        self,
+        default_sample_rate: float = config.RESPONSE_VALIDATION_SAMPLE_RATE,
+        sample_rates: Dict[str, float] = None,
+        prefix_bytes: int = config.RESPONSE_VALIDATION_PREFIX_BYTES,
+    ):
+        self.default_sample_rate = default_sample_rate
+        self.sample_rates = {
+            normalize_request_name(name): rate
+            for name, rate in (sample_rates if sample_rates is not None else config.RESPONSE_VALIDATION_SAMPLE_RATES).items()
+        }
+        self.prefix_bytes = prefix_bytes
+        # request name -> sample rate, avoids re-parsing URLs on every request
+        self._sample_rate_cache: Dict[str, float] = {}
+
+    def get_sample_rate(self, name: str) -> float:
+        sample_rate = self._sample_rate_cache.get(name)
+        if sample_rate is None:
+            sample_rate = self.sample_rates.get(normalize_request_name(name), self.default_sample_rate)
+            self._sample_rate_cache[name] = sample_rate
+        return sample_rate
+
+    def should_validate(self, name: str) -> bool:
+        sample_rate = self.get_sample_rate(name)
+        return sample_rate > 0 and random.random() < sample_rate
+
+    def find_api_status(self, content: bytes) -> Optional[str]:
+        """Get the api_status value of a JSON body, or None if it has none."""
+        match = API_STATUS_PATTERN.search(content, 0, self.prefix_bytes)
+        if match is None:
+            # the key may start inside the prefix with its value running past it
+            position = content.find(API_STATUS_KEY)
+            if position < 0:
+                return None
+            match = API_STATUS_PATTERN.match(content, position)
+            if match is None:
+                return None
+        return match.group(1).decode("utf-8", "replace")
+
+    def validate(self, content: bytes) -> Optional[str]:
+        """
+        Validate a response body.
+
+        Args:
+            content: Raw response body
+
+        Returns:
+            Failure reason, or None if the response is valid
+        """
+        # only tiny bodies can be empty, avoid copying large ones with strip()
+        if len(content) <= 16 and content.strip() in EMPTY_BODIES:
+            return "Empty response body"
+        api_status = self.find_api_status(content)
+        if api_status is not None and api_status != "success":
+            return f"api_status={api_status}"
+        return None
+
+
+# Global response validator instance
+response_validator = ResponseValidator()